@@ -0,0 +1,105 @@
+# backend/apps/api/pagination.py
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class JobCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the jobs list, newest first.
+
+    The cursor holds the (created_at, id) of the row a page starts after, and
+    the next page is the rows strictly before it in (created_at, id) order:
+    one index range scan on (owner, created_at), with no COUNT(*), no OFFSET
+    and no duplicates or gaps when jobs share a created_at. `?limit=` is kept
+    from the old limit/offset pagination; the response has `next`/`previous`
+    cursor links but no `count`.
+
+    DRF's CursorPagination keys on the first ordering field only and breaks
+    ties with an offset; this keeps its cursor encoding and response format
+    but filters on the full key.
+    """
+    ordering = ("-created_at", "-id")
+    page_size = 50
+    page_size_query_param = "limit"
+    max_page_size = 200
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        reverse = bool(self.cursor and self.cursor.reverse)
+        position = self._parse_position(self.cursor.position) if self.cursor else None
+
+        if reverse:
+            # Previous page: the rows just after the position, fetched oldest first.
+            queryset = queryset.order_by("created_at", "id")
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            # (created_at, id) beyond the position; the plain created_at bound
+            # lets the planner turn it into an index range.
+            created_at, pk = position
+            if reverse:
+                queryset = queryset.filter(
+                    Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk),
+                    created_at__gte=created_at,
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk),
+                    created_at__lte=created_at,
+                )
+
+        # One extra row tells whether there is a page beyond this one.
+        rows = list(queryset[: self.page_size + 1])
+        more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, more
+        else:
+            self.has_next, self.has_previous = more, position is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        position = self._position(self.page[-1]) if self.page else self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        position = self._position(self.page[0]) if self.page else self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    # ------------- position <-> (created_at, id) -------------
+    @staticmethod
+    def _position(row) -> str:
+        if isinstance(row, dict):
+            created_at, pk = row["created_at"], row["id"]
+        else:
+            created_at, pk = row.created_at, row.pk
+        return f"{created_at.isoformat()}|{pk}"
+
+    def _parse_position(self, position: str | None):
+        if position is None:
+            return None
+        try:
+            created_at, _, pk = position.partition("|")
+            return datetime.fromisoformat(created_at), uuid.UUID(pk)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
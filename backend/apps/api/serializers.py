@@ -3,31 +3,79 @@ from rest_framework import serializers
 from apps.web.models import UploadJob
 
 
-class UploadJobListSerializer(serializers.ModelSerializer):
-    filename = serializers.SerializerMethodField()
+# Columns the list rows are built from; transcripts and labels are never loaded.
+LIST_COLUMNS = (
+    "id",
+    "status",
+    "progress",
+    "labels_pass",
+    "refine_status",
+    "error",
+    "created_at",
+    "src_size",
+    "wav_size",
+    "duration_sec",
+    "original_name",
+    "upload_rel",
+    "upload_path",
+    "stored_name",
+)
 
-    class Meta:
-        model = UploadJob
-        fields = [
-            "id",
-            "status",
-            "error",
-            "created_at",
-            "filename",
-            "src_size",
-            "wav_size",
-            "duration_sec",
-        ]
 
-    def get_filename(self, obj: UploadJob):
-        # best-effort filename for list rows
-        if obj.original_name:
-            return obj.original_name
-        if obj.upload_rel:
-            return obj.upload_rel.rsplit("/", 1)[-1]
-        if obj.upload_path:
-            return obj.upload_path.rsplit("/", 1)[-1]
-        return obj.stored_name or ""
+_datetime = serializers.DateTimeField()
+
+
+def job_filename(row: dict) -> str:
+    # best-effort filename for list rows
+    if row["original_name"]:
+        return row["original_name"]
+    if row["upload_rel"]:
+        return row["upload_rel"].rsplit("/", 1)[-1]
+    if row["upload_path"]:
+        return row["upload_path"].rsplit("/", 1)[-1]
+    return row["stored_name"] or ""
+
+
+def list_row(row) -> dict:
+    """
+    One jobs-list row, built straight from a `.values(*LIST_COLUMNS)` dict
+    (model instances work too). DRF's per-field serialization dominated the
+    list request once the columns themselves got cheap, so the list action
+    uses this instead of UploadJobListSerializer.
+    """
+    if not isinstance(row, dict):
+        row = {name: getattr(row, name) for name in LIST_COLUMNS}
+    return {
+        "id": str(row["id"]),
+        "status": row["status"],
+        "progress": row["progress"],
+        "labels_pass": row["labels_pass"],
+        "refine_status": row["refine_status"],
+        "error": row["error"],
+        "created_at": _datetime.to_representation(row["created_at"]),
+        "filename": job_filename(row),
+        "src_size": row["src_size"],
+        "wav_size": row["wav_size"],
+        "duration_sec": row["duration_sec"],
+    }
+
+
+class UploadJobListSerializer(serializers.Serializer):
+    """Schema of a list_row() (the list action builds rows with list_row() itself)."""
+    id = serializers.UUIDField(read_only=True)
+    status = serializers.ChoiceField(choices=UploadJob.Status.choices, read_only=True)
+    progress = serializers.FloatField(read_only=True)
+    labels_pass = serializers.ChoiceField(choices=UploadJob.LabelsPass.choices, read_only=True, allow_null=True)
+    refine_status = serializers.ChoiceField(choices=UploadJob.Status.choices, read_only=True, allow_null=True)
+    error = serializers.CharField(read_only=True, allow_null=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    filename = serializers.SerializerMethodField()
+    src_size = serializers.IntegerField(read_only=True, allow_null=True)
+    wav_size = serializers.IntegerField(read_only=True, allow_null=True)
+    duration_sec = serializers.FloatField(read_only=True, allow_null=True)
+
+    def get_filename(self, row) -> str:
+        return list_row(row)["filename"]
 
 
 class UploadJobDetailSerializer(serializers.ModelSerializer):
@@ -36,6 +84,7 @@ class UploadJobDetailSerializer(serializers.ModelSerializer):
         fields = [
             "id",
             "status",
+            "progress",
             "error",
             "created_at",
             "started_at",
@@ -47,6 +96,10 @@ class UploadJobDetailSerializer(serializers.ModelSerializer):
             "duration_sec",
             "full_text",
             "labels",
+            "label_model_version",
+            "asr_model",
+            "labels_pass",
+            "refine_status",
             "original_name",
             "stored_name",
         ]
@@ -2,7 +2,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .viewsets import UploadJobViewSet
-from .views import PingView, ResetSessionView
+from .views import PingView, ResetSessionView, job_events, job_statuses
 
 router = DefaultRouter()
 router.register(r"jobs", UploadJobViewSet, basename="uploadjob")
@@ -10,5 +10,8 @@ router.register(r"jobs", UploadJobViewSet, basename="uploadjob")
 urlpatterns = [
     path("ping/", PingView.as_view(), name="api-ping"),
     path("reset-session/", ResetSessionView.as_view(), name="api-reset-session"),
+    # Before the router, which would read "events" / "status" as job ids.
+    path("jobs/events/", job_events, name="api-job-events"),
+    path("jobs/status/", job_statuses, name="api-job-statuses"),
     path("", include(router.urls)),
 ]
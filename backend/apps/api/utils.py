@@ -1,5 +1,6 @@
 # backend/apps/api/utils.py
 from __future__ import annotations
+import json
 from pathlib import Path
 from django.conf import settings
 from apps.web.models import UploadJob
@@ -45,3 +46,36 @@ def normalize_labels_list(labels) -> list:
         else:
             out.append(item)
     return out
+
+def build_flags(labels) -> list:
+    """Labels in the `data` endpoint's form: [{label, text, start_sec, end_sec}, ...]."""
+    flags = []
+    if not isinstance(labels, list):
+        return flags
+    for item in normalize_labels_list(labels):
+        if isinstance(item, (list, tuple)) and len(item) >= 4:
+            label, text, start, end = item[0], item[1], item[2], item[3]
+            flags.append({
+                "label": label,
+                "text": text,
+                "start_sec": float(start) if start is not None else 0.0,
+                "end_sec": float(end) if end is not None else 0.0,
+            })
+        elif isinstance(item, dict):
+            flags.append({
+                "label": item.get("label") or item.get("type") or "flag",
+                "text": item.get("text") or item.get("span") or "",
+                "start_sec": float(item.get("start_sec") or item.get("start") or 0.0),
+                "end_sec": float(item.get("end_sec") or item.get("end") or 0.0),
+            })
+    return flags
+
+def build_export_blob(job) -> bytes:
+    """The `export` endpoint's JSON document for a finished job."""
+    payload = {
+        "job_id": str(job.id),
+        "filename": job.original_name or job.stored_name or "",
+        "transcript_text": job.full_text or "",
+        "flags": normalize_labels_list(job.labels or []),
+    }
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
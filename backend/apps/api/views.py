@@ -1,27 +1,30 @@
 # backend/apps/api/views.py
 from __future__ import annotations
 
-import shutil
-from pathlib import Path
+import asyncio
+import hashlib
+import json
+import uuid
+from datetime import datetime
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.http import JsonResponse
+from django.db import close_old_connections
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.http import parse_etags
+from django.views.decorators.http import require_GET
 from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
 
+from apps.web.events import COMMIT_LAG, EVENT_FIELDS, event_payload, get_broadcaster, owner_key
 from apps.web.models import UploadJob
 from .utils import principal_filter  # same helper used in the viewset
 
-
-def _safe_rm(p: Path) -> None:
-    """Best-effort remove a file/dir without raising."""
-    try:
-        if p.is_file() or p.is_symlink():
-            p.unlink(missing_ok=True)
-        elif p.is_dir():
-            shutil.rmtree(p, ignore_errors=True)
-    except Exception:
-        pass
+EVENTS_SNAPSHOT_MAX = 100
+STATUS_FIELDS = ("id", "status", "progress", "error", "labels_pass", "refine_status", "src_size")
+STATUS_MAX_IDS = 100
 
 
 class PingView(APIView):
@@ -45,27 +48,11 @@ class ResetSessionView(APIView):
         deleted_files = 0
         deleted_jobs = 0
 
-        media_root = Path(settings.MEDIA_ROOT)
-
-        # Remove artifacts per job, then delete the row
+        # Delete each row; UploadJob.delete() removes its artifacts (shared
+        # deduplicated files are kept while another job still references them)
         for job in qs:
-            # original upload
-            if job.upload_rel:
-                _safe_rm(media_root / job.upload_rel); deleted_files += 1
-            elif job.upload_path:
-                _safe_rm(Path(job.upload_path)); deleted_files += 1
-
-            # normalized audio
-            if getattr(job, "normalized_rel", ""):
-                _safe_rm(media_root / job.normalized_rel); deleted_files += 1
-            elif getattr(job, "normalized_path", ""):
-                _safe_rm(Path(job.normalized_path)); deleted_files += 1
-
-            # transcript json (conventional cache)
-            _safe_rm(media_root / "transcripts" / f"{job.id}.json"); deleted_files += 1
-
-            # delete the DB row
             job.delete()
+            deleted_files += job.deleted_files
             deleted_jobs += 1
 
         # Now flush the session (creates a new empty one)
@@ -76,3 +63,151 @@ class ResetSessionView(APIView):
             "deleted_jobs": deleted_jobs,
             "deleted_file_entries": deleted_files,
         })
+
+
+def _off_request_thread(fn):
+    """
+    sync_to_async() for the async views' short queries, on the event loop's
+    own thread pool rather than the thread-sensitive executor Django runs
+    sync views on, so streams and long-polls never wait behind a slow sync
+    view. Connections are recycled as at the end of a request.
+    """
+    def call(*args, **kwargs):
+        close_old_connections()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(call, thread_sensitive=False)
+
+
+def _sse(event: dict, name: str = "job") -> str:
+    return f"id: {event['updated_at']}\nevent: {name}\ndata: {json.dumps(event, cls=DjangoJSONEncoder)}\n\n"
+
+
+def _snapshot(owner_filter: dict, since: datetime | None) -> list[dict]:
+    """The principal's latest jobs, or only those changed since a reconnect's Last-Event-ID."""
+    qs = UploadJob.objects.filter(**owner_filter)
+    if since is not None:
+        qs = qs.filter(updated_at__gte=since - COMMIT_LAG)
+    rows = qs.order_by("-updated_at").values(*EVENT_FIELDS, "updated_at")[:EVENTS_SNAPSHOT_MAX]
+    return [{**event_payload(r), "updated_at": r["updated_at"].isoformat()} for r in reversed(rows)]
+
+
+@require_GET
+async def job_events(request):
+    """
+    Server-sent events for every job of the current principal: a `job` event
+    per status / progress change, starting with a snapshot of the latest jobs.
+
+    Needs an ASGI server (see gunicorn.conf.py). Under WSGI a stream would tie
+    up a worker for good, so it answers 501 and clients poll /api/jobs/status/.
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse("Event stream requires the ASGI server.", status=501)
+
+    owner = await _off_request_thread(principal_filter)(request)
+    try:
+        since = datetime.fromisoformat(request.headers.get("Last-Event-ID", ""))
+    except ValueError:
+        since = None
+
+    broadcaster = get_broadcaster()
+    sub = broadcaster.subscribe(owner_key(owner))
+    keepalive = float(getattr(settings, "JOB_EVENTS_KEEPALIVE_SECONDS", 15.0))
+
+    async def stream():
+        try:
+            # Subscribed before the snapshot, so nothing falls in between.
+            for event in await _off_request_thread(_snapshot)(owner, since):
+                yield _sse(event)
+            while not sub.overflowed:
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield _sse(event)
+        finally:
+            broadcaster.unsubscribe(sub)
+
+    response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # don't let a proxy buffer the stream
+    return response
+
+
+def _status_rows(owner_filter: dict, ids) -> tuple[list, str]:
+    """Status rows for `ids` plus an ETag over their ids and update times."""
+    rows = list(
+        UploadJob.objects.filter(**owner_filter, id__in=ids).order_by("id").values(*STATUS_FIELDS, "updated_at")
+    )
+    h = hashlib.sha1()
+    for row in rows:
+        h.update(f"{row.pop('updated_at').isoformat()} {row['id']};".encode())
+        row["id"] = str(row["id"])
+    return rows, f'"{h.hexdigest()[:20]}"'
+
+
+@require_GET
+async def job_statuses(request):
+    """
+    GET /api/jobs/status/?ids=<id>,<id>&wait=<seconds>
+
+    Status of several jobs at once: id, status, progress (plus error and
+    refinement state), without transcripts or labels.
+
+    The response carries an ETag over the rows' update times. A request
+    whose If-None-Match still matches gets 304; under ASGI, `wait` holds it
+    (up to settings.JOB_STATUS_MAX_WAIT_SECONDS) until the broadcaster sees
+    one of the jobs change. The hold is a coroutine, not a thread. Under WSGI
+    it would tie up a worker thread per client, so `wait` is ignored there
+    and the client paces its own polls.
+    """
+    raw = ",".join(request.GET.getlist("ids"))
+    try:
+        ids = list(dict.fromkeys(uuid.UUID(s.strip()) for s in raw.split(",") if s.strip()))
+    except ValueError:
+        return JsonResponse({"detail": "ids must be job UUIDs."}, status=400)
+    if len(ids) > STATUS_MAX_IDS:
+        return JsonResponse({"detail": f"At most {STATUS_MAX_IDS} ids per request."}, status=400)
+    try:
+        wait = float(request.GET.get("wait") or 0)
+    except ValueError:
+        return JsonResponse({"detail": "wait must be a number of seconds."}, status=400)
+    wait = min(max(wait, 0.0), getattr(settings, "JOB_STATUS_MAX_WAIT_SECONDS", 25.0))
+    if not isinstance(request, ASGIRequest):
+        wait = 0.0
+
+    owner = await _off_request_thread(principal_filter)(request)
+    known = parse_etags(request.headers.get("If-None-Match", ""))
+    rows, etag = await _off_request_thread(_status_rows)(owner, ids)
+    if etag in known and wait:
+        broadcaster = get_broadcaster()
+        sub = broadcaster.subscribe(owner_key(owner))
+        watched = {str(i) for i in ids}
+        try:
+            # Re-read once subscribed, so a change in between isn't missed.
+            rows, etag = await _off_request_thread(_status_rows)(owner, ids)
+            deadline = asyncio.get_running_loop().time() + wait
+            while etag in known and not sub.overflowed:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if event["id"] in watched:
+                    rows, etag = await _off_request_thread(_status_rows)(owner, ids)
+        finally:
+            broadcaster.unsubscribe(sub)
+        if etag in known:
+            # Deleted jobs publish no event; the final read still notices them.
+            rows, etag = await _off_request_thread(_status_rows)(owner, ids)
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag in known:
+        return HttpResponse(status=304, headers=headers)
+    return JsonResponse({"jobs": rows}, headers=headers)
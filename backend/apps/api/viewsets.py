@@ -1,15 +1,11 @@
 # backend/apps/api/viewsets.py
 from __future__ import annotations
 
-import json
-import shutil
-import threading
 from pathlib import Path
-from uuid import UUID
 
 from django.conf import settings
+from django.db import transaction
 from django.http import HttpResponse
-from django.utils import timezone
 
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
@@ -17,75 +13,32 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 
+from apps.web.jobs import current_scheduler, fill_from_cache, notify_workers, queue_stats
 from apps.web.models import UploadJob
+from .pagination import JobCursorPagination
 from .permissions import IsOwnerByPrincipal
-from .serializers import UploadJobDetailSerializer, UploadJobListSerializer
-from .utils import normalize_labels_list, principal_filter, rel_media_path
-from services.pipeline.steps import analyze_upload, save_upload
-
-
-VOSK_MODEL_DIR = getattr(settings, "VOSK_MODEL_DIR", None)
-
-
-# ---------- helpers ----------
-
-def _safe_rm(p: Path) -> None:
-    try:
-        if p.is_file() or p.is_symlink():
-            p.unlink(missing_ok=True)
-        elif p.is_dir():
-            shutil.rmtree(p, ignore_errors=True)
-    except Exception:
-        # Best-effort cleanup; intentionally swallow errors
-        pass
-
-
-def _run_job_in_bg(job_id: UUID) -> None:
-    """Execute pipeline for a single job in a background thread."""
-    job = UploadJob.objects.get(id=job_id)
-    job.status = UploadJob.Status.RUNNING
-    job.started_at = timezone.now()
-    job.save(update_fields=["status", "started_at"])
-
-    try:
-        result = analyze_upload(
-            upload_path=Path(job.upload_path),
-            model_path=VOSK_MODEL_DIR,
-            use_mock=False,
-        )
-
-        src_p = Path(result["upload_path"])
-        wav_p = Path(result["normalized_path"])
-
-        transcript = result.get("transcript") or {}
-        length_sec = float(transcript.get("duration_sec") or 0.0)
-
-        job.normalized_path = result.get("normalized_path")
-        job.upload_rel = rel_media_path(result.get("upload_path", job.upload_path))
-        job.normalized_rel = rel_media_path(result.get("normalized_path", "") or "")
-        job.src_size = src_p.stat().st_size if src_p.exists() else None
-        job.wav_size = wav_p.stat().st_size if wav_p.exists() else None
-        job.duration_sec = round(length_sec, 3)
-        job.full_text = result.get("full_text", "")
-        job.labels = result.get("labels", [])
-        job.status = UploadJob.Status.SUCCESS
-        job.finished_at = timezone.now()
-        job.save()
-
-    except FileNotFoundError as e:
-        job.status = UploadJob.Status.FAILED
-        err = "ASR resources not available."
-        if getattr(settings, "DEBUG", False):
-            err += f" (model_path={VOSK_MODEL_DIR!r}; err={e})"
-        job.error = err
-        job.finished_at = timezone.now()
-        job.save(update_fields=["status", "error", "finished_at"])
-
-    except Exception as e:
-        job.status = UploadJob.Status.FAILED
-        job.error = f"{type(e).__name__}: {e}"
-        job.finished_at = timezone.now()
-        job.save(update_fields=["status", "error", "finished_at"])
+from .serializers import LIST_COLUMNS, UploadJobDetailSerializer, UploadJobListSerializer, list_row
+from .utils import build_export_blob, build_flags, principal_filter
+from services.label.cache import label_cache
+from services.pipeline.steps import save_upload
+
+
+# Columns each detail action reads (plus the owner, for IsOwnerByPrincipal).
+# Transcripts and labels can be megabytes per row, so nothing loads them
+# unless it renders them; list rows come from .values(*LIST_COLUMNS).
+OWNER_FIELDS = ("user", "session_key")
+ACTION_FIELDS = {
+    "retrieve": tuple(UploadJobDetailSerializer.Meta.fields),
+    "destroy": ("upload_path", "normalized_path"),
+    # labels: running jobs and rows not yet backfilled build their flags here.
+    "data": (
+        "status", "progress", "labels_pass", "refine_status", "full_text", "flags", "labels",
+        "original_name", "stored_name", "upload_rel", "upload_path",
+    ),
+    # full_text, labels and stored_name feed build_export_blob() for rows
+    # finished before export_blob existed.
+    "export": ("status", "export_blob", "original_name", "stored_name", "full_text", "labels"),
+}
 
 
 # ---------- viewset ----------
@@ -101,6 +54,7 @@ class UploadJobViewSet(
     Use the custom 'bulk' action to enqueue multiple files.
     """
     parser_classes = [MultiPartParser, FormParser]
+    pagination_class = JobCursorPagination
     # default permissions (overridden per-action below)
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerByPrincipal]
 
@@ -115,10 +69,23 @@ class UploadJobViewSet(
         return [IsAuthenticatedOrReadOnly(), IsOwnerByPrincipal()]
 
     def get_queryset(self):
-        return (
+        queryset = (
             UploadJob.objects.filter(**principal_filter(self.request))
-            .order_by("-created_at")
+            .order_by("-created_at", "-id")
         )
+        if self.action == "list":
+            return queryset.values(*LIST_COLUMNS)
+        if self.action in ACTION_FIELDS:
+            return queryset.only(*ACTION_FIELDS[self.action], *OWNER_FIELDS)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        # Rows come from list_row(); UploadJobListSerializer only documents them.
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response([list_row(row) for row in queryset])
+        return self.get_paginated_response([list_row(row) for row in page])
 
     def get_serializer_class(self):
         return (
@@ -148,6 +115,7 @@ class UploadJobViewSet(
 
         jobs_resp = []
         created_now = 0
+        queued_now = 0
 
         for f in files:
             if existing_count + created_now >= max_uploads:
@@ -166,51 +134,55 @@ class UploadJobViewSet(
                 jobs_resp.append({"filename": f.name, "error": f"Upload error: {e}"})
                 continue
 
-            job = UploadJob.objects.create(
+            job = UploadJob(
                 upload_path=str(src),
                 stored_name=Path(src).name,
                 original_name=getattr(f, "name", ""),
+                content_hash=Path(src).stem,
                 status=UploadJob.Status.PENDING,
                 **owner_kwargs,
             )
+            # Re-uploads of already processed content finish immediately.
+            if not fill_from_cache(job):
+                queued_now += 1
+            job.save()
             created_now += 1
 
-            threading.Thread(target=_run_job_in_bg, args=(job.id,), daemon=True).start()
-
             jobs_resp.append({
                 "id": str(job.id),
                 "filename": f.name,
                 "size": getattr(f, "size", None),
             })
 
+        # Rows are the queue; wake the local workers once they are committed.
+        if queued_now:
+            transaction.on_commit(notify_workers)
+
         # Maintain legacy semantics (202 Accepted)
         return Response({"jobs": jobs_resp}, status=status.HTTP_202_ACCEPTED)
 
+    # GET /api/jobs/queue/
+    @action(detail=False, methods=["get"], url_path="queue")
+    def queue(self, request):
+        """Queue depth across all nodes plus this process's worker usage."""
+        payload = queue_stats()
+        scheduler = current_scheduler()
+        if scheduler is not None:
+            payload.update(scheduler.stats())
+        payload["label_cache"] = label_cache.stats()
+        return Response(payload)
+
     # GET /api/jobs/{id}/data/
     @action(detail=True, methods=["get"], url_path="data")
     def data(self, request, pk=None):
         job = self.get_object()  # IsOwnerByPrincipal applies
-        if job.status != UploadJob.Status.SUCCESS:
+        running = job.status == UploadJob.Status.RUNNING
+        if job.status != UploadJob.Status.SUCCESS and not running:
             return Response({"detail": "Job not finished."}, status=404)
 
-        flags = []
-        if isinstance(job.labels, list):
-            for item in normalize_labels_list(job.labels):
-                if isinstance(item, (list, tuple)) and len(item) >= 4:
-                    label, text, start, end = item[0], item[1], item[2], item[3]
-                    flags.append({
-                        "label": label,
-                        "text": text,
-                        "start_sec": float(start) if start is not None else 0.0,
-                        "end_sec": float(end) if end is not None else 0.0,
-                    })
-                elif isinstance(item, dict):
-                    flags.append({
-                        "label": item.get("label") or item.get("type") or "flag",
-                        "text": item.get("text") or item.get("span") or "",
-                        "start_sec": float(item.get("start_sec") or item.get("start") or 0.0),
-                        "end_sec": float(item.get("end_sec") or item.get("end") or 0.0),
-                    })
+        # Finished jobs carry flags precomputed when their labels became final;
+        # running jobs (partial labels) and rows not yet backfilled build them here.
+        flags = job.flags if job.flags is not None and not running else build_flags(job.labels)
 
         filename = (
             job.original_name
@@ -218,12 +190,19 @@ class UploadJobViewSet(
             or (Path(job.upload_rel or job.upload_path).name if job.upload_path else "")
         )
 
-        return Response({
+        payload = {
             "job_id": str(job.id),
             "filename": filename,
             "transcript_text": job.full_text or "",
             "flags": flags,
-        })
+        }
+        if running:
+            # Flags found so far; more arrive until the job finishes.
+            payload.update(partial=True, progress=job.progress)
+        elif job.labels_pass == UploadJob.LabelsPass.PREVIEW:
+            # Quick first pass; a refinement may still replace these flags.
+            payload.update(preview=True, refine_status=job.refine_status)
+        return Response(payload)
 
     # GET /api/jobs/{id}/export/
     @action(detail=True, methods=["get"], url_path="export")
@@ -232,13 +211,7 @@ class UploadJobViewSet(
         if job.status != UploadJob.Status.SUCCESS:
             return Response({"detail": "Job not finished."}, status=404)
 
-        payload = {
-            "job_id": str(job.id),
-            "filename": job.original_name or job.stored_name or "",
-            "transcript_text": job.full_text or "",
-            "flags": normalize_labels_list(job.labels or []),
-        }
-        blob = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+        blob = bytes(job.export_blob) if job.export_blob is not None else build_export_blob(job)
         fname = (job.original_name or "job").rsplit(".", 1)[0] + "-transcript.json"
 
         resp = HttpResponse(blob, content_type="application/json; charset=utf-8")
@@ -248,34 +221,7 @@ class UploadJobViewSet(
     # DELETE /api/jobs/{id}/
     def perform_destroy(self, instance: UploadJob) -> None:
         """
-        Remove DB row and best-effort delete related artifacts:
-          - original upload (uploads/)
-          - normalized wav (normalized/)
-          - transcript JSON (transcripts/<jobid>.json)
+        Remove DB row; UploadJob.delete() removes the upload, normalized wav
+        and transcript JSON unless another job shares them (deduplicated uploads).
         """
-        media_root = Path(settings.MEDIA_ROOT)
-
-        candidates: list[Path] = []
-
-        # original upload
-        if instance.upload_rel:
-            candidates.append(media_root / instance.upload_rel)
-        elif instance.upload_path:
-            try:
-                candidates.append(Path(instance.upload_path))
-            except Exception:
-                pass
-
-        # normalized audio
-        if getattr(instance, "normalized_rel", ""):
-            candidates.append(media_root / instance.normalized_rel)
-        elif getattr(instance, "normalized_path", ""):
-            candidates.append(Path(instance.normalized_path))
-
-        # transcript JSON (conventional cache)
-        candidates.append(media_root / "transcripts" / f"{instance.id}.json")
-
-        for p in candidates:
-            _safe_rm(p)
-
         super().perform_destroy(instance)
@@ -7,5 +7,5 @@ from .models import UploadJob
 @admin.register(UploadJob)
 class UploadJobAdmin(admin.ModelAdmin):
     list_display = ("id", "status", "created_at", "started_at", "finished_at", "src_size", "wav_size")
-    readonly_fields = ("created_at", "started_at", "finished_at", "upload_path", "normalized_path")
-    search_fields = ("id", "upload_rel", "normalized_rel", "full_text")
+    readonly_fields = ("created_at", "started_at", "finished_at", "upload_path", "normalized_path", "worker_id", "heartbeat_at", "lease_expires_at", "attempts", "refine_attempts", "content_hash", "result_key", "label_model_version", "asr_model", "labels_pass", "refine_status", "flags")
+    search_fields = ("id", "content_hash", "upload_rel", "normalized_rel", "full_text")
@@ -1,6 +1,40 @@
+import os
+import sys
+
 from django.apps import AppConfig
+from django.conf import settings
+
+
+def _autostart_scheduler() -> bool:
+    """
+    Whether the inline scheduler starts with Django in this process: only in
+    runserver's serving process (the reloader's child, or --noreload), or with
+    settings.JOB_SCHEDULER_AUTOSTART. Gunicorn workers start theirs from
+    gunicorn.conf.py; management commands, tests and scripts never claim jobs
+    unless they run a JobScheduler themselves.
+    """
+    if getattr(settings, "JOB_SCHEDULER_AUTOSTART", False):
+        return True
+    if os.path.basename(sys.argv[0]) not in {"manage.py", "django-admin"} or sys.argv[1:2] != ["runserver"]:
+        return False
+    return os.environ.get("RUN_MAIN") == "true" or "--noreload" in sys.argv
 
 
 class WebConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.web"
+
+    def ready(self):
+        # Opt-in: with gunicorn's preload_app this runs once in the master, before
+        # workers fork (see gunicorn.conf.py).
+        if getattr(settings, "PRELOAD_MODELS", False):
+            from services.pipeline.steps import preload_models
+
+            preload_models()
+
+        # Inline workers start with the server so jobs queued before a restart
+        # drain without waiting for a request.
+        if _autostart_scheduler():
+            from apps.web.jobs import get_scheduler
+
+            get_scheduler()
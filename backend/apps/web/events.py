@@ -0,0 +1,176 @@
+# backend/apps/web/events.py
+"""
+Job lifecycle events for the /api/jobs/events/ stream.
+
+One JobEventBroadcaster per process watches UploadJob.updated_at and fans
+each changed row out to the open streams of the job's owner. Every write in
+jobs.py bumps updated_at (the heartbeat deliberately does not), so status
+transitions and progress reach the streams no matter which process or node
+ran the job. The poller only runs while at least one stream is open and makes
+one query per interval however many clients are connected; wake() lets jobs
+in this process publish without waiting for the next tick.
+
+Streams live on the ASGI event loop, the poller in a thread: each subscription
+is an asyncio.Queue fed through loop.call_soon_threadsafe().
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+from apps.web.models import UploadJob
+
+log = logging.getLogger(__name__)
+
+EVENT_FIELDS = ("id", "status", "progress", "error", "labels_pass", "refine_status", "src_size")
+# Commits can land with an updated_at slightly older than rows already seen,
+# so every poll looks this far behind its cursor (duplicates are filtered).
+COMMIT_LAG = timedelta(seconds=2)
+QUEUE_SIZE = 256
+
+
+def owner_key(owner_filter: dict) -> tuple:
+    """Subscription key for a principal_filter() result."""
+    if "user" in owner_filter:
+        return ("user", owner_filter["user"].pk)
+    return ("session", owner_filter["session_key"])
+
+
+def _row_owner(row: dict) -> tuple:
+    if row["user_id"] is not None:
+        return ("user", row["user_id"])
+    return ("session", row["session_key"])
+
+
+def event_payload(row: dict) -> dict:
+    return {name: str(row[name]) if name == "id" else row[name] for name in EVENT_FIELDS}
+
+
+class Subscription:
+    """One open stream: events for `owner` queued on the stream's event loop."""
+
+    def __init__(self, owner: tuple, loop: asyncio.AbstractEventLoop):
+        self.owner = owner
+        self.loop = loop
+        self.queue: "asyncio.Queue[dict]" = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.overflowed = False
+
+    def offer(self, event: dict) -> None:
+        # Runs on self.loop. A client too slow to drain its queue is cut off;
+        # EventSource reconnects and resyncs from a fresh snapshot.
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class JobEventBroadcaster:
+    def __init__(self, interval: float = 1.0):
+        self.interval = float(interval)
+        self._subs: dict[tuple, set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ------------- public API -------------
+    def subscribe(self, owner: tuple) -> Subscription:
+        """Call from the event loop that will read the subscription's queue."""
+        sub = Subscription(owner, asyncio.get_running_loop())
+        with self._lock:
+            self._subs.setdefault(owner, set()).add(sub)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="job-events", daemon=True)
+                self._thread.start()
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subs.get(sub.owner)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subs[sub.owner]
+
+    def wake(self) -> None:
+        """Poll now instead of at the next interval (after a local write)."""
+        self._wake.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"owners": len(self._subs), "streams": sum(len(s) for s in self._subs.values())}
+
+    # ------------- poller -------------
+    def _run(self) -> None:
+        cursor = timezone.now() - COMMIT_LAG
+        seen: dict = {}
+        try:
+            while True:
+                self._wake.wait(self.interval)
+                self._wake.clear()
+                with self._lock:
+                    if not self._subs:
+                        # Last stream closed; a new subscribe() starts a fresh poller.
+                        self._thread = None
+                        return
+                close_old_connections()
+                try:
+                    cursor = self._poll(cursor, seen)
+                except Exception:
+                    log.exception("Job event poll failed")
+        finally:
+            connection.close()
+
+    def _poll(self, cursor, seen: dict):
+        rows = (
+            UploadJob.objects.filter(updated_at__gte=cursor - COMMIT_LAG)
+            .order_by("updated_at")
+            .values(*EVENT_FIELDS, "updated_at", "user_id", "session_key")
+        )
+        for row in rows:
+            stamp = row["updated_at"]
+            cursor = max(cursor, stamp)
+            if seen.get(row["id"]) == stamp:
+                continue
+            seen[row["id"]] = stamp
+            self._publish(_row_owner(row), {**event_payload(row), "updated_at": stamp.isoformat()})
+
+        horizon = cursor - COMMIT_LAG
+        for job_id in [k for k, stamp in seen.items() if stamp < horizon]:
+            del seen[job_id]
+        return cursor
+
+    def _publish(self, owner: tuple, event: dict) -> None:
+        with self._lock:
+            subs = list(self._subs.get(owner, ()))
+        for sub in subs:
+            try:
+                sub.loop.call_soon_threadsafe(sub.offer, event)
+            except RuntimeError:
+                # The stream's loop is gone; it unsubscribes on its way out.
+                pass
+
+
+_broadcaster: JobEventBroadcaster | None = None
+_broadcaster_lock = threading.Lock()
+
+
+def get_broadcaster() -> JobEventBroadcaster:
+    global _broadcaster
+    with _broadcaster_lock:
+        if _broadcaster is None:
+            _broadcaster = JobEventBroadcaster(
+                interval=getattr(settings, "JOB_EVENTS_POLL_SECONDS", 1.0)
+            )
+        return _broadcaster
+
+
+def publish_job_change() -> None:
+    """Wake this process's broadcaster, if any stream is listening."""
+    if _broadcaster is not None:
+        _broadcaster.wake()
@@ -0,0 +1,590 @@
+# backend/apps/web/jobs.py
+"""
+Database-backed queue for UploadJob processing.
+
+PENDING rows *are* the queue: uploads only insert a row, and a JobScheduler
+runs a fixed number of worker threads that claim the oldest PENDING row, run
+the pipeline on it and go back for more. Because the queue lives in the
+database, work queued before a restart is picked up again as soon as a
+scheduler starts.
+
+Every claim takes a lease (settings.JOB_LEASE_SECONDS) that the worker's
+heartbeat keeps extending. If a worker dies mid-job the lease runs out and
+reap_expired_jobs() puts the job back in the queue, or fails it once it has
+used up settings.JOB_MAX_ATTEMPTS.
+
+Long recordings can finish with preview labels (settings.ASR_PREVIEW_MIN_SECONDS).
+Their refinement pass is a second, lower-priority queue: SUCCESS rows with
+refine_status PENDING, claimed only when no upload is waiting. It has its own
+lease and its own attempt counter (refine_attempts).
+
+Where the scheduler runs is controlled by settings.JOB_RUNNER:
+  - "inline":   inside each web process (default; zero extra containers)
+  - "external": only in `manage.py run_workers`; the web tier just enqueues
+"""
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.api.utils import build_export_blob, build_flags, rel_media_path
+from apps.web.events import publish_job_change
+from apps.web.models import UploadJob
+
+log = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------
+# Pipeline execution
+# ---------------------------------------------------------------------
+def store_outputs(job: UploadJob) -> None:
+    """
+    Derive the read-side copies of `job`'s final labels in memory: the
+    normalized flags served by the data endpoint and the export document.
+    Called wherever labels become final; the caller saves.
+    """
+    job.flags = build_flags(job.labels)
+    job.export_blob = build_export_blob(job)
+
+
+def fill_from_cache(job: UploadJob) -> bool:
+    """
+    Reuse the result of an earlier SUCCESS job with the same content, ASR
+    settings and label model (services.pipeline.steps.result_cache_key).
+
+    Fills `job` in memory as a finished job and returns True on a hit; the
+    caller saves it.
+    """
+    if not job.content_hash or not getattr(settings, "RESULT_CACHE_ENABLED", True):
+        return False
+    from services.pipeline.steps import result_cache_key
+
+    key = result_cache_key(job.content_hash)
+    donor = (
+        UploadJob.objects.filter(result_key=key, status=UploadJob.Status.SUCCESS)
+        .exclude(pk=job.pk)
+        .order_by("-finished_at")
+        .first()
+    )
+    if donor is None:
+        return False
+
+    now = timezone.now()
+    src_p = Path(job.upload_path)
+    job.result_key = key
+    job.upload_rel = rel_media_path(job.upload_path)
+    job.normalized_path = donor.normalized_path
+    job.normalized_rel = donor.normalized_rel
+    job.src_size = src_p.stat().st_size if src_p.exists() else None
+    job.wav_size = donor.wav_size
+    job.duration_sec = donor.duration_sec
+    job.full_text = donor.full_text
+    job.labels = donor.labels
+    job.label_model_version = donor.label_model_version
+    job.asr_model = donor.asr_model
+    job.labels_pass = donor.labels_pass
+    job.progress = 1.0
+    job.error = None
+    job.status = UploadJob.Status.SUCCESS
+    job.started_at = job.started_at or now
+    job.finished_at = now
+    store_outputs(job)
+    log.info("Job %s reused the result of job %s", job.id, donor.id)
+    return True
+
+
+def _queued() -> int:
+    return UploadJob.objects.filter(status=UploadJob.Status.PENDING).count()
+
+
+def _save_owned(job: UploadJob, fields=None) -> bool:
+    """
+    Write `fields` of `job` (default: all of them) only while this worker
+    still holds the claim. A job the reaper re-queued belongs to its next
+    attempt, and a job deleted mid-run must not come back; either way the
+    write is dropped and False returned.
+    """
+    if fields is None:
+        fields = [f.attname for f in UploadJob._meta.concrete_fields if not f.primary_key]
+    saved = UploadJob.objects.filter(
+        id=job.id, status=UploadJob.Status.RUNNING, worker_id=job.worker_id
+    ).update(**{name: getattr(job, name) for name in fields if name != "updated_at"}, updated_at=timezone.now())
+    if not saved:
+        log.warning("Job %s was re-queued or deleted while running; dropping this attempt's result", job.id)
+    return bool(saved)
+
+
+def process_job(job: UploadJob) -> None:
+    """Run the pipeline for a claimed (RUNNING) job and store the outcome."""
+    from services.pipeline.steps import PREVIEW, analyze_upload, result_cache_key
+
+    if job.refine_status == UploadJob.Status.RUNNING:
+        refine_job(job)
+        return
+
+    vosk_model_dir = getattr(settings, "VOSK_MODEL_DIR", None)
+
+    # A duplicate may have finished since this job was queued.
+    if fill_from_cache(job):
+        _save_owned(job)
+        return
+
+    def save_progress(fields: dict) -> None:
+        # Partial labels for the `data` endpoint while the job is still running.
+        UploadJob.objects.filter(id=job.id, status=UploadJob.Status.RUNNING).update(
+            updated_at=timezone.now(), **fields
+        )
+        publish_job_change()
+
+    try:
+        result = analyze_upload(
+            upload_path=Path(job.upload_path),
+            model_path=vosk_model_dir,
+            use_mock=False,
+            on_progress=save_progress,
+            queued=_queued(),
+            preview=True,
+        )
+
+        src_p = Path(result["upload_path"])
+        wav_p = Path(result["normalized_path"]) if result.get("normalized_path") else None
+
+        transcript = result.get("transcript") or {}
+        length_sec = float(transcript.get("duration_sec") or 0.0)
+
+        job.normalized_path = result.get("normalized_path")
+        job.upload_rel = rel_media_path(result.get("upload_path", job.upload_path))
+        job.normalized_rel = rel_media_path(result.get("normalized_path", "") or "")
+        job.src_size = src_p.stat().st_size if src_p.exists() else None
+        job.wav_size = wav_p.stat().st_size if wav_p and wav_p.exists() else None
+        job.duration_sec = round(length_sec, 3)
+        job.full_text = result.get("full_text", "")
+        job.labels = result.get("labels", [])
+        job.label_model_version = result.get("label_model_version")
+        job.asr_model = result.get("asr_model")
+        job.labels_pass = result.get("labels_pass")
+        job.progress = 1.0
+        if job.labels_pass == PREVIEW:
+            # Not reusable as a cached result until the refinement replaces it.
+            job.refine_status = UploadJob.Status.PENDING
+        elif job.content_hash:
+            # Keyed by the version that actually labeled this result.
+            job.result_key = result_cache_key(job.content_hash, job.label_model_version)
+        job.status = UploadJob.Status.SUCCESS
+        job.finished_at = timezone.now()
+        store_outputs(job)
+        _save_owned(job)
+
+    except FileNotFoundError as e:
+        job.status = UploadJob.Status.FAILED
+        err = "ASR resources not available."
+        if getattr(settings, "DEBUG", False):
+            err += f" (model_path={vosk_model_dir!r}; err={e})"
+        job.error = err
+        job.finished_at = timezone.now()
+        _save_owned(job, ["status", "error", "finished_at"])
+
+    except Exception as e:
+        job.status = UploadJob.Status.FAILED
+        job.error = f"{type(e).__name__}: {e}"
+        job.finished_at = timezone.now()
+        _save_owned(job, ["status", "error", "finished_at"])
+
+
+def refine_job(job: UploadJob) -> None:
+    """
+    Second pass for a job holding preview labels: transcribe again with the
+    regular model and replace the labels. The preview stays if this fails.
+    """
+    from services.pipeline.steps import analyze_upload, result_cache_key
+
+    running = UploadJob.objects.filter(id=job.id, refine_status=UploadJob.Status.RUNNING, worker_id=job.worker_id)
+
+    def finish() -> None:
+        running.update(
+            full_text=job.full_text,
+            labels=job.labels,
+            flags=job.flags,
+            export_blob=job.export_blob,
+            label_model_version=job.label_model_version,
+            asr_model=job.asr_model,
+            labels_pass=job.labels_pass,
+            result_key=job.result_key,
+            refine_status=UploadJob.Status.SUCCESS,
+            lease_expires_at=None,
+            updated_at=timezone.now(),
+        )
+
+    if fill_from_cache(job):
+        finish()
+        return
+
+    try:
+        result = analyze_upload(
+            upload_path=Path(job.upload_path),
+            model_path=getattr(settings, "VOSK_MODEL_DIR", None),
+            queued=_queued(),
+        )
+        job.full_text = result.get("full_text", "")
+        job.labels = result.get("labels", [])
+        job.label_model_version = result.get("label_model_version")
+        job.asr_model = result.get("asr_model")
+        job.labels_pass = result.get("labels_pass")
+        job.result_key = (
+            result_cache_key(job.content_hash, job.label_model_version) if job.content_hash else None
+        )
+        store_outputs(job)
+        finish()
+    except Exception:
+        log.exception("Refinement of job %s failed; keeping the preview labels", job.id)
+        running.update(
+            refine_status=UploadJob.Status.FAILED, lease_expires_at=None, updated_at=timezone.now()
+        )
+
+
+# ---------------------------------------------------------------------
+# Queue operations
+# ---------------------------------------------------------------------
+def _lease_seconds() -> float:
+    return float(getattr(settings, "JOB_LEASE_SECONDS", 120))
+
+
+def _claim_oldest(pending, counter: str = "attempts", **fields) -> UploadJob | None:
+    """
+    Atomically apply `fields` (and `counter` += 1) to the first row of the
+    ordered `pending` queryset and return it, or None if it is empty.
+
+    On databases with row locks (Postgres) the row is picked with
+    SELECT ... FOR UPDATE SKIP LOCKED, so concurrent workers on any number of
+    nodes each grab a different row without blocking one another. Elsewhere
+    (SQLite) a conditional UPDATE acts as a compare-and-swap instead.
+    """
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job = pending.select_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+            for name, value in fields.items():
+                setattr(job, name, value)
+            setattr(job, counter, getattr(job, counter) + 1)
+            job.save(update_fields=[*fields, counter, "updated_at"])
+            return job
+
+    while True:
+        job_id = pending.values_list("id", flat=True).first()
+        if job_id is None:
+            return None
+        claimed = pending.filter(id=job_id).update(
+            **{counter: F(counter) + 1}, updated_at=timezone.now(), **fields
+        )
+        if claimed:
+            return UploadJob.objects.get(id=job_id)
+        # Lost the race to another worker; try the next row.
+
+
+def claim_next_job(worker_id: str | None = None) -> UploadJob | None:
+    """
+    Atomically move the oldest PENDING job to RUNNING and return it. With no
+    upload waiting, claim the oldest pending refinement instead (its row keeps
+    status SUCCESS; refine_status becomes RUNNING).
+    """
+    now = timezone.now()
+    lease = now + timedelta(seconds=_lease_seconds())
+    job = _claim_oldest(
+        UploadJob.objects.filter(status=UploadJob.Status.PENDING).order_by("created_at"),
+        status=UploadJob.Status.RUNNING,
+        started_at=now,
+        worker_id=worker_id,
+        heartbeat_at=now,
+        lease_expires_at=lease,
+    )
+    if job is not None:
+        return job
+    return _claim_oldest(
+        UploadJob.objects.filter(refine_status=UploadJob.Status.PENDING).order_by("finished_at"),
+        counter="refine_attempts",
+        refine_status=UploadJob.Status.RUNNING,
+        worker_id=worker_id,
+        heartbeat_at=now,
+        lease_expires_at=lease,
+    )
+
+
+@contextmanager
+def heartbeat(job_id, interval: float, worker_id: str | None = None):
+    """
+    Refresh heartbeat_at and extend the lease of a RUNNING job until exit.
+    A failed beat is logged and retried at the next interval; the lease only
+    lapses if beats keep failing for a whole lease period.
+    """
+    stop = threading.Event()
+
+    def beat():
+        try:
+            while not stop.wait(interval):
+                now = timezone.now()
+                try:
+                    UploadJob.objects.filter(
+                        Q(status=UploadJob.Status.RUNNING) | Q(refine_status=UploadJob.Status.RUNNING),
+                        id=job_id,
+                        worker_id=worker_id,
+                    ).update(
+                        heartbeat_at=now,
+                        lease_expires_at=now + timedelta(seconds=_lease_seconds()),
+                    )
+                except Exception:
+                    log.exception("Heartbeat failed for job %s; retrying", job_id)
+                    # Reconnect next time rather than reuse a broken connection.
+                    connection.close()
+        finally:
+            connection.close()
+
+    t = threading.Thread(target=beat, name=f"heartbeat-{job_id}", daemon=True)
+    t.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        t.join()
+
+
+def reap_expired_jobs() -> dict:
+    """
+    Recover RUNNING jobs whose worker stopped heartbeating.
+
+    Jobs with attempts left go back to PENDING; the rest are marked FAILED.
+    Rows without a lease (claimed before leases existed) expire once they
+    have been running for longer than one lease period. Refinements are
+    recovered the same way against refine_attempts.
+    """
+    now = timezone.now()
+    expired = UploadJob.objects.filter(status=UploadJob.Status.RUNNING).filter(
+        Q(lease_expires_at__lt=now)
+        | Q(lease_expires_at__isnull=True, started_at__lt=now - timedelta(seconds=_lease_seconds()))
+    )
+    max_attempts = int(getattr(settings, "JOB_MAX_ATTEMPTS", 3))
+
+    requeued = expired.filter(attempts__lt=max_attempts).update(
+        status=UploadJob.Status.PENDING,
+        started_at=None,
+        progress=0.0,
+        labels=None,
+        full_text=None,
+        worker_id=None,
+        heartbeat_at=None,
+        lease_expires_at=None,
+        updated_at=now,
+    )
+    failed = expired.update(
+        status=UploadJob.Status.FAILED,
+        error="Processing was interrupted too many times; please upload the file again.",
+        finished_at=now,
+        lease_expires_at=None,
+        updated_at=now,
+    )
+
+    # Refinements only ever improve a finished job; give up quietly. They
+    # count their own attempts, and are always claimed with a lease, so a
+    # refining row without one is orphaned.
+    refining = UploadJob.objects.filter(refine_status=UploadJob.Status.RUNNING).filter(
+        Q(lease_expires_at__lt=now) | Q(lease_expires_at__isnull=True)
+    )
+    requeued += refining.filter(refine_attempts__lt=max_attempts).update(
+        refine_status=UploadJob.Status.PENDING,
+        worker_id=None,
+        heartbeat_at=None,
+        lease_expires_at=None,
+        updated_at=now,
+    )
+    refining.update(refine_status=UploadJob.Status.FAILED, lease_expires_at=None, updated_at=now)
+
+    if requeued or failed:
+        log.warning("Reaped expired jobs: %d requeued, %d failed", requeued, failed)
+    return {"requeued": requeued, "failed": failed}
+
+
+def queue_stats() -> dict:
+    """Queue depth as seen by the database (all nodes)."""
+    pending = UploadJob.objects.filter(status=UploadJob.Status.PENDING).count()
+    running = UploadJob.objects.filter(status=UploadJob.Status.RUNNING).count()
+    refining = UploadJob.objects.filter(
+        refine_status__in=[UploadJob.Status.PENDING, UploadJob.Status.RUNNING]
+    ).count()
+    return {"pending": pending, "running": running, "refining": refining}
+
+
+# ---------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------
+class JobScheduler:
+    """
+    Fixed-size pool of worker threads draining the PENDING queue.
+
+    Workers sleep on an event between polls; notify() wakes them as soon as a
+    new job is committed so short queues don't wait for the poll interval.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 1,
+        poll_interval: float = 2.0,
+        heartbeat_interval: float = 15.0,
+        exit_when_idle: bool = False,
+    ):
+        self.concurrency = max(1, int(concurrency))
+        self.poll_interval = float(poll_interval)
+        self.heartbeat_interval = float(heartbeat_interval)
+        self.exit_when_idle = exit_when_idle
+        self.reap_interval = float(getattr(settings, "JOB_REAP_SECONDS", 60))
+        self.node_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._next_reap = 0.0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._busy = 0
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return any(t.is_alive() for t in self._threads)
+
+    @property
+    def busy(self) -> int:
+        return self._busy
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._threads = [
+                threading.Thread(
+                    target=self._worker, name=f"job-worker-{i}", daemon=True
+                )
+                for i in range(self.concurrency)
+            ]
+            for t in self._threads:
+                t.start()
+        log.info("Job scheduler started with %d workers", self.concurrency)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Ask workers to exit after their current job."""
+        self._stop.set()
+        self._wake.set()
+        self.join(timeout)
+
+    def join(self, timeout: float | None = None) -> None:
+        for t in self._threads:
+            t.join(timeout)
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    def stats(self) -> dict:
+        return {"workers": self.concurrency, "busy": self._busy}
+
+    def _worker(self) -> None:
+        worker_id = f"{self.node_id}:{threading.current_thread().name}"
+        # Started from WebConfig.ready(): no queries until every app is ready.
+        while not apps.ready:
+            if self._stop.wait(0.05):
+                return
+        try:
+            while not self._stop.is_set():
+                close_old_connections()
+                self._maybe_reap()
+                self._wake.clear()
+                try:
+                    job = claim_next_job(worker_id)
+                except Exception:
+                    log.exception("Failed to claim next job")
+                    job = None
+                if job is None:
+                    if self.exit_when_idle:
+                        break
+                    self._wake.wait(self.poll_interval)
+                    continue
+
+                log.info("%s claimed job %s", worker_id, job.id)
+                publish_job_change()
+                with self._lock:
+                    self._busy += 1
+                try:
+                    with heartbeat(job.id, self.heartbeat_interval, job.worker_id):
+                        process_job(job)
+                except Exception:
+                    log.exception("Unhandled error while processing job %s", job.id)
+                finally:
+                    publish_job_change()
+                    with self._lock:
+                        self._busy -= 1
+        finally:
+            connection.close()
+
+
+    def _maybe_reap(self) -> None:
+        """Let one worker per reap interval recover jobs orphaned by dead workers."""
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_reap:
+                return
+            self._next_reap = now + self.reap_interval
+        try:
+            if reap_expired_jobs()["requeued"]:
+                self._wake.set()
+        except Exception:
+            log.exception("Failed to reap expired jobs")
+
+
+_scheduler: JobScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def runs_inline() -> bool:
+    return getattr(settings, "JOB_RUNNER", "inline") == "inline"
+
+
+def get_scheduler() -> JobScheduler | None:
+    """
+    Return this process's inline scheduler, starting it if it isn't running.
+    Called where a server process starts up (WebConfig.ready() under
+    runserver, gunicorn's post_worker_init). Returns None when jobs are
+    executed by external `run_workers` processes.
+    """
+    global _scheduler
+    if not runs_inline():
+        return None
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = JobScheduler(
+                concurrency=getattr(settings, "JOB_WORKERS", 1),
+                poll_interval=getattr(settings, "JOB_POLL_SECONDS", 2.0),
+                heartbeat_interval=getattr(settings, "JOB_HEARTBEAT_SECONDS", 15.0),
+            )
+        _scheduler.start()
+        return _scheduler
+
+
+def current_scheduler() -> JobScheduler | None:
+    """This process's inline scheduler if it has been started, without starting it."""
+    return _scheduler
+
+
+def notify_workers() -> None:
+    """Wake local workers (if this process runs any) and event streams after new jobs are committed."""
+    publish_job_change()
+    scheduler = current_scheduler()
+    if scheduler is not None:
+        scheduler.notify()
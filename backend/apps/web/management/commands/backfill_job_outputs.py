@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.web.jobs import store_outputs
+from apps.web.models import UploadJob
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompute flags and the export document for finished jobs that predate "
+        "them (or for all finished jobs with --all). Safe to run while workers are busy."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Rebuild rows that already have them too.")
+        parser.add_argument("--batch", type=int, default=200, help="Rows per transaction.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show how many jobs would be backfilled without writing anything.",
+        )
+
+    def handle(self, *args, **options):
+        qs = UploadJob.objects.filter(status=UploadJob.Status.SUCCESS)
+        if not options.get("all"):
+            qs = qs.filter(flags__isnull=True)
+        total = qs.count()
+        if options.get("dry_run") or not total:
+            self.stdout.write(f"{'[dry-run] ' if options.get('dry_run') else ''}{total} jobs to backfill.")
+            return
+
+        fields = ("id", "original_name", "stored_name", "full_text", "labels", "updated_at")
+        done = skipped = 0
+        last_id = None
+        batch = max(1, options["batch"])
+        while True:
+            page = qs.order_by("id").only(*fields)
+            if last_id is not None:
+                page = page.filter(id__gt=last_id)
+            jobs = list(page[:batch])
+            if not jobs:
+                break
+            last_id = jobs[-1].id
+            with transaction.atomic():
+                for job in jobs:
+                    store_outputs(job)
+                    # Only if the labels didn't change meanwhile (a refinement
+                    # writes its own outputs); updated_at is left alone.
+                    if UploadJob.objects.filter(id=job.id, updated_at=job.updated_at).update(
+                        flags=job.flags, export_blob=job.export_blob
+                    ):
+                        done += 1
+                    else:
+                        skipped += 1
+            self.stdout.write(f"{done + skipped}/{total}")
+
+        self.stdout.write(f"Backfilled {done} jobs ({skipped} changed meanwhile and were skipped).")
@@ -0,0 +1,99 @@
+import statistics
+import time
+from uuid import uuid4
+
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from apps.api.serializers import UploadJobListSerializer
+from apps.api.viewsets import UploadJobViewSet
+from apps.web.models import UploadJob
+
+WORDS_PER_HOUR = 150 * 60  # speech rate
+FLAGS_PER_HOUR = 120
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the jobs list endpoint (queryset, serializer, JSON) against job rows "
+        "with transcripts of growing length. The rows are created under a throwaway "
+        "session and deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=50, help="Rows per run (one list page).")
+        parser.add_argument(
+            "--hours", default="0,1,4,8", help="Comma-separated transcript lengths in hours of speech."
+        )
+        parser.add_argument("--repeat", type=int, default=20, help="Timed requests per run.")
+
+    def handle(self, *args, **options):
+        hours = [float(h) for h in options["hours"].split(",") if h.strip()]
+        self.stdout.write(f"{'hours':>6} {'row KB':>9} {'list ms':>9} {'all columns ms':>15}")
+        for h in hours:
+            session_key = f"bench{uuid4().hex}"
+            self._create_jobs(session_key, options["jobs"], h)
+            try:
+                row_kb = self._row_kb(session_key)
+                lean = self._time(session_key, options["repeat"], self._list)
+                full = self._time(session_key, options["repeat"], self._list_all_columns)
+            finally:
+                UploadJob.objects.filter(session_key=session_key).delete()
+            self.stdout.write(f"{h:>6g} {row_kb:>9.1f} {lean:>9.2f} {full:>15.2f}")
+
+    def _create_jobs(self, session_key: str, n: int, hours: float) -> None:
+        words = int(WORDS_PER_HOUR * hours)
+        text = " ".join(f"word{i % 5000}" for i in range(words))
+        labels = [
+            ["Bad Language", f"flagged span {i}", i * 30.0, i * 30.0 + 2.5]
+            for i in range(int(FLAGS_PER_HOUR * hours))
+        ]
+        UploadJob.objects.bulk_create(
+            UploadJob(
+                session_key=session_key,
+                status=UploadJob.Status.SUCCESS,
+                upload_path=f"/bench/{i}.wav",
+                original_name=f"bench-{i}.wav",
+                src_size=1_000_000,
+                duration_sec=hours * 3600,
+                full_text=text,
+                labels=labels,
+                progress=1.0,
+            )
+            for i in range(n)
+        )
+
+    def _row_kb(self, session_key: str) -> float:
+        job = UploadJob.objects.filter(session_key=session_key).first()
+        return (len(job.full_text or "") + len(JSONRenderer().render(job.labels))) / 1024
+
+    def _request(self, session_key: str) -> Request:
+        http = RequestFactory().get("/api/jobs/")
+        http.session = SessionStore(session_key=session_key)
+        http.user = AnonymousUser()
+        return Request(http)
+
+    def _list(self, session_key: str) -> bytes:
+        view = UploadJobViewSet(action="list", format_kwarg=None, request=self._request(session_key))
+        return JSONRenderer().render(view.list(view.request).data)
+
+    def _list_all_columns(self, session_key: str) -> bytes:
+        # Baseline: whole model rows, as the list loaded before per-action querysets.
+        view = UploadJobViewSet(action="list", format_kwarg=None, request=self._request(session_key))
+        queryset = UploadJob.objects.filter(session_key=session_key).order_by("-created_at")
+        page = view.paginate_queryset(queryset)
+        data = UploadJobListSerializer(page, many=True).data
+        return JSONRenderer().render(view.get_paginated_response(data).data)
+
+    def _time(self, session_key: str, repeat: int, fn) -> float:
+        fn(session_key)  # warm-up
+        samples = []
+        for _ in range(max(1, repeat)):
+            t0 = time.perf_counter()
+            fn(session_key)
+            samples.append((time.perf_counter() - t0) * 1000)
+        return statistics.median(samples)
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from services.label.model.artifacts import activate_version, active_version, list_versions
+
+
+class Command(BaseCommand):
+    help = (
+        "List published label model versions or switch the active one. Running "
+        "processes pick up the change on their next labeling call."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--activate",
+            metavar="VERSION",
+            help="Make VERSION current (e.g. to roll back).",
+        )
+
+    def handle(self, *args, **options):
+        artifacts = settings.LABEL_MODEL_DIR
+        if options.get("activate"):
+            try:
+                activate_version(artifacts, options["activate"])
+            except ValueError as e:
+                raise CommandError(str(e))
+            self.stdout.write(f"Active label model: {options['activate']}")
+            return
+
+        current, _ = active_version(artifacts)
+        versions = list_versions(artifacts)
+        if not versions:
+            self.stdout.write(f"No published versions; using flat artifacts ({current}).")
+            return
+        for m in versions:
+            mark = "*" if m["version"] == current else " "
+            self.stdout.write(f"{mark} {m['version']}  {m.get('created_at', '')}")
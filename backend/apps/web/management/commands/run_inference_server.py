@@ -0,0 +1,53 @@
+import signal
+from functools import partial
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from services.inference import InferenceServer
+from services.pipeline import steps
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve transcribe/classify calls from one copy of the models for every "
+        "process on this node that sets INFERENCE_ADDRESS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--address",
+            help="Unix socket path or host:port to listen on (defaults to settings.INFERENCE_ADDRESS).",
+        )
+
+    def handle(self, *args, **options):
+        address = options.get("address") or getattr(settings, "INFERENCE_ADDRESS", "")
+        if not address:
+            raise CommandError("Set INFERENCE_ADDRESS or pass --address.")
+
+        server = InferenceServer(
+            address,
+            authkey=settings.INFERENCE_AUTHKEY.encode("utf-8"),
+            transcribe=steps.run_asr,
+            classify=steps.classify_local,
+            label_version=partial(steps.label_model_version, steps.ARTIFACTS),
+        )
+
+        def shutdown(signum, frame):
+            self.stdout.write("Stopping inference server...")
+            server.close()
+
+        signal.signal(signal.SIGTERM, shutdown)
+        signal.signal(signal.SIGINT, shutdown)
+
+        self.stdout.write("Loading models...")
+        steps.label_texts(["warm up"], steps.ARTIFACTS, steps.label_thresholds())
+        try:
+            steps.warm_whisper()
+        except Exception as e:
+            # Keep serving classification; transcribe calls retry the load.
+            self.stderr.write(f"Whisper failed to load: {e}")
+
+        self.stdout.write(f"Inference server listening on {address}.")
+        server.serve_forever()
+        self.stdout.write("Inference server stopped.")
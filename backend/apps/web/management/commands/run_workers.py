@@ -0,0 +1,57 @@
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.web.jobs import JobScheduler, queue_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Run pipeline workers that claim PENDING upload jobs from the database. "
+        "Start one per worker container and set JOB_RUNNER=external on the web tier."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            help="Jobs processed in parallel by this process (defaults to settings.JOB_WORKERS).",
+        )
+        parser.add_argument(
+            "--poll",
+            type=float,
+            help="Seconds between queue polls when idle (defaults to settings.JOB_POLL_SECONDS).",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the queue and exit instead of waiting for new jobs.",
+        )
+
+    def handle(self, *args, **options):
+        scheduler = JobScheduler(
+            concurrency=options.get("concurrency") or getattr(settings, "JOB_WORKERS", 1),
+            poll_interval=options.get("poll") or getattr(settings, "JOB_POLL_SECONDS", 2.0),
+            heartbeat_interval=getattr(settings, "JOB_HEARTBEAT_SECONDS", 15.0),
+            exit_when_idle=options.get("once", False),
+        )
+
+        def shutdown(signum, frame):
+            self.stdout.write("Stopping workers after their current job...")
+            scheduler.stop(timeout=0)
+
+        signal.signal(signal.SIGTERM, shutdown)
+        signal.signal(signal.SIGINT, shutdown)
+
+        stats = queue_stats()
+        self.stdout.write(
+            f"Starting {scheduler.concurrency} worker(s) on {scheduler.node_id} "
+            f"({stats['pending']} pending, {stats['running']} running)."
+        )
+        scheduler.start()
+        # Join in short slices so signal handlers get a chance to run.
+        while scheduler.running:
+            scheduler.join(timeout=1.0)
+
+        self.stdout.write("Workers stopped.")
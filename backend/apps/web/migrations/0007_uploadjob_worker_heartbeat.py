@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0006_alter_uploadjob_options"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadjob",
+            name="heartbeat_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="uploadjob",
+            name="worker_id",
+            field=models.CharField(blank=True, max_length=128, null=True),
+        ),
+    ]
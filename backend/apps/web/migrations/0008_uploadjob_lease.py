@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0007_uploadjob_worker_heartbeat"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadjob",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="uploadjob",
+            name="lease_expires_at",
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0009_uploadjob_progress"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadjob",
+            name="content_hash",
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name="uploadjob",
+            name="result_key",
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+    ]
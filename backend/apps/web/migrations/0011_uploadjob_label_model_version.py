@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0010_uploadjob_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadjob",
+            name="label_model_version",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
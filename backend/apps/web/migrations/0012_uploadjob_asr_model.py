@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0011_uploadjob_label_model_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadjob",
+            name="asr_model",
+            field=models.CharField(blank=True, max_length=128, null=True),
+        ),
+    ]
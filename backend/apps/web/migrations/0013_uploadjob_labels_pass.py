@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0012_uploadjob_asr_model"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadjob",
+            name="labels_pass",
+            field=models.CharField(blank=True, choices=[("preview", "Preview"), ("final", "Final")], max_length=16, null=True),
+        ),
+        migrations.AddField(
+            model_name="uploadjob",
+            name="refine_status",
+            field=models.CharField(blank=True, choices=[("PENDING", "Pending"), ("RUNNING", "Running"), ("SUCCESS", "Success"), ("FAILED", "Failed")], db_index=True, max_length=16, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0014_uploadjob_updated_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="uploadjob",
+            index=models.Index(fields=["user", "created_at"], name="web_job_user_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="uploadjob",
+            index=models.Index(fields=["session_key", "created_at"], name="web_job_session_created_idx"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0015_uploadjob_owner_created_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadjob",
+            name="export_blob",
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="uploadjob",
+            name="flags",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0016_uploadjob_flags_export_blob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadjob",
+            name="refine_attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
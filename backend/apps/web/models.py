@@ -14,6 +14,10 @@ class UploadJob(models.Model):
         SUCCESS = "SUCCESS"
         FAILED = "FAILED"
 
+    class LabelsPass(models.TextChoices):
+        PREVIEW = "preview"  # quick first-pass model; a refinement replaces it
+        FINAL = "final"
+
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
 
     # Ownership
@@ -40,6 +44,10 @@ class UploadJob(models.Model):
     original_name = models.CharField(max_length=255, blank=True, null=True)  # user-supplied
     stored_name = models.CharField(max_length=255, blank=True, null=True)    # uuid.ext on disk
 
+    # Content-addressed storage: identical uploads share one file (and result)
+    content_hash = models.CharField(max_length=64, blank=True, null=True, db_index=True)
+    result_key = models.CharField(max_length=64, blank=True, null=True, db_index=True)
+
     # Sizes & meta
     src_size = models.BigIntegerField(blank=True, null=True)
     wav_size = models.BigIntegerField(blank=True, null=True)
@@ -47,12 +55,34 @@ class UploadJob(models.Model):
 
     full_text = models.TextField(blank=True, null=True)
     labels = models.JSONField(blank=True, null=True)  # list of [label, text, start, end]
+    # Read-side copies of `labels`, rebuilt whenever labels are final (apps.web.jobs.store_outputs);
+    # NULL on rows the backfill_job_outputs command hasn't reached yet.
+    flags = models.JSONField(blank=True, null=True)  # normalized [{label, text, start_sec, end_sec}]
+    export_blob = models.BinaryField(blank=True, null=True)  # encoded body of GET .../export/
+    progress = models.FloatField(default=0.0)  # 0..1, share of audio transcribed so far
+    label_model_version = models.CharField(max_length=64, blank=True, null=True)
+    asr_model = models.CharField(max_length=128, blank=True, null=True)  # Whisper model[:beam] used
+    labels_pass = models.CharField(max_length=16, choices=LabelsPass.choices, blank=True, null=True)
+    # Background refinement of preview labels (PENDING -> RUNNING -> SUCCESS/FAILED)
+    refine_status = models.CharField(
+        max_length=16, choices=Status.choices, blank=True, null=True, db_index=True
+    )
     error = models.TextField(blank=True, null=True)
 
     created_at = models.DateTimeField(default=timezone.now, db_index=True)
+    # Last client-visible change (status, progress, labels); drives the status ETag.
+    # Queryset .update() calls must set it explicitly; heartbeats deliberately don't.
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     started_at = models.DateTimeField(blank=True, null=True)
     finished_at = models.DateTimeField(blank=True, null=True)
 
+    # Worker bookkeeping (set when a worker claims the job)
+    worker_id = models.CharField(max_length=128, blank=True, null=True)
+    heartbeat_at = models.DateTimeField(blank=True, null=True)
+    lease_expires_at = models.DateTimeField(blank=True, null=True, db_index=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    refine_attempts = models.PositiveSmallIntegerField(default=0)  # claims of the refinement pass
+
     def __str__(self):
         return f"{self.id} [{self.status}]"
 
@@ -67,6 +97,11 @@ class UploadJob(models.Model):
     
     class Meta:
         ordering = ['-created_at']   # newest first
+        indexes = [
+            # Jobs list: keyset pages of one principal's rows by creation time
+            models.Index(fields=["user", "created_at"], name="web_job_user_created_idx"),
+            models.Index(fields=["session_key", "created_at"], name="web_job_session_created_idx"),
+        ]
 
     # ------------- Safe file cleanup helpers -------------
     def _inside_media(self, p: Path) -> bool:
@@ -77,16 +112,24 @@ class UploadJob(models.Model):
         except Exception:
             return False
 
-    def _safe_unlink(self, p: str | None):
+    def _safe_unlink(self, p: str | None) -> int:
         if not p:
-            return
+            return 0
         path = Path(p)
         if path.exists() and path.is_file() and self._inside_media(path):
             try:
                 path.unlink()
+                return 1
             except Exception:
                 # swallow unlink errors (e.g., already gone)
                 pass
+        return 0
+
+    def _shared(self, field: str, value: str | None) -> bool:
+        """True if another job still references the same file (dedup'd uploads)."""
+        if not value:
+            return False
+        return UploadJob.objects.filter(**{field: value}).exclude(pk=self.pk).exists()
 
     def guess_transcript_path(self) -> str | None:
         """We didn't store transcript path on the model; reconstruct it."""
@@ -96,12 +139,18 @@ class UploadJob(models.Model):
         stem = Path(up).stem
         return str(Path(settings.MEDIA_ROOT) / "transcripts" / f"{stem}.json")
 
-    def delete_files(self):
-        self._safe_unlink(self.upload_path)
-        self._safe_unlink(self.normalized_path)
-        self._safe_unlink(self.guess_transcript_path())
-
-    # Ensure files are removed whenever a job row is deleted.
+    def delete_files(self) -> int:
+        """Remove this job's files unless another job still uses them; returns files removed."""
+        removed = 0
+        if not self._shared("upload_path", self.upload_path):
+            removed += self._safe_unlink(self.upload_path)
+            removed += self._safe_unlink(self.guess_transcript_path())
+        if not self._shared("normalized_path", self.normalized_path):
+            removed += self._safe_unlink(self.normalized_path)
+        return removed
+
+    # Ensure files are removed whenever a job row is deleted; the number of
+    # files removed is kept on the instance as `deleted_files`.
     def delete(self, using=None, keep_parents=False):
-        self.delete_files()
+        self.deleted_files = self.delete_files()
         return super().delete(using=using, keep_parents=keep_parents)
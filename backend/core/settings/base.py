@@ -203,6 +203,84 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 LABEL_MODEL_DIR = BASE_DIR / "services" / "label" / "model" / "artifacts"
 MAX_UPLOADS_PER_PRINCIPAL = int(os.getenv("MAX_UPLOADS_PER_PRINCIPAL", "10"))
 UPLOAD_RETENTION_HOURS = int(os.getenv("UPLOAD_RETENTION_HOURS", "24"))
+# Audio is streamed from ffmpeg into ASR; set to also keep media/normalized/*.wav
+KEEP_NORMALIZED_AUDIO = _env_bool("KEEP_NORMALIZED_AUDIO", False)
+# Uploads are stored by SHA-256; a re-upload of processed content reuses the earlier
+# transcript and labels when ASR settings and label model are unchanged
+RESULT_CACHE_ENABLED = _env_bool("RESULT_CACHE_ENABLED", True)
+
+# Labels of recently seen segment texts (per label model version); 0 disables
+LABEL_CACHE_SIZE = int(os.getenv("LABEL_CACHE_SIZE", "10000"))
+# >0 coalesces label calls from concurrent jobs into one classifier call, waiting
+# at most this long for other jobs to join the batch
+LABEL_BATCH_WAIT_MS = float(os.getenv("LABEL_BATCH_WAIT_MS", "0"))
+# Label decisions: "Skip" texts whose profanity probability is at or above
+# LABEL_PROFANITY_THRESHOLD (0.5 = profanity_check's own cut-off) become "Bad Language";
+# LABEL_CLASS_THRESHOLDS ("Hate Speech=0.6,Terrorism Support=0.5") sets the minimum calibrated
+# probability per label, below which it falls back to "Skip" (needs the label ensemble)
+LABEL_PROFANITY_THRESHOLD = float(os.getenv("LABEL_PROFANITY_THRESHOLD", "0.5"))
+LABEL_CLASS_THRESHOLDS = {
+    k.strip(): float(v) for k, _, v in (s.partition("=") for s in _env_list("LABEL_CLASS_THRESHOLDS"))
+}
+
+# Load label models at startup (before gunicorn forks, so workers share them) and
+# warm Whisper in each worker as it boots
+PRELOAD_MODELS = _env_bool("PRELOAD_MODELS", False)
+
+# Whisper engines kept loaded per process (LRU) and concurrent decodes per model
+WHISPER_ENGINE_CACHE_SIZE = int(os.getenv("WHISPER_ENGINE_CACHE_SIZE", "2"))
+WHISPER_NUM_WORKERS = int(os.getenv("WHISPER_NUM_WORKERS", "1"))
+
+# Long recordings are split at pauses into overlapping chunks decoded in parallel
+# (default: one decoder per 4 cores; 1 disables chunking)
+ASR_CHUNK_WORKERS = int(os.getenv("ASR_CHUNK_WORKERS", str(max(1, (os.cpu_count() or 1) // 4))))
+ASR_CHUNK_SECONDS = float(os.getenv("ASR_CHUNK_SECONDS", "120"))
+ASR_CHUNK_OVERLAP_SECONDS = float(os.getenv("ASR_CHUNK_OVERLAP_SECONDS", "2"))
+
+# >1 routes decodes through a shared batcher that packs VAD clips from concurrent
+# jobs into batched inference calls, waiting at most ASR_BATCH_MAX_WAIT_MS to fill.
+# Audio longer than ASR_BATCH_MAX_SECONDS (above a chunk plus overlap) skips the batcher.
+ASR_BATCH_SIZE = int(os.getenv("ASR_BATCH_SIZE", "1"))
+ASR_BATCH_MAX_WAIT_MS = float(os.getenv("ASR_BATCH_MAX_WAIT_MS", "50"))
+ASR_BATCH_MAX_SECONDS = float(os.getenv("ASR_BATCH_MAX_SECONDS", "180"))
+
+# Per-job Whisper model routing: tiers best first as model[:beam] ("small.en:5,base.en,tiny.en").
+# Each job gets the best tier whose predicted finish time (its decode plus the queue ahead
+# of it) fits ASR_LATENCY_SLO_SECONDS, else the fastest. Empty: always WHISPER_CONFIG's model.
+ASR_MODEL_TIERS = _env_list("ASR_MODEL_TIERS", "")
+ASR_LATENCY_SLO_SECONDS = float(os.getenv("ASR_LATENCY_SLO_SECONDS", "300"))
+
+# Recordings at least ASR_PREVIEW_MIN_SECONDS long (0 disables) are first transcribed with
+# ASR_PREVIEW_MODEL (model[:beam], or "vosk") and their labels published right away; a
+# refinement pass with the regular model replaces them when no new uploads are waiting.
+ASR_PREVIEW_MIN_SECONDS = float(os.getenv("ASR_PREVIEW_MIN_SECONDS", "0"))
+ASR_PREVIEW_MODEL = os.getenv("ASR_PREVIEW_MODEL", "tiny.en").strip()
+
+# Pipeline workers. "inline" runs JOB_WORKERS threads inside every web process;
+# "external" leaves execution to `manage.py run_workers` and the web tier only enqueues.
+JOB_RUNNER = os.getenv("JOB_RUNNER", "inline").strip().lower()
+# Inline workers start in gunicorn workers and runserver only; set this to also start
+# them when Django starts under another server (e.g. plain uvicorn or daphne)
+JOB_SCHEDULER_AUTOSTART = _env_bool("JOB_SCHEDULER_AUTOSTART", False)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "2"))
+JOB_HEARTBEAT_SECONDS = float(os.getenv("JOB_HEARTBEAT_SECONDS", "15"))
+# A RUNNING job whose lease lapses (worker crashed) is re-queued up to JOB_MAX_ATTEMPTS
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "120"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_REAP_SECONDS = float(os.getenv("JOB_REAP_SECONDS", "60"))
+# Longest a GET /api/jobs/status/?wait= long-poll is held waiting for a change (ASGI only)
+JOB_STATUS_MAX_WAIT_SECONDS = float(os.getenv("JOB_STATUS_MAX_WAIT_SECONDS", "25"))
+# /api/jobs/events/ (ASGI only): how often the broadcaster checks for changed jobs
+# written by other processes, and the keep-alive comment interval on idle streams
+JOB_EVENTS_POLL_SECONDS = float(os.getenv("JOB_EVENTS_POLL_SECONDS", "1"))
+JOB_EVENTS_KEEPALIVE_SECONDS = float(os.getenv("JOB_EVENTS_KEEPALIVE_SECONDS", "15"))
+
+# Node-local inference server (`manage.py run_inference_server`) owning one copy of the
+# models. Set INFERENCE_ADDRESS (socket path or host:port) on web/worker processes to
+# send transcribe/classify calls there instead of loading the models in-process.
+INFERENCE_ADDRESS = os.getenv("INFERENCE_ADDRESS", "").strip()
+INFERENCE_AUTHKEY = os.getenv("INFERENCE_AUTHKEY", SECRET_KEY)
 
 
 RAW_VOSK = os.environ.get("VOSK_MODEL_DIR", "").strip()
@@ -0,0 +1,59 @@
+"""
+Gunicorn settings for the API image (read automatically from ./gunicorn.conf.py
+after `--chdir backend`).
+
+With PRELOAD_MODELS=1 the Django app, and with it the label models, is loaded
+once in the master (preload_app) and the heap is frozen before forking, so
+every worker shares those pages copy-on-write instead of loading its own
+copy. Whisper is warmed in each worker right after fork, and each worker starts
+its inline job scheduler once it has loaded the app.
+
+The image runs the ASGI app on uvicorn workers (-k uvicorn_worker.UvicornWorker).
+/api/jobs/events/ streams and /api/jobs/status/ long-polls are coroutines on
+the worker's event loop, and their queries run on the loop's own thread pool
+(apps/api/views.py), so they never queue behind a sync view. Every other
+endpoint is a sync view, which Django hands to asgiref's thread-sensitive
+executor; `threads` has no effect on uvicorn workers, so add workers (-w) to
+serve more sync requests at once. GUNICORN_THREADS only sizes the gthread
+workers used when serving core.wsgi, where the status endpoint answers at once
+instead of holding a thread.
+"""
+import gc
+import os
+import threading
+
+_preload = os.getenv("PRELOAD_MODELS", "").strip().lower() in {"1", "true", "yes"}
+
+preload_app = _preload
+threads = int(os.getenv("GUNICORN_THREADS", "4"))  # core.wsgi only
+
+
+def when_ready(server):
+    if preload_app:
+        # Keep the GC from touching (and so copying) objects loaded in the master.
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    if not _preload:
+        return
+    from services.pipeline.steps import preload_models
+
+    def warm():
+        try:
+            preload_models(whisper=True)
+        except Exception:
+            server.log.exception("Whisper warm-up failed in worker %s", worker.pid)
+
+    # In the background so a slow model load doesn't trip the worker timeout;
+    # a job arriving meanwhile waits for the same load.
+    threading.Thread(target=warm, name="whisper-warmup", daemon=True).start()
+
+
+def post_worker_init(worker):
+    # The app is loaded (in the master, with preload_app), so Django is set up.
+    # Each worker starts its own inline job scheduler here: threads started in
+    # the master would not survive the fork.
+    from apps.web.jobs import get_scheduler
+
+    get_scheduler()
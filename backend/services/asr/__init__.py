@@ -1,4 +1,5 @@
 from .vosk_engine import VoskASREngine
 from .asr_whisper import WhisperASREngine
+from .registry import EngineRegistry, whisper_engines
 
-__all__ = ["VoskASREngine", "WhisperASREngine"]
+__all__ = ["VoskASREngine", "WhisperASREngine", "EngineRegistry", "whisper_engines"]
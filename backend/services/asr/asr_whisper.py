@@ -1,8 +1,10 @@
 import json
 import wave
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 from faster_whisper import WhisperModel
 
 
@@ -18,6 +20,8 @@ class WhisperASREngine:
       - sample_rate: int
     """
 
+    SAMPLE_RATE = 16000  # rate faster-whisper expects for in-memory arrays
+
     def __init__(
         self,
         model_name_or_path: str = "tiny",   # "tiny", "base", "small", "medium", "large-v3" or local path
@@ -27,27 +31,42 @@ class WhisperASREngine:
         beam_size: int = 1,                 # beam search size (1 = greedy, fastest)
         vad_filter: bool = True,            # remove long silences before decoding
         enable_word_timestamps: bool = False,  # set True if you want per-word timings
+        num_workers: int = 1,               # concurrent transcribe() calls served by one model
     ):
-        # Choose sensible defaults based on device
-        if device is None:
-            device = "cuda" if self._has_cuda() else "cpu"
-
-        if compute_type is None:
-            # Fast defaults
-            compute_type = "int8_float16" if device == "cuda" else "int8"
+        device, compute_type = self.resolve_device(device, compute_type)
 
         self.model = WhisperModel(
             model_name_or_path,
             device=device,
             compute_type=compute_type,
+            num_workers=max(1, int(num_workers)),
             # download_root=None,  # set if you want a custom cache dir
         )
+        self.model_name_or_path = model_name_or_path
+        self.device = device
+        self.compute_type = compute_type
         self.language = language
         self.beam_size = beam_size
         self.vad_filter = vad_filter
         self.enable_word_timestamps = enable_word_timestamps
 
+    @classmethod
+    def resolve_device(
+        cls, device: Optional[str] = None, compute_type: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Fill in the auto-chosen device / compute_type (used for cache keys too)."""
+        # Choose sensible defaults based on device
+        if device is None:
+            device = "cuda" if cls._has_cuda() else "cpu"
+
+        if compute_type is None:
+            # Fast defaults
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+
+        return device, compute_type
+
     @staticmethod
+    @lru_cache(maxsize=1)
     def _has_cuda() -> bool:
         try:
             import torch
@@ -55,22 +74,32 @@ class WhisperASREngine:
         except Exception:
             return False
 
-    def transcribe(self, wav_path: str) -> Dict[str, Any]:
+    def transcribe(
+        self,
+        audio: Union[str, np.ndarray],
+        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
         """
-        Transcribe a mono PCM16 WAV (8k/16k/…—Whisper resamples internally if needed).
+        Transcribe a mono PCM16 WAV (8k/16k/…—Whisper resamples internally if needed)
+        or a float32 16 kHz mono sample buffer already decoded in memory.
+        `on_segment` is called with each segment dict as Whisper yields it.
         Returns a dict with the same keys your pipeline expects.
         """
-        wav_p = Path(wav_path)
-
-        # Basic header info for sample_rate and a fallback duration
-        with wave.open(str(wav_p), "rb") as wf:
-            sample_rate = wf.getframerate()
-            frames = wf.getnframes()
-            duration_from_header = frames / float(sample_rate) if sample_rate else 0.0
+        if isinstance(audio, np.ndarray):
+            sample_rate = self.SAMPLE_RATE
+            duration_from_header = len(audio) / float(sample_rate)
+            source = audio
+        else:
+            # Basic header info for sample_rate and a fallback duration
+            with wave.open(str(Path(audio)), "rb") as wf:
+                sample_rate = wf.getframerate()
+                frames = wf.getnframes()
+                duration_from_header = frames / float(sample_rate) if sample_rate else 0.0
+            source = str(audio)
 
         # Run Whisper
         segments_iter, info = self.model.transcribe(
-            str(wav_p),
+            source,
             language=self.language,
             beam_size=self.beam_size,
             vad_filter=self.vad_filter,
@@ -80,35 +109,52 @@ class WhisperASREngine:
             # vad_parameters=dict(min_silence_duration_ms=200),
         )
 
-        segments = []
-        words_flat = []
-        last_end = 0.0
+        def segments():
+            for s in segments_iter:
+                seg = self.segment_dict(s)
+                if on_segment:
+                    on_segment(seg)
+                yield seg
+
+        return self.build_transcript(segments(), duration_from_header, sample_rate)
+
+    def segment_dict(self, s, offset: float = 0.0) -> Dict[str, Any]:
+        """Convert a faster-whisper Segment, shifting its times back by `offset`."""
 
         def word_obj(w) -> Dict[str, Any]:
             # faster-whisper word has .start, .end, .word, .probability
             return {
                 "word": getattr(w, "word", ""),
-                "start": float(getattr(w, "start", 0.0) or 0.0),
-                "end": float(getattr(w, "end", 0.0) or 0.0),
+                "start": float(getattr(w, "start", 0.0) or 0.0) - offset,
+                "end": float(getattr(w, "end", 0.0) or 0.0) - offset,
                 "prob": float(getattr(w, "probability", 0.0) or 0.0),
             }
 
-        for s in segments_iter:
-            seg = {
-                "text": s.text or "",
-                "start": float(s.start or 0.0),
-                "end": float(s.end or 0.0),
-            }
-            last_end = max(last_end, seg["end"])
+        seg = {
+            "text": s.text or "",
+            "start": float(s.start or 0.0) - offset,
+            "end": float(s.end or 0.0) - offset,
+        }
+
+        # Align with your Vosk-style "result" list
+        if self.enable_word_timestamps and getattr(s, "words", None):
+            seg["result"] = [word_obj(w) for w in s.words]
+        else:
+            seg["result"] = []  # keep key present for compatibility
+        return seg
 
-            # Align with your Vosk-style "result" list
-            if self.enable_word_timestamps and getattr(s, "words", None):
-                words = [word_obj(w) for w in s.words]
-                seg["result"] = words
-                words_flat.extend(words)
-            else:
-                seg["result"] = []  # keep key present for compatibility
+    @staticmethod
+    def build_transcript(
+        segments_iter: Iterable[Dict[str, Any]], duration_from_header: float, sample_rate: int
+    ) -> Dict[str, Any]:
+        """Assemble segment dicts into the transcript schema shared with Vosk."""
+        segments = []
+        words_flat = []
+        last_end = 0.0
 
+        for seg in segments_iter:
+            last_end = max(last_end, seg["end"])
+            words_flat.extend(seg["result"])
             segments.append(seg)
 
         text_full = " ".join((seg["text"] or "").strip() for seg in segments).strip()
@@ -125,4 +171,3 @@ class WhisperASREngine:
             # "detected_language": getattr(info, "language", None),
             # "language_probability": getattr(info, "language_probability", None),
         }
-
@@ -0,0 +1,178 @@
+"""
+Batched Whisper inference shared by concurrent callers.
+
+Every job (or every chunk of a long job) normally runs its own greedy
+transcribe() call, so CTranslate2 only ever sees batches of one. A
+WhisperBatcher sits in front of a WhisperASREngine: callers block in
+transcribe() while a dispatcher thread collects requests for up to
+`max_wait_ms`, splits each buffer into speech clips with the engine's VAD,
+lays all clips out on one timeline and decodes them `batch_size` at a time
+through faster-whisper's BatchedInferencePipeline. Segments are then routed
+back to the request whose span they fall in, with request-relative times,
+and each caller is released as soon as the decode has moved past its clips.
+
+Buffers longer than `max_audio_sec` are not batched: they go straight to
+engine.transcribe() in the caller's thread, so a long upload is never copied
+onto the shared timeline and short clips never wait behind its decode.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .asr_whisper import WhisperASREngine
+
+log = logging.getLogger(__name__)
+
+MAX_CLIP_SEC = 30.0  # Whisper's context window
+
+
+class WhisperBatcher:
+    def __init__(
+        self,
+        engine: WhisperASREngine,
+        batch_size: int = 8,
+        max_wait_ms: float = 50.0,
+        max_requests: int = 16,
+        idle_timeout: float = 30.0,
+        max_audio_sec: float = 180.0,
+    ):
+        from faster_whisper import BatchedInferencePipeline
+
+        self.engine = engine
+        self.pipeline = BatchedInferencePipeline(model=engine.model)
+        self.batch_size = max(1, int(batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.max_requests = max(1, int(max_requests))
+        self.idle_timeout = float(idle_timeout)
+        self.max_audio_len = int(max(0.0, float(max_audio_sec)) * engine.SAMPLE_RATE)
+        self._queue: "queue.Queue[Tuple[np.ndarray, Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    # ------------- public API -------------
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Blocking, engine-compatible transcribe() for a 16 kHz float32 buffer."""
+        if not isinstance(audio, np.ndarray) or len(audio) > self.max_audio_len:
+            # Files and long buffers go straight to the engine; only short
+            # in-memory audio is batched.
+            return self.engine.transcribe(audio, on_segment=on_segment)
+        fut: Future = Future()
+        self._queue.put((audio, fut))
+        self._ensure_dispatcher()
+        transcript = fut.result()
+        for seg in transcript["segments"] if on_segment else []:
+            on_segment(seg)
+        return transcript
+
+    # ------------- dispatcher -------------
+    def _ensure_dispatcher(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._dispatch, name="whisper-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def _collect(self) -> List[Tuple[np.ndarray, Future]]:
+        """Wait for a first request, then gather more until the wait budget runs out."""
+        first = self._queue.get(timeout=self.idle_timeout)
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_requests:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _dispatch(self) -> None:
+        while True:
+            try:
+                batch = self._collect()
+            except queue.Empty:
+                # Idle: let the thread (and its engine reference) go. A request
+                # racing with this exit restarts the dispatcher.
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+
+            try:
+                self._run(batch)
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+
+    # ------------- inference -------------
+    def _clips(self, audio: np.ndarray) -> List[Tuple[int, int]]:
+        """Speech spans (samples) no longer than one Whisper window."""
+        sr = self.engine.SAMPLE_RATE
+        max_len = int(MAX_CLIP_SEC * sr)
+        if self.engine.vad_filter:
+            from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+            spans = get_speech_timestamps(
+                audio, VadOptions(max_speech_duration_s=MAX_CLIP_SEC, min_silence_duration_ms=160)
+            )
+            return [(s["start"], s["end"]) for s in spans]
+        return [(i, min(len(audio), i + max_len)) for i in range(0, len(audio), max_len)]
+
+    def _run(self, batch: List[Tuple[np.ndarray, Future]]) -> None:
+        """Decode the batch, resolving each request's future once its clips are done."""
+        sr = self.engine.SAMPLE_RATE
+        offsets: List[int] = []
+        clips: List[Dict[str, float]] = []
+        pos = 0
+        for audio, _ in batch:
+            offsets.append(pos)
+            for start, end in self._clips(audio):
+                clips.append({"start": (pos + start) / sr, "end": (pos + end) / sr})
+            pos += len(audio)
+
+        per_request: List[List[Dict[str, Any]]] = [[] for _ in batch]
+        done = 0
+
+        def finish(upto: int) -> None:
+            # Clips decode in timeline order, so every request before `upto` is complete.
+            nonlocal done
+            for i in range(done, upto):
+                audio, fut = batch[i]
+                fut.set_result(self.engine.build_transcript(per_request[i], len(audio) / float(sr), sr))
+            done = max(done, upto)
+
+        if clips:
+            timeline = np.concatenate([audio for audio, _ in batch])
+            segments_iter, _info = self.pipeline.transcribe(
+                timeline,
+                language=self.engine.language,
+                beam_size=self.engine.beam_size,
+                word_timestamps=self.engine.enable_word_timestamps,
+                without_timestamps=False,
+                clip_timestamps=clips,
+                batch_size=self.batch_size,
+            )
+            bounds = np.array(offsets[1:]) / sr
+            for s in segments_iter:
+                idx = max(done, int(np.searchsorted(bounds, float(s.start or 0.0), side="right")))
+                finish(idx)
+                per_request[idx].append(self.engine.segment_dict(s, offset=offsets[idx] / sr))
+            log.debug("Batched %d requests / %d clips", len(batch), len(clips))
+
+        finish(len(batch))
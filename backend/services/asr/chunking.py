@@ -0,0 +1,205 @@
+"""
+Split long recordings into overlapping chunks and transcribe them in parallel.
+
+A single transcribe() call decodes a file serially, so a long upload keeps one
+decoder busy for its whole duration. Here the buffer is cut near every
+`chunk_sec` mark at the quietest frame within `search_sec` (so cuts land in
+pauses rather than mid-word), neighbouring chunks share `overlap_sec` of audio,
+and the chunks are decoded concurrently. Segments are shifted back to absolute
+times and each overlap is split at its midpoint so every stretch of audio is
+reported by exactly one chunk.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+FRAME_SEC = 0.03  # energy window used to find pauses
+
+
+def find_quiet_point(audio: np.ndarray, lo: int, hi: int, sample_rate: int = SAMPLE_RATE) -> int:
+    """Sample index of the lowest-energy frame in audio[lo:hi]."""
+    frame = max(1, int(FRAME_SEC * sample_rate))
+    window = audio[lo:hi]
+    n = len(window) // frame
+    if n < 2:
+        return (lo + hi) // 2
+    energy = np.square(window[: n * frame].reshape(n, frame)).mean(axis=1)
+    # Cut in the middle of the quietest stretch, not at its first frame.
+    best = int(np.argmin(energy))
+    last = best
+    while last + 1 < n and energy[last + 1] <= energy[best]:
+        last += 1
+    return lo + ((best + last) // 2) * frame + frame // 2
+
+
+def plan_chunks(
+    audio: np.ndarray,
+    chunk_sec: float = 120.0,
+    overlap_sec: float = 2.0,
+    search_sec: float = 5.0,
+    sample_rate: int = SAMPLE_RATE,
+) -> List[Tuple[int, int, int, int]]:
+    """
+    Return (start, end, own_start, own_end) sample ranges.
+
+    [start, end) is the audio handed to the decoder; [own_start, own_end) is the
+    part of the timeline whose segments this chunk is responsible for.
+    """
+    total = len(audio)
+    size = int(chunk_sec * sample_rate)
+    if total <= size:
+        return [(0, total, 0, total)]
+
+    half = int(overlap_sec * sample_rate) // 2
+    search = int(search_sec * sample_rate)
+
+    cuts = [0]
+    while total - cuts[-1] > size + search:
+        target = cuts[-1] + size
+        cuts.append(find_quiet_point(audio, target - search, target + search, sample_rate))
+    cuts.append(total)
+
+    chunks = []
+    for i in range(len(cuts) - 1):
+        own_start, own_end = cuts[i], cuts[i + 1]
+        start = max(0, own_start - half)
+        end = min(total, own_end + half)
+        chunks.append((start, end, own_start, own_end))
+    return chunks
+
+
+def _shift_words(words: List[Dict[str, Any]], offset: float) -> List[Dict[str, Any]]:
+    out = []
+    for w in words or []:
+        w = dict(w)
+        for k in ("start", "end"):
+            if w.get(k) is not None:
+                w[k] = round(float(w[k]) + offset, 3)
+        out.append(w)
+    return out
+
+
+def _segment_span(seg: Dict[str, Any]) -> Tuple[float | None, float | None]:
+    start, end = seg.get("start"), seg.get("end")
+    res = seg.get("result") or []
+    if (start is None or end is None) and res:
+        start = res[0].get("start", start)
+        end = res[-1].get("end", end)
+    return start, end
+
+
+def _norm_text(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+class Stitcher:
+    """
+    Merge per-chunk transcripts, fed in timeline order, into one transcript on
+    the absolute timeline. add() returns the segments kept from that chunk so
+    callers can stream them out before later chunks finish.
+    """
+
+    def __init__(self, total_samples: int, sample_rate: int = SAMPLE_RATE):
+        self.total_samples = total_samples
+        self.sample_rate = sample_rate
+        self.segments: List[Dict[str, Any]] = []
+        self.words: List[Dict[str, Any]] = []
+        self.chunks = 0
+        self._base: Dict[str, Any] = {}
+
+    def add(self, chunk: Tuple[int, int, int, int], transcript: Dict[str, Any]) -> List[Dict[str, Any]]:
+        start, _end, own_start, own_end = chunk
+        sr = float(self.sample_rate)
+        if not self._base:
+            self._base = transcript
+        self.chunks += 1
+        offset = start / sr
+        own_lo, own_hi = own_start / sr, own_end / sr
+
+        kept = []
+        for seg in transcript.get("segments", []):
+            seg = dict(seg)
+            if seg.get("start") is not None:
+                seg["start"] = round(float(seg["start"]) + offset, 3)
+            if seg.get("end") is not None:
+                seg["end"] = round(float(seg["end"]) + offset, 3)
+            seg["result"] = _shift_words(seg.get("result") or [], offset)
+
+            s, e = _segment_span(seg)
+            if s is not None and e is not None:
+                mid = (float(s) + float(e)) / 2.0
+                if not (own_lo <= mid < own_hi or (own_end == self.total_samples and mid >= own_lo)):
+                    continue  # the neighbouring chunk owns this stretch
+
+            # Drop a repeat of the previous segment straddling the cut.
+            if self.segments and _norm_text(seg.get("text", "")) == _norm_text(self.segments[-1].get("text", "")):
+                prev_end = _segment_span(self.segments[-1])[1]
+                if prev_end is None or s is None or float(s) <= float(prev_end):
+                    continue
+
+            self.segments.append(seg)
+            self.words.extend(seg["result"])
+            kept.append(seg)
+        return kept
+
+    def result(self) -> Dict[str, Any]:
+        text_full = " ".join((seg.get("text") or "").strip() for seg in self.segments).strip()
+        return {
+            **{k: v for k, v in self._base.items() if k not in {"segments", "words", "text", "duration_sec"}},
+            "text": text_full,
+            "segments": self.segments,
+            "words": self.words,
+            "duration_sec": round(self.total_samples / float(self.sample_rate), 3),
+            "sample_rate": self.sample_rate,
+            "chunks": self.chunks,
+        }
+
+
+def stitch(
+    parts: List[Tuple[Tuple[int, int, int, int], Dict[str, Any]]],
+    total_samples: int,
+    sample_rate: int = SAMPLE_RATE,
+) -> Dict[str, Any]:
+    """Merge per-chunk transcripts into one transcript on the absolute timeline."""
+    stitcher = Stitcher(total_samples, sample_rate)
+    for chunk, transcript in parts:
+        stitcher.add(chunk, transcript)
+    return stitcher.result()
+
+
+def transcribe_chunked(
+    transcribe: Callable[[np.ndarray], Dict[str, Any]],
+    audio: np.ndarray,
+    max_workers: int = 2,
+    chunk_sec: float = 120.0,
+    overlap_sec: float = 2.0,
+    search_sec: float = 5.0,
+    sample_rate: int = SAMPLE_RATE,
+    on_segment: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Transcribe `audio` chunk-by-chunk on a thread pool (the decoders release
+    the GIL) and return one stitched transcript in the engine's schema.
+    `on_segment` receives stitched segments in timeline order as soon as every
+    earlier chunk has finished.
+    """
+    chunks = plan_chunks(audio, chunk_sec, overlap_sec, search_sec, sample_rate)
+    if len(chunks) == 1:
+        transcript = transcribe(audio)
+        for seg in transcript.get("segments", []) if on_segment else []:
+            on_segment(seg)
+        return transcript
+
+    stitcher = Stitcher(len(audio), sample_rate)
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="asr-chunk") as pool:
+        futures = [pool.submit(transcribe, audio[c[0]:c[1]]) for c in chunks]
+        for chunk, fut in zip(chunks, futures):
+            for seg in stitcher.add(chunk, fut.result()):
+                if on_segment:
+                    on_segment(seg)
+    return stitcher.result()
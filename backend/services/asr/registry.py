@@ -0,0 +1,143 @@
+"""
+Process-wide cache of loaded ASR engines.
+
+Building a WhisperASREngine loads the faster-whisper model from disk (and may
+download it), which dominates wall time for short clips. The registry keeps a
+small LRU of ready engines keyed by their full configuration so every pipeline
+thread in the process reuses the same instance.
+
+    engine = whisper_engines.get(model_name_or_path="tiny.en", language="en")
+    whisper_engines.warm(...)     # load ahead of the first job
+    whisper_engines.unload(...)   # drop one config (e.g. after a model swap)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .asr_whisper import WhisperASREngine
+
+log = logging.getLogger(__name__)
+
+
+class EngineKey(NamedTuple):
+    model_name_or_path: str
+    device: str
+    compute_type: str
+    language: Optional[str]
+    beam_size: int
+    vad_filter: bool
+    enable_word_timestamps: bool
+    num_workers: int
+
+
+def whisper_key(
+    model_name_or_path: str = "tiny",
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None,
+    language: Optional[str] = None,
+    beam_size: int = 1,
+    vad_filter: bool = True,
+    enable_word_timestamps: bool = False,
+    num_workers: int = 1,
+) -> EngineKey:
+    """Normalise WhisperASREngine kwargs into a hashable cache key."""
+    device, compute_type = WhisperASREngine.resolve_device(device, compute_type)
+    return EngineKey(
+        str(model_name_or_path),
+        device,
+        compute_type,
+        language,
+        int(beam_size),
+        bool(vad_filter),
+        bool(enable_word_timestamps),
+        max(1, int(num_workers)),
+    )
+
+
+class EngineRegistry:
+    """
+    Thread-safe, size-bounded LRU of ASR engines.
+
+    Loading happens outside the registry lock (behind a per-key lock), so a slow
+    model load never blocks threads that only need an already-cached engine,
+    and two threads asking for the same config only load it once.
+    Evicted engines are simply dereferenced; jobs still holding one keep
+    using it until they finish.
+    """
+
+    def __init__(self, factory: Callable[..., Any], max_size: int = 2):
+        self._factory = factory
+        self._max_size = max(1, int(max_size))
+        self._lock = threading.Lock()
+        self._engines: "OrderedDict[EngineKey, Any]" = OrderedDict()
+        self._loading: Dict[EngineKey, threading.Lock] = {}
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def resize(self, max_size: int) -> None:
+        with self._lock:
+            self._max_size = max(1, int(max_size))
+            self._evict_locked()
+
+    def get(self, **config) -> Any:
+        """Return the engine for this config, loading it on first use."""
+        key = whisper_key(**config)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                return engine
+            load_lock = self._loading.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Another thread may have finished loading while we waited.
+            with self._lock:
+                engine = self._engines.get(key)
+                if engine is not None:
+                    self._engines.move_to_end(key)
+                    return engine
+
+            log.info("Loading ASR engine %s", key)
+            try:
+                engine = self._factory(**key._asdict())
+            except Exception:
+                with self._lock:
+                    self._loading.pop(key, None)
+                raise
+
+            with self._lock:
+                self._engines[key] = engine
+                self._loading.pop(key, None)
+                self._evict_locked()
+        return engine
+
+    # Explicit hook for startup code; identical to get() but reads better.
+    warm = get
+
+    def unload(self, **config) -> bool:
+        """Drop the engine for this config. Returns True if one was cached."""
+        key = whisper_key(**config)
+        with self._lock:
+            return self._engines.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._engines.clear()
+
+    def keys(self) -> List[EngineKey]:
+        with self._lock:
+            return list(self._engines.keys())
+
+    def _evict_locked(self) -> None:
+        while len(self._engines) > self._max_size:
+            key, _ = self._engines.popitem(last=False)
+            log.info("Evicted ASR engine %s", key)
+
+
+whisper_engines = EngineRegistry(WhisperASREngine)
@@ -0,0 +1,99 @@
+"""
+Per-job Whisper model selection.
+
+Bigger Whisper models transcribe better but decode several times slower, and
+a job's latency is its own decode plus the decodes queued ahead of it. The
+AsrRouter keeps a list of tiers, best first:
+
+    router = AsrRouter([AsrChoice("small.en", 5), AsrChoice("base.en", 1),
+                        AsrChoice("tiny.en", 1)], slo_seconds=300, workers=2)
+    choice = router.choose(duration_sec=600, queued=3)
+
+and picks the best tier whose predicted latency fits the SLO. When nothing
+fits it falls back to the fastest tier. Predictions use a real-time factor
+per tier: a built-in CPU estimate at first, then a moving average of the
+decodes reported through observe().
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, NamedTuple, Sequence
+
+# Seconds of CPU decode per second of audio (faster-whisper, int8, greedy).
+DEFAULT_RTF = {"tiny": 0.05, "base": 0.1, "small": 0.3, "medium": 0.8, "large": 1.6}
+UNKNOWN_RTF = 0.5
+BEAM_COST = 0.15  # extra decode time per additional beam
+
+
+class AsrChoice(NamedTuple):
+    model: str
+    beam_size: int = 1
+
+    @classmethod
+    def parse(cls, spec: str) -> "AsrChoice":
+        """"small.en:5" -> AsrChoice("small.en", 5); the beam defaults to greedy."""
+        model, _, beam = spec.strip().partition(":")
+        return cls(model, int(beam) if beam else 1)
+
+    def __str__(self) -> str:
+        return self.model if self.beam_size <= 1 else f"{self.model}:{self.beam_size}"
+
+
+def default_rtf(choice: AsrChoice) -> float:
+    size = choice.model.rsplit("/", 1)[-1].split(".")[0].split("-")[0]
+    rtf = DEFAULT_RTF.get(size, UNKNOWN_RTF)
+    return rtf * (1 + BEAM_COST * (max(1, choice.beam_size) - 1))
+
+
+class AsrRouter:
+    def __init__(
+        self,
+        tiers: Sequence[AsrChoice],
+        slo_seconds: float,
+        workers: int = 1,
+        smoothing: float = 0.2,
+    ):
+        if not tiers:
+            raise ValueError("AsrRouter needs at least one tier.")
+        self.tiers = list(tiers)
+        self.slo_seconds = float(slo_seconds)
+        self.workers = max(1, int(workers))
+        self.smoothing = float(smoothing)
+        self._rtf: Dict[AsrChoice, float] = {t: default_rtf(t) for t in self.tiers}
+        self._lock = threading.Lock()
+
+    def rtf(self, choice: AsrChoice) -> float:
+        with self._lock:
+            return self._rtf.get(choice) or default_rtf(choice)
+
+    def estimate(self, choice: AsrChoice, duration_sec: float, queued: int = 0) -> float:
+        """
+        Predicted seconds until a job of `duration_sec` finishes, assuming the
+        `queued` jobs ahead of it are similar and decoded with the same tier.
+        """
+        decode = duration_sec * self.rtf(choice)
+        return decode * (1 + max(0, queued) / self.workers)
+
+    def choose(self, duration_sec: float, queued: int = 0) -> AsrChoice:
+        for choice in self.tiers:
+            if self.estimate(choice, duration_sec, queued) <= self.slo_seconds:
+                return choice
+        return min(self.tiers, key=self.rtf)
+
+    def observe(self, choice: AsrChoice, duration_sec: float, elapsed_sec: float) -> None:
+        """Fold a finished decode into the tier's real-time factor."""
+        if duration_sec <= 0 or elapsed_sec <= 0:
+            return
+        sample = elapsed_sec / duration_sec
+        with self._lock:
+            old = self._rtf.get(choice, sample)
+            self._rtf[choice] = old + self.smoothing * (sample - old)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {str(t): round(self._rtf.get(t, 0.0), 4) for t in self.tiers}
+
+
+def parse_tiers(specs: Sequence[str]) -> List[AsrChoice]:
+    return [AsrChoice.parse(s) for s in specs if s.strip()]
@@ -1,7 +1,9 @@
 import json
 import wave
 from pathlib import Path
+from typing import Callable, Iterable
 
+import numpy as np
 from vosk import KaldiRecognizer, Model
 
 
@@ -25,32 +27,38 @@ class VoskASREngine:
                 raise FileNotFoundError(f"Vosk model not found at {model_dir}")
             self.model = Model(str(model_dir))
 
-    def transcribe(self, wav_path: str) -> dict:
-        """Transcribe a normalized mono 16-bit WAV file into JSON transcript."""
-        with wave.open(wav_path, "rb") as wf:
-            if (
-                wf.getnchannels() != 1
-                or wf.getsampwidth() != 2
-                or wf.getframerate() not in [8000, 16000]
-            ):
-                raise ValueError("Input WAV must be mono PCM16 with 8k/16k sample rate")
-
-            sample_rate = wf.getframerate()
-            frames = wf.getnframes()
-            duration_from_header = frames / float(sample_rate) if sample_rate else 0.0
-
-            rec = KaldiRecognizer(self.model, sample_rate)
-            rec.SetWords(True)
+    def transcribe(
+        self,
+        audio: str | np.ndarray,
+        on_segment: Callable[[dict], None] | None = None,
+    ) -> dict:
+        """
+        Transcribe a normalized mono 16-bit WAV file, or a float32 16 kHz mono
+        sample buffer decoded in memory, into JSON transcript.
+        `on_segment` is called with each Kaldi result chunk as it is finalised.
+        """
+        if isinstance(audio, np.ndarray):
+            sample_rate = 16000
+            duration_from_header = len(audio) / float(sample_rate)
+            pcm = (np.clip(audio, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+            step = 4000 * 2  # 4000 frames of 16-bit samples
+            chunks = (pcm[i:i + step] for i in range(0, len(pcm), step))
+            segments = self._recognize(chunks, sample_rate, on_segment)
+        else:
+            with wave.open(audio, "rb") as wf:
+                if (
+                    wf.getnchannels() != 1
+                    or wf.getsampwidth() != 2
+                    or wf.getframerate() not in [8000, 16000]
+                ):
+                    raise ValueError("Input WAV must be mono PCM16 with 8k/16k sample rate")
 
-            segments = []
-            while True:
-                data = wf.readframes(4000)
-                if len(data) == 0:
-                    break
-                if rec.AcceptWaveform(data):
-                    segments.append(json.loads(rec.Result()))
+                sample_rate = wf.getframerate()
+                frames = wf.getnframes()
+                duration_from_header = frames / float(sample_rate) if sample_rate else 0.0
 
-            segments.append(json.loads(rec.FinalResult()))
+                chunks = iter(lambda: wf.readframes(4000), b"")
+                segments = self._recognize(chunks, sample_rate, on_segment)
 
         # Build overall text
         overall_text = " ".join(s.get("text", "") for s in segments).strip()
@@ -82,3 +90,25 @@ class VoskASREngine:
             "sample_rate": sample_rate,
         }
         return transcript
+
+    def _recognize(
+        self,
+        chunks: Iterable[bytes],
+        sample_rate: int,
+        on_segment: Callable[[dict], None] | None = None,
+    ) -> list:
+        """Feed PCM16 byte chunks to Kaldi and collect its result segments."""
+        rec = KaldiRecognizer(self.model, sample_rate)
+        rec.SetWords(True)
+
+        segments = []
+        for data in chunks:
+            if rec.AcceptWaveform(data):
+                segments.append(json.loads(rec.Result()))
+                if on_segment:
+                    on_segment(segments[-1])
+
+        segments.append(json.loads(rec.FinalResult()))
+        if on_segment:
+            on_segment(segments[-1])
+        return segments
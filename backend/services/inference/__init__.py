@@ -0,0 +1,4 @@
+from .client import InferenceClient, InferenceError
+from .server import InferenceServer
+
+__all__ = ["InferenceClient", "InferenceError", "InferenceServer"]
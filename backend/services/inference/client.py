@@ -0,0 +1,91 @@
+"""
+Client for the local inference server (see server.py).
+
+Every call opens its own connection (cheap on a Unix socket), so the client is
+safe to share between pipeline threads.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from multiprocessing.connection import Client, Connection
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .protocol import parse_address
+
+
+class InferenceError(RuntimeError):
+    """The server is unreachable or a remote call failed."""
+
+
+class InferenceClient:
+    def __init__(self, address: str, authkey: bytes):
+        self.address = address
+        self._address = parse_address(address)
+        self._authkey = authkey
+
+    @contextmanager
+    def _connect(self):
+        try:
+            conn = Client(self._address, authkey=self._authkey)
+        except (OSError, EOFError) as e:
+            raise InferenceError(f"Inference server unavailable at {self.address}: {e}") from e
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _call(
+        self,
+        op: str,
+        payload: Any = None,
+        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Any:
+        with self._connect() as conn:
+            conn.send((op, payload))
+            return self._wait(conn, on_segment)
+
+    @staticmethod
+    def _wait(conn: Connection, on_segment) -> Any:
+        while True:
+            try:
+                kind, value = conn.recv()
+            except EOFError as e:
+                raise InferenceError("Inference server closed the connection.") from e
+            if kind == "segment":
+                if on_segment:
+                    on_segment(value)
+            elif kind == "ok":
+                return value
+            else:
+                raise InferenceError(value)
+
+    # ------------- public API -------------
+    def ping(self) -> Dict[str, Any]:
+        return self._call("ping")
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None,
+        asr: Any = None,
+    ) -> Dict[str, Any]:
+        """
+        Transcribe a 16 kHz float32 buffer; segments stream to `on_segment`.
+        `asr` (an AsrChoice) selects the server's Whisper model and beam size.
+        """
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        return self._call("transcribe", (audio, asr), on_segment)
+
+    def classify(self, texts: Sequence[str]) -> Tuple[List[str], str]:
+        """
+        One label per text plus the server's label model version that produced
+        them (see services.label.stage.label_texts).
+        """
+        return tuple(self._call("classify", list(texts)))
+
+    def label_version(self) -> str:
+        """The server's active label model version."""
+        return self._call("label_version")
@@ -0,0 +1,22 @@
+"""
+Wire format shared by the inference server and client.
+
+Messages are pickled tuples over an authenticated multiprocessing connection:
+  request:  (op, payload)      op in {"ping", "transcribe", "classify"}
+  replies:  ("segment", seg)*  zero or more, transcribe only
+            ("ok", result) | ("error", message)
+"""
+
+from __future__ import annotations
+
+from typing import Tuple, Union
+
+Address = Union[str, Tuple[str, int]]
+
+
+def parse_address(address: str) -> Address:
+    """"host:port" → TCP tuple; anything else is a Unix socket path."""
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and "/" not in address:
+        return (host or "127.0.0.1", int(port))
+    return address
@@ -0,0 +1,101 @@
+"""
+Local inference server: one copy of the Whisper and label models per node.
+
+Web and worker processes configured with settings.INFERENCE_ADDRESS send their
+transcribe/classify calls here instead of loading the models themselves. Each
+connection is served on its own thread, so concurrent transcribe calls reach
+the shared WhisperBatcher together and are decoded in common batches (set
+ASR_BATCH_SIZE > 1 on the server).
+
+Start it with `manage.py run_inference_server`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from multiprocessing.connection import Connection, Listener
+from typing import Any, Callable, Dict
+
+from .protocol import parse_address
+
+log = logging.getLogger(__name__)
+
+
+class InferenceServer:
+    def __init__(
+        self,
+        address: str,
+        authkey: bytes,
+        transcribe: Callable[..., Dict[str, Any]],
+        classify: Callable[[list], tuple],
+        label_version: Callable[[], str],
+    ):
+        self.address = address
+        self._address = parse_address(address)
+        self._authkey = authkey
+        self._transcribe = transcribe
+        self._classify = classify
+        self._label_version = label_version
+        self._listener: Listener | None = None
+        self._stop = threading.Event()
+
+    def serve_forever(self) -> None:
+        if isinstance(self._address, str) and os.path.exists(self._address):
+            os.unlink(self._address)  # stale socket from a previous run
+        self._listener = Listener(self._address, authkey=self._authkey)
+        log.info("Inference server listening on %s", self.address)
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn = self._listener.accept()
+                except Exception:
+                    if self._stop.is_set():
+                        break
+                    # e.g. AuthenticationError from a client with the wrong key
+                    log.exception("Failed to accept connection")
+                    continue
+                threading.Thread(
+                    target=self._handle, args=(conn,), name="inference-conn", daemon=True
+                ).start()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._listener is not None:
+            try:
+                self._listener.close()
+            except OSError:
+                pass
+            self._listener = None
+
+    def _handle(self, conn: Connection) -> None:
+        try:
+            while True:
+                try:
+                    op, payload = conn.recv()
+                except EOFError:
+                    return
+                try:
+                    conn.send(("ok", self._dispatch(conn, op, payload)))
+                except Exception as e:
+                    log.exception("Inference call %r failed", op)
+                    conn.send(("error", f"{type(e).__name__}: {e}"))
+        except (OSError, EOFError):
+            pass  # client went away mid-reply
+        finally:
+            conn.close()
+
+    def _dispatch(self, conn: Connection, op: str, payload: Any) -> Any:
+        if op == "transcribe":
+            audio, asr = payload
+            return self._transcribe(audio, on_segment=lambda seg: conn.send(("segment", seg)), asr=asr)
+        if op == "classify":
+            return self._classify(payload)
+        if op == "label_version":
+            return self._label_version()
+        if op == "ping":
+            return {"pid": os.getpid(), "address": self.address}
+        raise ValueError(f"Unknown operation: {op!r}")
@@ -0,0 +1,106 @@
+"""
+Cross-job micro-batching for the label stage.
+
+Concurrent jobs each label their own handful of segments, so the vectorizer
+and classifiers see many small calls. A LabelBatcher sits in front of the
+label function: callers block in classify() while a dispatcher thread
+collects requests for up to `max_wait_ms` (or until `max_texts` are queued),
+labels all their texts in one call — one sparse transform per model — and
+hands each caller back its own slice, with the model version that labeled
+the batch.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Sequence, Tuple
+
+log = logging.getLogger(__name__)
+
+Labels = Tuple[List[str], str]  # (one label per text, label model version)
+
+
+class LabelBatcher:
+    def __init__(
+        self,
+        classify: Callable[[List[str]], Labels],
+        max_wait_ms: float = 5.0,
+        max_texts: int = 4096,
+        idle_timeout: float = 30.0,
+    ):
+        self.classify_fn = classify
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.max_texts = max(1, int(max_texts))
+        self.idle_timeout = float(idle_timeout)
+        self._queue: "queue.Queue[Tuple[List[str], Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    # ------------- public API -------------
+    def classify(self, texts: Sequence[str]) -> Labels:
+        """Blocking; returns (labels, version) like the wrapped function."""
+        if not texts:
+            return self.classify_fn([])
+        fut: Future = Future()
+        self._queue.put((list(texts), fut))
+        self._ensure_dispatcher()
+        return fut.result()
+
+    # ------------- dispatcher -------------
+    def _ensure_dispatcher(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._dispatch, name="label-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def _collect(self) -> List[Tuple[List[str], Future]]:
+        """Wait for a first request, then gather more until the wait budget or text cap runs out."""
+        first = self._queue.get(timeout=self.idle_timeout)
+        batch = [first]
+        n_texts = len(first[0])
+        deadline = time.monotonic() + self.max_wait
+        while n_texts < self.max_texts:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            n_texts += len(item[0])
+        return batch
+
+    def _dispatch(self) -> None:
+        while True:
+            try:
+                batch = self._collect()
+            except queue.Empty:
+                # Idle: let the thread go. A request racing with this exit
+                # restarts the dispatcher.
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+
+            texts = [t for req, _ in batch for t in req]
+            try:
+                labels, version = self.classify_fn(texts)
+            except Exception as e:
+                for _, fut in batch:
+                    fut.set_exception(e)
+                continue
+
+            pos = 0
+            for req, fut in batch:
+                fut.set_result((labels[pos: pos + len(req)], version))
+                pos += len(req)
+            if len(batch) > 1:
+                log.debug("Labeled %d requests / %d texts in one batch", len(batch), len(texts))
@@ -0,0 +1,82 @@
+"""
+Bounded, thread-safe memo of segment labels.
+
+Songs, ads and re-shared clips repeat the same sentences across jobs; the
+label stage looks texts up here (keyed by model version, thresholds and
+normalized text) before touching the vectorizer.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Sequence
+
+
+def normalize_text(text: str) -> str:
+    """Case- and whitespace-insensitive form; both vectorizers lowercase and
+    tokenize on word characters, so this never changes the label."""
+    return " ".join(text.lower().split())
+
+
+class LabelCache:
+    def __init__(self, max_size: int = 10_000):
+        self._max_size = max(0, int(max_size))
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[Hashable, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def resize(self, max_size: int) -> None:
+        with self._lock:
+            self._max_size = max(0, int(max_size))
+            self._evict_locked()
+
+    def get_many(self, keys: Sequence[Hashable]) -> List[Optional[str]]:
+        """Cached label per key (None on a miss); counts hits and misses."""
+        out: List[Optional[str]] = []
+        with self._lock:
+            for key in keys:
+                label = self._items.get(key)
+                if label is None:
+                    self.misses += 1
+                else:
+                    self._items.move_to_end(key)
+                    self.hits += 1
+                out.append(label)
+        return out
+
+    def put_many(self, items: Dict[Hashable, str]) -> None:
+        if not self._max_size:
+            return
+        with self._lock:
+            for key, label in items.items():
+                self._items[key] = label
+                self._items.move_to_end(key)
+            self._evict_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._items),
+                "max_size": self._max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
+
+    def _evict_locked(self) -> None:
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+
+label_cache = LabelCache()
@@ -0,0 +1,177 @@
+"""
+Versioned label model artifacts.
+
+    artifacts/
+      versions/<version>/manifest.json       one directory per published model
+      versions/<version>/svm_model.joblib
+      versions/<version>/tfidf_vectorizer.joblib
+      versions/<version>/compiled/           NumPy export used for inference
+      versions/<version>/ensemble/           calibrated ensemble (optional, see ensemble.py)
+      CURRENT                                name of the active version
+      svm_model.joblib, tfidf_vectorizer.joblib, compiled/, ensemble/
+                                             legacy flat layout (no CURRENT)
+
+publish_version() writes a complete version directory and then flips CURRENT
+with an atomic rename; running processes pick the new version up on their
+next TextPredictor.load() without a restart.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import joblib
+import numpy as np
+
+MODEL_FILE = "svm_model.joblib"
+VECTORIZER_FILE = "tfidf_vectorizer.joblib"
+MANIFEST_FILE = "manifest.json"
+CURRENT_FILE = "CURRENT"
+VERSIONS_DIR = "versions"
+
+
+def dump_artifact(obj: Any, path: Path) -> Path:
+    """
+    joblib.dump() in a layout load_artifact() can memory-map: uncompressed,
+    with every top-level NumPy attribute C-contiguous and stored aligned.
+    """
+    for name, value in list(vars(obj).items()):
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            setattr(obj, name, np.ascontiguousarray(value))
+    joblib.dump(obj, path, compress=0)
+    return Path(path)
+
+
+def load_artifact(path: Path) -> Any:
+    """
+    joblib.load() with the arrays (SVM/LR coefficients, idf, ...) memory-mapped
+    read-only, so every process on the node shares one page-cache copy.
+    """
+    return joblib.load(path, mmap_mode="r")
+
+
+def _digest(paths) -> str:
+    h = hashlib.sha256()
+    for p in paths:
+        with open(p, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    return h.hexdigest()[:16]
+
+
+@lru_cache(maxsize=8)
+def _files_digest(root: str, stamp: tuple) -> str:
+    return _digest([Path(root) / MODEL_FILE, Path(root) / VECTORIZER_FILE])
+
+
+def source_digest(model_dir: Path) -> str:
+    """Digest of a directory's joblib files (from the manifest when there is one)."""
+    model_dir = Path(model_dir)
+    manifest = model_dir / MANIFEST_FILE
+    if manifest.exists():
+        return json.loads(manifest.read_text())["sha256"]
+    files = [model_dir / MODEL_FILE, model_dir / VECTORIZER_FILE]
+    stamp = tuple((p.stat().st_size, p.stat().st_mtime_ns) for p in files)
+    return _files_digest(str(model_dir), stamp)
+
+
+def compile_artifacts(model_dir: Path) -> Path:
+    """Export the joblib pair in `model_dir` to its compiled/ NumPy format."""
+    from .compiled import COMPILED_DIR, export_compiled
+
+    model_dir = Path(model_dir)
+    return export_compiled(
+        load_artifact(model_dir / MODEL_FILE),
+        load_artifact(model_dir / VECTORIZER_FILE),
+        model_dir / COMPILED_DIR,
+        source_sha256=source_digest(model_dir),
+    )
+
+
+def active_version(artifacts_dir: Path) -> Tuple[str, Path]:
+    """(version, directory holding the joblib files) of the active model."""
+    root = Path(artifacts_dir)
+    current = root / CURRENT_FILE
+    if current.exists():
+        version = current.read_text().strip()
+        return version, root / VERSIONS_DIR / version
+    return "legacy-" + source_digest(root), root
+
+
+def list_versions(artifacts_dir: Path) -> List[dict]:
+    """Manifests of all published versions, oldest first."""
+    base = Path(artifacts_dir) / VERSIONS_DIR
+    if not base.is_dir():
+        return []
+    manifests = []
+    for d in base.iterdir():
+        m = d / MANIFEST_FILE
+        if d.is_dir() and m.exists():
+            manifests.append(json.loads(m.read_text()))
+    return sorted(manifests, key=lambda m: m.get("created_at", ""))
+
+
+def activate_version(artifacts_dir: Path, version: str) -> None:
+    """Point CURRENT at an existing version (atomic; also used for rollbacks)."""
+    root = Path(artifacts_dir)
+    if not (root / VERSIONS_DIR / version / MANIFEST_FILE).exists():
+        raise ValueError(f"Unknown label model version: {version!r}")
+    tmp = root / f".{CURRENT_FILE}.tmp"
+    tmp.write_text(version + "\n")
+    os.replace(tmp, root / CURRENT_FILE)
+
+
+def publish_version(
+    artifacts_dir: Path,
+    model_path: Path,
+    vectorizer_path: Path,
+    version: str | None = None,
+    activate: bool = True,
+    **metadata,
+) -> str:
+    """
+    Copy a trained model (and the ensemble/ directory next to it, if any) into
+    a new version directory and (by default) make it current.
+    """
+    from .ensemble import ENSEMBLE_DIR
+
+    root = Path(artifacts_dir)
+    digest = _digest([model_path, vectorizer_path])
+    created = datetime.now(timezone.utc)
+    version = version or f"{created:%Y%m%d-%H%M%S}-{digest[:8]}"
+
+    base = root / VERSIONS_DIR
+    dst = base / version
+    if dst.exists():
+        raise ValueError(f"Label model version already exists: {version!r}")
+    tmp = base / f".{version}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    shutil.copy2(model_path, tmp / MODEL_FILE)
+    shutil.copy2(vectorizer_path, tmp / VECTORIZER_FILE)
+    files = {"model": MODEL_FILE, "vectorizer": VECTORIZER_FILE}
+    ensemble = Path(model_path).parent / ENSEMBLE_DIR
+    if ensemble.is_dir():
+        shutil.copytree(ensemble, tmp / ENSEMBLE_DIR)
+        files["ensemble"] = ENSEMBLE_DIR
+    manifest = {
+        "version": version,
+        "created_at": created.isoformat(),
+        "sha256": digest,
+        "files": files,
+        **metadata,
+    }
+    (tmp / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+    compile_artifacts(tmp)
+    os.replace(tmp, dst)
+
+    if activate:
+        activate_version(root, version)
+    return version
@@ -0,0 +1,189 @@
+"""
+Compiled TF-IDF + linear classifier for inference.
+
+export_compiled() turns a fitted TfidfVectorizer (word analyzer) and linear
+model (LinearSVC / LogisticRegression) into a directory of flat arrays:
+
+    meta.json          analyzer settings, stop words, classes, source digest,
+                       and the few terms longer than TERM_WIDTH bytes
+    terms.npy          sorted UTF-8 vocabulary terms (fixed-width bytes)
+    term_col.npy       feature column of each term in terms.npy
+    idf.npy            (n_features,)
+    coef.npy           (n_classes, n_features)
+    intercept.npy      (n_classes,)
+
+CompiledLinearModel memory-maps these files, so loading is a few opens and
+every process on the node shares one page-cache copy instead of unpickling a
+50k-entry vocabulary dict. It duck-types both the vectorizer (transform) and
+the classifier (predict / decision_function), and reproduces scikit-learn's
+tokenization and TF-IDF weighting so labels are identical.
+"""
+from __future__ import annotations
+
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+import scipy.sparse as sp
+
+COMPILED_DIR = "compiled"
+FORMAT_VERSION = 1
+TERM_WIDTH = 32  # bytes per term in terms.npy; longer terms are kept in meta.json
+
+
+def export_compiled(model, vectorizer, out_dir: Path, source_sha256: str = "") -> Path:
+    """Write `model` + `vectorizer` to `out_dir` (replaced atomically)."""
+    if vectorizer.analyzer != "word" or vectorizer.tokenizer or vectorizer.preprocessor:
+        raise ValueError("Only the default word analyzer can be compiled.")
+    if vectorizer.strip_accents or vectorizer.binary:
+        raise ValueError("strip_accents / binary vectorizers are not supported.")
+
+    out_dir = Path(out_dir)
+    tmp = out_dir.with_name(f".{out_dir.name}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    short, long_terms = [], {}
+    for term, col in vectorizer.vocabulary_.items():
+        raw = term.encode("utf-8")
+        if len(raw) > TERM_WIDTH:
+            long_terms[term] = int(col)
+        else:
+            short.append((raw, col))
+    short.sort()
+    np.save(tmp / "terms.npy", np.array([t for t, _ in short], dtype=f"S{TERM_WIDTH}"))
+    np.save(tmp / "term_col.npy", np.array([c for _, c in short], dtype=np.int32))
+    np.save(tmp / "idf.npy", np.asarray(vectorizer.idf_, dtype=np.float64))
+    np.save(tmp / "coef.npy", np.ascontiguousarray(model.coef_, dtype=np.float64))
+    np.save(tmp / "intercept.npy", np.asarray(model.intercept_, dtype=np.float64))
+
+    stop_words = vectorizer.get_stop_words()
+    meta = {
+        "format": FORMAT_VERSION,
+        "source_sha256": source_sha256,
+        "lowercase": bool(vectorizer.lowercase),
+        "token_pattern": vectorizer.token_pattern,
+        "ngram_range": list(vectorizer.ngram_range),
+        "stop_words": sorted(stop_words) if stop_words else [],
+        "norm": vectorizer.norm,
+        "use_idf": bool(vectorizer.use_idf),
+        "sublinear_tf": bool(vectorizer.sublinear_tf),
+        "classes": [c.item() if hasattr(c, "item") else c for c in model.classes_],
+        "n_features": int(len(vectorizer.idf_)),
+        "long_terms": long_terms,
+    }
+    (tmp / "meta.json").write_text(json.dumps(meta, indent=2))
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    tmp.rename(out_dir)
+    return out_dir
+
+
+def load_compiled(model_dir: Path, source_sha256: str) -> Optional["CompiledLinearModel"]:
+    """The compiled model next to these artifacts, or None if absent or stale."""
+    path = Path(model_dir) / COMPILED_DIR
+    meta_p = path / "meta.json"
+    if not meta_p.exists():
+        return None
+    meta = json.loads(meta_p.read_text())
+    if meta.get("format") != FORMAT_VERSION or meta.get("source_sha256") != source_sha256:
+        return None
+    return CompiledLinearModel(path, meta)
+
+
+class CompiledLinearModel:
+    def __init__(self, path: Path, meta: dict):
+        self.path = Path(path)
+        self.meta = meta
+        self.classes_ = np.asarray(meta["classes"], dtype=object)
+        self._terms = np.load(self.path / "terms.npy", mmap_mode="r")
+        self._cols = np.load(self.path / "term_col.npy", mmap_mode="r")
+        self._long_terms = meta["long_terms"]
+        self._idf = np.load(self.path / "idf.npy", mmap_mode="r")
+        self._coef = np.load(self.path / "coef.npy", mmap_mode="r")
+        self._intercept = np.load(self.path / "intercept.npy", mmap_mode="r")
+        self._token_re = re.compile(meta["token_pattern"])
+        self._stop = frozenset(meta["stop_words"])
+        self._min_n, self._max_n = meta["ngram_range"]
+        self._n_features = meta["n_features"]
+
+    # ------------- vectorizer -------------
+    def _ngrams(self, text: str) -> Iterable[str]:
+        """Same terms as TfidfVectorizer's word analyzer."""
+        if self.meta["lowercase"]:
+            text = text.lower()
+        tokens = [t for t in self._token_re.findall(text) if t not in self._stop]
+        n_tokens = len(tokens)
+        for n in range(self._min_n, min(self._max_n, n_tokens) + 1):
+            if n == 1:
+                yield from tokens
+            else:
+                for i in range(n_tokens - n + 1):
+                    yield " ".join(tokens[i: i + n])
+
+    def transform(self, texts: Sequence[str]) -> sp.csr_matrix:
+        rows: List[int] = []
+        grams: List[bytes] = []
+        long_rows: List[int] = []
+        long_cols: List[int] = []
+        for r, text in enumerate(texts):
+            for g in self._ngrams(text):
+                raw = g.encode("utf-8")
+                if len(raw) <= TERM_WIDTH:
+                    rows.append(r)
+                    grams.append(raw)
+                elif g in self._long_terms:
+                    long_rows.append(r)
+                    long_cols.append(self._long_terms[g])
+
+        n = len(texts)
+        row_idx = np.asarray(rows, dtype=np.int64)
+        col_idx = np.empty(0, dtype=np.int32)
+        if grams:
+            # One vectorized binary search over the sorted vocabulary.
+            keys = np.array(grams, dtype=f"S{TERM_WIDTH}")
+            pos = np.searchsorted(self._terms, keys)
+            pos[pos == len(self._terms)] = 0
+            hit = self._terms[pos] == keys
+            row_idx = row_idx[hit]
+            col_idx = self._cols[pos[hit]]
+        if long_rows:
+            row_idx = np.concatenate([row_idx, long_rows])
+            col_idx = np.concatenate([col_idx, long_cols])
+
+        X = sp.csr_matrix(
+            (np.ones(len(row_idx), dtype=np.float64), (row_idx, col_idx)),
+            shape=(n, self._n_features),
+        )
+        X.sum_duplicates()
+
+        if self.meta["sublinear_tf"]:
+            np.log(X.data, X.data)
+            X.data += 1
+        if self.meta["use_idf"]:
+            X.data *= self._idf[X.indices]
+        if self.meta["norm"] in ("l1", "l2"):
+            row_of = np.repeat(np.arange(n), np.diff(X.indptr))
+            if self.meta["norm"] == "l2":
+                norms = np.sqrt(np.bincount(row_of, weights=X.data ** 2, minlength=n))
+            else:
+                norms = np.bincount(row_of, weights=np.abs(X.data), minlength=n)
+            norms[norms == 0.0] = 1.0
+            X.data /= norms[row_of]
+        return X
+
+    # ------------- classifier -------------
+    def decision_function(self, X) -> np.ndarray:
+        scores = np.asarray(X @ self._coef.T) + self._intercept
+        return scores.ravel() if scores.shape[1] == 1 else scores
+
+    def predict(self, X) -> np.ndarray:
+        scores = self.decision_function(X)
+        if scores.ndim == 1:
+            idx = (scores > 0).astype(int)
+        else:
+            idx = scores.argmax(axis=1)
+        return self.classes_[idx]
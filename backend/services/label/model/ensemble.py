@@ -0,0 +1,236 @@
+"""
+Calibrated label ensemble on the shared TF-IDF features.
+
+The label stage used to vectorize texts twice: once for the SVM, and again
+inside profanity_check for the texts the SVM left as "Skip". The ensemble
+keeps both opinions but evaluates them on the single TF-IDF matrix the SVM
+already uses:
+
+    ensemble/meta.json            classes, profanity fold intercepts and
+                                  sigmoids, source digest
+    ensemble/calibration.npy      (n_classes, 2) Platt slope / intercept per class
+    ensemble/profanity_scale.npy  (n_features,) profanity_check idf / SVM idf per
+                                  shared unigram column, 0 elsewhere
+    ensemble/profanity_coef.npy   (n_features, n_folds) profanity_check's LinearSVC
+                                  weights, already multiplied by the scale
+
+The profanity head is profanity_check's own model, not an approximation:
+both vectorizers tokenize the same way, so rescaling the SVM's TF-IDF columns
+by the idf ratio and re-normalizing gives profanity_check's features (up to
+the few terms only its vocabulary has), and the head then averages the
+sigmoid-calibrated LinearSVC folds exactly like its predict_prob().
+
+predict_proba() gives per-class probabilities for every label, with the
+profanity head moving probability mass from "Skip" to "Bad Language";
+predict() applies the Thresholds.
+"""
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+ENSEMBLE_DIR = "ensemble"
+FORMAT_VERSION = 2
+
+SKIP = "Skip"
+BAD_LANGUAGE = "Bad Language"
+
+
+class Thresholds(NamedTuple):
+    # Skip texts whose profanity probability reaches this become "Bad Language"
+    # (0.5 is profanity_check.predict()'s own cut-off)
+    profanity: float = 0.5
+    # (label, minimum calibrated probability) pairs; weaker predictions fall back to "Skip"
+    classes: Tuple[Tuple[str, float], ...] = ()
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def _as_2d(scores: np.ndarray) -> np.ndarray:
+    """decision_function output as (n, n_classes), also for binary models."""
+    scores = np.asarray(scores, dtype=np.float64)
+    return np.column_stack([-scores, scores]) if scores.ndim == 1 else scores
+
+
+class ProfanityHead(NamedTuple):
+    scale: np.ndarray       # (n_features,)
+    coef: np.ndarray        # (n_features, n_folds)
+    intercept: np.ndarray   # (n_folds,)
+    sigmoid: np.ndarray     # (n_folds, 2) calibration a, b: p = 1 / (1 + exp(a * f + b))
+
+
+class LabelEnsemble:
+    def __init__(self, classes: Sequence[str], calibration: np.ndarray, profanity: ProfanityHead):
+        self.classes_ = np.asarray(classes, dtype=object)
+        self.calibration = calibration
+        self.head = profanity
+        self._skip = self._index(SKIP)
+        self._bad = self._index(BAD_LANGUAGE)
+
+    def _index(self, label: str) -> Optional[int]:
+        hits = np.flatnonzero(self.classes_ == label)
+        return int(hits[0]) if hits.size else None
+
+    # ------------- inference -------------
+    def profanity(self, X) -> np.ndarray:
+        """profanity_check.predict_prob() for the texts behind the TF-IDF rows X."""
+        X = X.tocsr()
+        n = X.shape[0]
+        row_of = np.repeat(np.arange(n), np.diff(X.indptr))
+        norms = np.sqrt(np.bincount(row_of, weights=(X.data * self.head.scale[X.indices]) ** 2, minlength=n))
+        norms[norms == 0.0] = 1.0
+        f = np.asarray(X @ self.head.coef) / norms[:, None] + self.head.intercept
+        a, b = self.head.sigmoid[:, 0], self.head.sigmoid[:, 1]
+        return _sigmoid(-(f * a + b)).mean(axis=1)
+
+    def _combine(self, scores: np.ndarray, p_profane: np.ndarray) -> np.ndarray:
+        probs = _sigmoid(scores * self.calibration[:, 0] + self.calibration[:, 1])
+        probs /= np.maximum(probs.sum(axis=1, keepdims=True), 1e-12)
+        if self._skip is not None and self._bad is not None:
+            moved = probs[:, self._skip] * p_profane
+            probs[:, self._skip] -= moved
+            probs[:, self._bad] += moved
+        return probs
+
+    def predict_proba(self, model, X) -> np.ndarray:
+        """(n, n_classes) probabilities, columns in classes_ order."""
+        return self._combine(_as_2d(model.decision_function(X)), self.profanity(X))
+
+    def predict(self, model, X, thresholds: Thresholds = Thresholds()) -> np.ndarray:
+        """
+        Labels for the TF-IDF rows X: the classifier's own prediction, demoted
+        to "Skip" below its class threshold, then "Skip" rows whose profanity
+        probability reaches thresholds.profanity become "Bad Language".
+        """
+        scores = _as_2d(model.decision_function(X))
+        idx = scores.argmax(axis=1)
+        labels = self.classes_[idx]
+
+        if thresholds.classes:
+            probs = self._combine(scores, self.profanity(X))
+            picked = probs[np.arange(len(idx)), idx]
+            for label, minimum in thresholds.classes:
+                labels[(labels == label) & (picked < minimum)] = SKIP
+        if self._bad is not None:
+            skip = np.flatnonzero(labels == SKIP)
+            if skip.size:
+                labels[skip[self.profanity(X[skip]) >= thresholds.profanity]] = BAD_LANGUAGE
+        return labels
+
+
+def profanity_head(vectorizer) -> ProfanityHead:
+    """
+    profanity_check's calibrated LinearSVC folds re-indexed onto the columns
+    of `vectorizer` (a fitted TfidfVectorizer whose unigrams are tokenized
+    like profanity_check's).
+    """
+    from profanity_check import profanity_check as pc
+
+    theirs = pc.vectorizer
+    for name in ("analyzer", "lowercase", "token_pattern", "preprocessor", "tokenizer", "strip_accents"):
+        if getattr(vectorizer, name) != getattr(theirs, name):
+            raise ValueError(f"The TF-IDF vectorizer's {name} differs from profanity_check's.")
+    if vectorizer.get_stop_words() != theirs.get_stop_words() or vectorizer.ngram_range[0] != 1:
+        raise ValueError("The TF-IDF vectorizer must produce profanity_check's unigrams.")
+    if vectorizer.sublinear_tf or vectorizer.binary or not vectorizer.use_idf:
+        raise ValueError("Term counts can't be recovered from this TF-IDF vectorizer.")
+    if theirs.norm != "l2" or theirs.sublinear_tf or theirs.binary or not theirs.use_idf:
+        raise ValueError("Unsupported profanity_check vectorizer.")
+
+    folds = pc.model.calibrated_classifiers_
+    n_features = len(vectorizer.idf_)
+    scale = np.zeros(n_features, dtype=np.float64)
+    coef = np.zeros((n_features, len(folds)), dtype=np.float64)
+    ours, cols = [], []
+    for term, col in theirs.vocabulary_.items():
+        if term in vectorizer.vocabulary_:
+            ours.append(vectorizer.vocabulary_[term])
+            cols.append(col)
+    ours, cols = np.asarray(ours), np.asarray(cols)
+    # Term counts up to a per-row factor, which the l2 norm cancels.
+    scale[ours] = theirs.idf_[cols] / vectorizer.idf_[ours]
+    for k, fold in enumerate(folds):
+        coef[ours, k] = fold.estimator.coef_[0, cols] * scale[ours]
+    return ProfanityHead(
+        scale,
+        coef,
+        np.array([fold.estimator.intercept_[0] for fold in folds], dtype=np.float64),
+        np.array([[fold.calibrators[0].a_, fold.calibrators[0].b_] for fold in folds], dtype=np.float64),
+    )
+
+
+def fit_ensemble(model, vectorizer, texts: Sequence[str], labels: Sequence[str]) -> LabelEnsemble:
+    """
+    Fit the ensemble for a trained `model` + `vectorizer` on held-out data:
+    Platt scaling of each class's decision score, plus profanity_check's own
+    model as the profanity head (see profanity_head()).
+    """
+    from sklearn.linear_model import LogisticRegression
+
+    texts = [str(t) for t in texts]
+    labels = np.asarray(labels, dtype=object)
+    X = vectorizer.transform(texts)
+    scores = _as_2d(model.decision_function(X))
+
+    classes = [c.item() if hasattr(c, "item") else c for c in model.classes_]
+    calibration = np.empty((len(classes), 2), dtype=np.float64)
+    for k, label in enumerate(classes):
+        y = labels == label
+        if y.all() or not y.any():
+            raise ValueError(f"Calibration data needs positive and negative examples of {label!r}.")
+        platt = LogisticRegression(C=1e6).fit(scores[:, k:k + 1], y)
+        calibration[k] = platt.coef_[0, 0], platt.intercept_[0]
+
+    return LabelEnsemble(classes, calibration, profanity_head(vectorizer))
+
+
+def export_ensemble(ensemble: LabelEnsemble, out_dir: Path, source_sha256: str = "") -> Path:
+    """Write `ensemble` to `out_dir` (replaced atomically)."""
+    out_dir = Path(out_dir)
+    tmp = out_dir.with_name(f".{out_dir.name}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    head = ensemble.head
+    np.save(tmp / "calibration.npy", np.asarray(ensemble.calibration, dtype=np.float64))
+    np.save(tmp / "profanity_scale.npy", np.asarray(head.scale, dtype=np.float64))
+    np.save(tmp / "profanity_coef.npy", np.ascontiguousarray(head.coef, dtype=np.float64))
+    meta = {
+        "format": FORMAT_VERSION,
+        "source_sha256": source_sha256,
+        "classes": list(ensemble.classes_),
+        "profanity_intercept": [float(v) for v in head.intercept],
+        "profanity_sigmoid": [[float(v) for v in ab] for ab in head.sigmoid],
+    }
+    (tmp / "meta.json").write_text(json.dumps(meta, indent=2))
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    tmp.rename(out_dir)
+    return out_dir
+
+
+def load_ensemble(model_dir: Path, source_sha256: str) -> Optional[LabelEnsemble]:
+    """The ensemble next to these artifacts, or None if absent or stale."""
+    path = Path(model_dir) / ENSEMBLE_DIR
+    meta_p = path / "meta.json"
+    if not meta_p.exists():
+        return None
+    meta = json.loads(meta_p.read_text())
+    if meta.get("format") != FORMAT_VERSION or meta.get("source_sha256") != source_sha256:
+        return None
+    return LabelEnsemble(
+        meta["classes"],
+        np.load(path / "calibration.npy", mmap_mode="r"),
+        ProfanityHead(
+            np.load(path / "profanity_scale.npy", mmap_mode="r"),
+            np.load(path / "profanity_coef.npy", mmap_mode="r"),
+            np.asarray(meta["profanity_intercept"], dtype=np.float64),
+            np.asarray(meta["profanity_sigmoid"], dtype=np.float64),
+        ),
+    )
@@ -1,12 +1,13 @@
 from pathlib import Path
 from typing import Tuple, Callable, Optional
-import joblib
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics import classification_report
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LogisticRegression
 
+from .artifacts import dump_artifact
+
 ProgressCB = Optional[Callable[[str, dict], None]]
 
 def _emit(cb: ProgressCB, stage: str, **info):
@@ -64,8 +65,8 @@ def train_lr_model(
     out_dir.mkdir(parents=True, exist_ok=True)
     lr_p = out_dir / "lr_model.joblib"
     vec_p = out_dir / "tfidf_vectorizer.joblib"
-    joblib.dump(lr, lr_p)
-    joblib.dump(vectorizer, vec_p)
+    dump_artifact(lr, lr_p)
+    dump_artifact(vectorizer, vec_p)
     _emit(progress_cb, "save_done", model=str(lr_p), vectorizer=str(vec_p))
 
     return lr_p, vec_p
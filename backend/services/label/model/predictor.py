@@ -1,54 +1,113 @@
 from pathlib import Path
-import joblib
+import logging
 from threading import Lock
-from typing import Union, List
+from typing import Any, NamedTuple, Optional, Tuple, Union, List
+
+import numpy as np
+
+from .artifacts import MODEL_FILE, VECTORIZER_FILE, active_version, load_artifact, source_digest
+from .compiled import load_compiled
+from .ensemble import LabelEnsemble, Thresholds, load_ensemble
+
+log = logging.getLogger(__name__)
+
+
+class LoadedModel(NamedTuple):
+    version: str
+    svm: Any
+    vec: Any
+    ensemble: Optional[LabelEnsemble] = None
 
 
 class TextPredictor:
     """
     Singleton-style text classifier wrapper around trained SVM + TF-IDF.
+
+    Uses the compiled NumPy export (see compiled.py) when one matches the
+    artifacts, else the joblib pair, plus the calibrated ensemble (see
+    ensemble.py) when the artifacts include one.
+
+    The loaded model is a single immutable LoadedModel reference: load() swaps
+    it when a new artifact version becomes current, while calls already in
+    progress keep using the version they started with.
     """
 
     _lock = Lock()
-    _loaded = False
-    _svm = None
-    _vec = None
+    _model: Optional[LoadedModel] = None
 
     @classmethod
     def load(cls, artifacts_dir: Path):
         """
-        Load the trained model and vectorizer (thread-safe).
-        Call once at startup, or before first use.
+        Load the active model version (thread-safe). Cheap when it is already
+        loaded; call before each use so a newly published version is picked up.
         """
-        with cls._lock:
-            if not cls._loaded:
-                artifacts_dir = Path(artifacts_dir)
-                # Change to rf_model.joblib for Random Forest model or lr_model.joblib for Logistic Regression
-                cls._svm = joblib.load(artifacts_dir / "svm_model.joblib")
-                cls._vec = joblib.load(artifacts_dir / "tfidf_vectorizer.joblib")
-                cls._loaded = True
+        version, path = active_version(artifacts_dir)
+        current = cls._model
+        if current is not None and current.version == version:
+            return
+        # While another thread loads the new version, keep serving the old one.
+        if not cls._lock.acquire(blocking=current is None):
+            return
+        try:
+            if cls._model is None or cls._model.version != version:
+                digest = source_digest(path)
+                compiled = load_compiled(path, digest)
+                if compiled is not None:
+                    # Memory-mapped NumPy export; serves as both vectorizer and classifier.
+                    svm = vec = compiled
+                else:
+                    # Change to rf_model.joblib for Random Forest model or lr_model.joblib for Logistic Regression
+                    svm = load_artifact(Path(path) / MODEL_FILE)
+                    vec = load_artifact(Path(path) / VECTORIZER_FILE)
+                ensemble = load_ensemble(path, digest)
+                if ensemble is None:
+                    log.info("Label model %s has no calibrated ensemble; using profanity_check", version)
+                previous = cls._model
+                cls._model = LoadedModel(version, svm, vec, ensemble)
+                if previous is not None:
+                    log.info("Label model switched from %s to %s", previous.version, version)
+        finally:
+            cls._lock.release()
+
+    @classmethod
+    def version(cls) -> Optional[str]:
+        """Version of the currently loaded model, or None before load()."""
+        return cls._model.version if cls._model is not None else None
 
     @classmethod
-    def predict(cls, texts: Union[str, List[str]]) -> Union[str, List[str]]:
+    def current(cls) -> LoadedModel:
+        """
+        The loaded model. Pass it to the predict methods to run several calls
+        on one version even if load() switches versions in between.
+        """
+        model = cls._model
+        if model is None:
+            raise RuntimeError("Predictor not loaded. Call TextPredictor.load(...) first.")
+        return model
+
+    @classmethod
+    def predict(
+        cls, texts: Union[str, List[str]], model: Optional[LoadedModel] = None
+    ) -> Union[str, List[str]]:
         """
         Predict labels for a single string or a list of strings.
 
         Args:
             texts: text or list of texts to classify
+            model: loaded model to use (defaults to current())
 
         Returns:
             str if input is str, or List[str] if input is list
         """
-        if not cls._loaded:
-            raise RuntimeError("Predictor not loaded. Call TextPredictor.load(...) first.")
+        model = model or cls.current()
 
         single_input = False
         if isinstance(texts, str):
             texts = [texts]
             single_input = True
 
-        X = cls._vec.transform(texts)
-        preds = cls._svm.predict(X)
+        X = model.vec.transform(texts)
+        preds = model.svm.predict(X)
 
         return preds[0] if single_input else preds.tolist()
 
@@ -58,18 +117,43 @@ class TextPredictor:
         Return decision function scores for a single text or list.
         Higher magnitude = more confident prediction.
         """
-        if not cls._loaded:
-            raise RuntimeError("Predictor not loaded.")
+        model = cls.current()
 
         single_input = False
         if isinstance(texts, str):
             texts = [texts]
             single_input = True
 
-        X = cls._vec.transform(texts)
-        scores = cls._svm.decision_function(X)
+        X = model.vec.transform(texts)
+        scores = model.svm.decision_function(X)
 
         if scores.ndim == 2:  # multi-class case: return max margin
             scores = scores.max(axis=1)
 
         return float(scores[0]) if single_input else scores.tolist()
+
+    @classmethod
+    def predict_calibrated(
+        cls,
+        texts: List[str],
+        thresholds: Thresholds = Thresholds(),
+        model: Optional[LoadedModel] = None,
+    ) -> Optional[List[str]]:
+        """
+        Labels from the calibrated ensemble (one TF-IDF transform for all
+        models), or None when the loaded version has no ensemble.
+        """
+        model = model or cls.current()
+        if model.ensemble is None:
+            return None
+        X = model.vec.transform(texts)
+        return model.ensemble.predict(model.svm, X, thresholds).tolist()
+
+    @classmethod
+    def predict_proba(cls, texts: List[str]) -> Optional[Tuple[List[str], np.ndarray]]:
+        """(classes, (n, n_classes) probabilities) from the ensemble, or None without one."""
+        model = cls.current()
+        if model.ensemble is None:
+            return None
+        X = model.vec.transform(texts)
+        return list(model.ensemble.classes_), model.ensemble.predict_proba(model.svm, X)
@@ -1,13 +1,14 @@
 # backend/services/label/model/random_forests.py
 from pathlib import Path
 from typing import Tuple, Callable, Optional
-import joblib
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics import classification_report
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 
+from .artifacts import dump_artifact
+
 ProgressCB = Optional[Callable[[str, dict], None]]
 
 def _emit(cb: ProgressCB, stage: str, **info):
@@ -62,8 +63,8 @@ def train_rf_model(
     out_dir.mkdir(parents=True, exist_ok=True)
     rf_p = out_dir / "rf_model.joblib"
     vec_p = out_dir / "tfidf_vectorizer.joblib"
-    joblib.dump(rf, rf_p)
-    joblib.dump(vectorizer, vec_p)
+    dump_artifact(rf, rf_p)
+    dump_artifact(vectorizer, vec_p)
     _emit(progress_cb, "save_done", model=str(rf_p), vectorizer=str(vec_p))
 
     return rf, vectorizer, report
\ No newline at end of file
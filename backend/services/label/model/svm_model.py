@@ -1,13 +1,15 @@
 # backend/services/label/model/svm_model.py
 from pathlib import Path
 from typing import Tuple, Callable, Optional
-import joblib
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics import classification_report
 from sklearn.model_selection import train_test_split
 from sklearn.svm import LinearSVC
 
+from .artifacts import dump_artifact, source_digest
+from .ensemble import ENSEMBLE_DIR, export_ensemble, fit_ensemble
+
 ProgressCB = Optional[Callable[[str, dict], None]]
 
 def _emit(cb: ProgressCB, stage: str, **info):
@@ -39,7 +41,7 @@ def _fit_pipeline(X, y, progress_cb: ProgressCB=None):
     report = classification_report(y_te, y_pred)
     _emit(progress_cb, "eval_done")
 
-    return svm, vectorizer, report
+    return svm, vectorizer, report, (X_te, y_te)
 
 def train_svm_model(
     csv_path: Path,
@@ -47,6 +49,7 @@ def train_svm_model(
     text_col: str = "text",
     label_col: str = "unified_label",
     progress_cb: ProgressCB = None,
+    ensemble: bool = True,
 ) -> Tuple[Path, Path]:
     _emit(progress_cb, "load_start", path=str(csv_path))
     df = pd.read_csv(csv_path)
@@ -55,7 +58,7 @@ def train_svm_model(
     X = df[text_col]
     y = df[label_col]
 
-    svm, vectorizer, report = _fit_pipeline(X, y, progress_cb=progress_cb)
+    svm, vectorizer, report, (X_te, y_te) = _fit_pipeline(X, y, progress_cb=progress_cb)
 
     print(report)
 
@@ -63,8 +66,18 @@ def train_svm_model(
     out_dir.mkdir(parents=True, exist_ok=True)
     svm_p = out_dir / "svm_model.joblib"
     vec_p = out_dir / "tfidf_vectorizer.joblib"
-    joblib.dump(svm, svm_p)
-    joblib.dump(vectorizer, vec_p)
+    dump_artifact(svm, svm_p)
+    dump_artifact(vectorizer, vec_p)
     _emit(progress_cb, "save_done", model=str(svm_p), vectorizer=str(vec_p))
 
+    if ensemble:
+        # Calibrate on the held-out split so probabilities aren't overconfident.
+        _emit(progress_cb, "ensemble_start")
+        export_ensemble(
+            fit_ensemble(svm, vectorizer, X_te, y_te),
+            out_dir / ENSEMBLE_DIR,
+            source_sha256=source_digest(out_dir),
+        )
+        _emit(progress_cb, "ensemble_done")
+
     return svm_p, vec_p
@@ -0,0 +1,75 @@
+"""
+Labeling stage used by the pipeline.
+
+Every text gets a topic label from the TF-IDF + SVM TextPredictor, and texts
+left as "Skip" whose profanity probability reaches Thresholds.profanity become
+"Bad Language". With the calibrated ensemble in the artifacts
+(services.label.model.ensemble) that probability comes from the same TF-IDF
+matrix, so each text is vectorized once, and per-class Thresholds can demote
+weak predictions to "Skip" first; older artifacts without one ask
+profanity_check.
+Models run once per batch rather than once per segment, so labeling cost
+stays flat as transcripts grow, and repeated texts are served from label_cache.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from services.label.cache import label_cache, normalize_text
+from services.label.model.artifacts import active_version
+from services.label.model.ensemble import BAD_LANGUAGE, SKIP, Thresholds
+from services.label.model.predictor import LoadedModel, TextPredictor
+
+def label_model_version(artifacts_dir: Path) -> str:
+    """Version of the active label model (see services.label.model.artifacts)."""
+    return active_version(artifacts_dir)[0]
+
+
+def _classify(texts: Sequence[str], thresholds: Thresholds, model: LoadedModel) -> List[str]:
+    labels = TextPredictor.predict_calibrated(list(texts), thresholds, model=model)
+    if labels is not None:
+        return labels
+
+    # No ensemble for this model version: SVM labels, then profanity_check's
+    # own (second) vectorization for the "Skip" texts.
+    from profanity_check import predict_prob
+
+    labels = np.asarray(TextPredictor.predict(list(texts), model=model), dtype=object)
+    skip_idx = np.flatnonzero(labels == SKIP)
+    if skip_idx.size:
+        profane = predict_prob([texts[i] for i in skip_idx]) >= thresholds.profanity
+        labels[skip_idx[profane]] = BAD_LANGUAGE
+    return labels.tolist()
+
+
+def label_texts(
+    texts: Sequence[str], artifacts_dir: Path, thresholds: Thresholds = Thresholds()
+) -> Tuple[List[str], str]:
+    """
+    Return one label per text and the label model version that produced
+    them. Texts already seen with the same model version and thresholds come
+    from label_cache; only the remaining distinct texts are classified.
+    """
+    TextPredictor.load(artifacts_dir)
+    # One model for the whole call, even if a new version is published meanwhile.
+    model = TextPredictor.current()
+    if not texts:
+        return [], model.version
+    if not label_cache.max_size:
+        return _classify(texts, thresholds, model), model.version
+
+    keys = [(model.version, thresholds, normalize_text(t)) for t in texts]
+    labels = label_cache.get_many(keys)
+
+    todo: Dict[tuple, str] = {}
+    for key, text, label in zip(keys, texts, labels):
+        if label is None and key not in todo:
+            todo[key] = text
+    if todo:
+        fresh = dict(zip(todo, _classify(list(todo.values()), thresholds, model)))
+        label_cache.put_many(fresh)
+        labels = [fresh[k] if label is None else label for k, label in zip(keys, labels)]
+    return labels, model.version
@@ -0,0 +1,18 @@
+# backend/services/label/training/compile.py
+from pathlib import Path
+import argparse
+from ..model.artifacts import compile_artifacts
+
+
+def main():
+    ap = argparse.ArgumentParser(
+        description="Export svm_model.joblib + tfidf_vectorizer.joblib to the compiled NumPy inference format"
+    )
+    ap.add_argument("--dir", default="backend/services/label/model/artifacts", help="Directory holding the joblib artifacts")
+    args = ap.parse_args()
+
+    out = compile_artifacts(Path(args.dir))
+    print(f"Wrote {out}")
+
+if __name__ == "__main__":
+    main()
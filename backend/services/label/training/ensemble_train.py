@@ -0,0 +1,50 @@
+# backend/services/label/training/ensemble_train.py
+from pathlib import Path
+import argparse
+import shutil
+import tempfile
+import pandas as pd
+from ..model.artifacts import (
+    CURRENT_FILE, MODEL_FILE, VECTORIZER_FILE, active_version, load_artifact, publish_version, source_digest,
+)
+from ..model.ensemble import ENSEMBLE_DIR, export_ensemble, fit_ensemble
+
+
+def main():
+    ap = argparse.ArgumentParser(
+        description="Fit the calibrated label ensemble for already-trained artifacts"
+    )
+    ap.add_argument("--data", required=True, help="Held-out CSV (not the SVM's training data)")
+    ap.add_argument("--dir", default="backend/services/label/model/artifacts", help="Artifacts directory")
+    ap.add_argument("--text-col", default="text")
+    ap.add_argument("--label-col", default="unified_label")
+    args = ap.parse_args()
+
+    root = Path(args.dir)
+    version, path = active_version(root)
+    df = pd.read_csv(args.data).dropna(subset=[args.text_col, args.label_col])
+    ensemble = fit_ensemble(
+        load_artifact(path / MODEL_FILE),
+        load_artifact(path / VECTORIZER_FILE),
+        df[args.text_col].astype(str).tolist(),
+        df[args.label_col].tolist(),
+    )
+
+    if not (root / CURRENT_FILE).exists():
+        # Legacy flat layout: no versions to switch between, written in place.
+        out = export_ensemble(ensemble, path / ENSEMBLE_DIR, source_sha256=source_digest(path))
+        print(f"Wrote {out} (restart workers to pick it up)")
+        return
+
+    # Running workers only reload on a version change, so publish a copy of the
+    # active model with the ensemble as a new version.
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for name in (MODEL_FILE, VECTORIZER_FILE):
+            shutil.copy2(path / name, tmp / name)
+        export_ensemble(ensemble, tmp / ENSEMBLE_DIR, source_sha256=source_digest(tmp))
+        new = publish_version(root, tmp / MODEL_FILE, tmp / VECTORIZER_FILE, data=str(args.data), based_on=version)
+    print(f"Published label model version {new} (ensemble for {version})")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 # backend/services/label/training/svm_train.py
 from pathlib import Path
 import argparse
+import tempfile
 from tqdm.auto import tqdm
+from ..model.artifacts import compile_artifacts, publish_version
 from ..model.svm_model import train_svm_model
 
 STAGES = [
@@ -12,6 +14,7 @@ STAGES = [
     "svm_fit_start", "svm_fit_done",
     "eval_start", "eval_done",
     "save_start", "save_done",
+    "ensemble_start", "ensemble_done",
 ]
 
 def main():
@@ -20,24 +23,42 @@ def main():
     ap.add_argument("--out", default="backend/services/label/model/artifacts", help="Output dir for artifacts")
     ap.add_argument("--text-col", default="text")
     ap.add_argument("--label-col", default="unified_label")
+    ap.add_argument(
+        "--publish",
+        action="store_true",
+        help="Save as a new version under <out>/versions/ and make it current (running workers switch to it)",
+    )
+    ap.add_argument(
+        "--no-ensemble",
+        action="store_true",
+        help="Skip fitting the calibrated ensemble (labels then need profanity_check's own vectorization, and there are no per-class thresholds)",
+    )
     args = ap.parse_args()
+    stages = [s for s in STAGES if not (args.no_ensemble and s.startswith("ensemble"))]
 
-    pbar = tqdm(total=len(STAGES), bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} • {desc}")
+    pbar = tqdm(total=len(stages), bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} • {desc}")
 
 
     def on_progress(stage: str, info: dict):
-        if stage in STAGES:
+        if stage in stages:
             pbar.set_description(stage.replace("_", " "))
             pbar.update(1)
 
     try:
-        train_svm_model(
-            csv_path=Path(args.data),
-            out_dir=Path(args.out),
-            text_col=args.text_col,
-            label_col=args.label_col,
-            progress_cb=on_progress,
-        )
+        with tempfile.TemporaryDirectory() as tmp:
+            svm_p, vec_p = train_svm_model(
+                csv_path=Path(args.data),
+                out_dir=Path(tmp) if args.publish else Path(args.out),
+                text_col=args.text_col,
+                label_col=args.label_col,
+                progress_cb=on_progress,
+                ensemble=not args.no_ensemble,
+            )
+            if args.publish:
+                version = publish_version(Path(args.out), svm_p, vec_p, data=str(args.data))
+                print(f"Published label model version {version}")
+            else:
+                compile_artifacts(Path(args.out))
     finally:
         pbar.close()
 
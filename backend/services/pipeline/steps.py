@@ -1,9 +1,13 @@
 """
 Pipeline utilities for handling uploads, audio normalization, and ASR transcription.
 
-- save_upload():  save Django-uploaded files to /media/uploads
+- save_upload():  save Django-uploaded files to /media/uploads (content-addressed)
+- result_cache_key(): key under which a finished result can be reused
 - convert_file(): convert any media file to 16 kHz mono 16-bit PCM WAV
-- transcribe_audio(): run real Vosk transcription
+- decode_pcm(): stream any media file through ffmpeg into a float32 array
+- transcribe_audio(): run Whisper transcription (in-process or on the inference server)
+- warm_whisper() / unload_whisper(): manage the process-wide cached Whisper model
+- preload_models(): load label models (and optionally Whisper) ahead of the first job
 - mock_vosk():  mock ASR for demo mode
 - analyze_upload(): main orchestrator used by API/view
 """
@@ -11,17 +15,24 @@ Pipeline utilities for handling uploads, audio normalization, and ASR transcript
 from __future__ import annotations
 
 import numpy as np
+import hashlib
 import json
+import os
 import subprocess
+import threading
+import time
 import uuid
 import wave
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from profanity_check import predict, predict_prob
 
 from django.conf import settings
 
+from services.asr.routing import AsrChoice, AsrRouter, parse_tiers
+from services.label.model.ensemble import Thresholds
+from services.label.stage import label_model_version, label_texts
+
 # ---------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------
@@ -44,9 +55,13 @@ ALLOWED_EXTENSIONS = {
 
 def save_upload(django_file) -> Path:
     """
-    Save a Django-uploaded file under MEDIA_ROOT/uploads/<uuid>.<ext>.
+    Save a Django-uploaded file under MEDIA_ROOT/uploads/<sha256>.<ext>.
     Rejects non-audio/video files *before* writing to disk.
 
+    The SHA-256 of the content is computed while the chunks are written, so
+    identical uploads share one file on disk and the returned path's stem is
+    the content hash (see result_cache_key()).
+
     Raises:
         ValueError: if file type is not allowed (includes original filename).
     """
@@ -66,12 +81,23 @@ def save_upload(django_file) -> Path:
 
     # --- Save file ---
     UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-    uid = uuid.uuid4().hex
-    out = UPLOAD_DIR / f"{uid}{ext}"
+    tmp = UPLOAD_DIR / f".{uuid.uuid4().hex}.part"
+    digest = hashlib.sha256()
 
-    with open(out, "wb") as f:
-        for chunk in django_file.chunks():
-            f.write(chunk)
+    try:
+        with open(tmp, "wb") as f:
+            for chunk in django_file.chunks():
+                digest.update(chunk)
+                f.write(chunk)
+        out = UPLOAD_DIR / f"{digest.hexdigest()}{ext}"
+        # Replacing (rather than skipping) an existing copy restores the shared
+        # file if another job's delete removed it before this point. It does not
+        # cover a delete whose reference check ran before this upload's row is
+        # inserted: that delete can still unlink the file after os.replace(),
+        # and the new job then fails when it decodes the missing upload.
+        os.replace(tmp, out)
+    finally:
+        tmp.unlink(missing_ok=True)
 
     return out
 
@@ -111,6 +137,54 @@ def convert_file(input_file: Path, output_file: Path) -> Path:
     return output_file
 
 
+SAMPLE_RATE = 16000
+
+
+def decode_pcm(input_file: Path, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Decode any supported audio/video file to mono float32 samples in [-1, 1]
+    by reading ffmpeg's raw PCM output from a pipe (nothing touches disk).
+    Raises ValueError if the file cannot be decoded.
+    """
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-loglevel", "error",
+        "-i",
+        str(input_file),
+        "-ar", str(sample_rate),  # sample rate
+        "-ac", "1",               # mono
+        "-f", "s16le",            # raw 16-bit PCM on stdout
+        "-",
+    ]
+    try:
+        proc = subprocess.run(
+            cmd,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except subprocess.CalledProcessError as e:
+        raise ValueError(
+            f"Failed to convert file '{input_file.name}'. "
+            "Ensure it is a valid audio or video file."
+        ) from e
+
+    return np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def write_wav(audio: np.ndarray, output_file: Path, sample_rate: int = SAMPLE_RATE) -> Path:
+    """Persist a float32 buffer from decode_pcm() as 16-bit PCM WAV."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767.0).astype("<i2")
+    with wave.open(str(output_file), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm.tobytes())
+    return output_file
+
+
 def ffmpeg_convert_to_wav_mono16(src: Path) -> Path:
     """Convenience wrapper for convert_file() that auto-names the output WAV."""
     NORMALIZED_DIR.mkdir(parents=True, exist_ok=True)
@@ -130,12 +204,19 @@ def wav_duration_seconds(wav_path: Path) -> float:
         return frames / float(rate)
 
 
+def audio_duration_seconds(audio: np.ndarray | Path) -> float:
+    """Duration of a decode_pcm() buffer, or of a WAV file on disk."""
+    if isinstance(audio, np.ndarray):
+        return len(audio) / float(SAMPLE_RATE)
+    return wav_duration_seconds(audio)
+
+
 # ---------------------------------------------------------------------
 # Mock + Real ASR
 # ---------------------------------------------------------------------
-def mock_vosk(wav_path: Path) -> Dict[str, Any]:
+def mock_vosk(audio: np.ndarray | Path) -> Dict[str, Any]:
     """Return fake ASR result for MVP demo."""
-    dur = wav_duration_seconds(wav_path)
+    dur = audio_duration_seconds(audio)
     return {
         "engine": "mock-vosk",
         "text": "(mock) transcription pending",
@@ -160,92 +241,532 @@ def mock_vosk(wav_path: Path) -> Dict[str, Any]:
 #     transcript_out.write_text(json.dumps(transcript, indent=2))
 #     return transcript
 
-def transcribe_audio(input_file: Path, model_path: Path, transcript_out: Path) -> dict:
+# Engine config used by the pipeline; also the registry key for the cached model.
+# With settings.ASR_MODEL_TIERS each job gets its model and beam size from asr_router().
+WHISPER_CONFIG: Dict[str, Any] = dict(
+    # model_name_or_path=str(model_path) if model_path else "tiny.en",
+    model_name_or_path="tiny.en",
+    device=None,          # auto: "cuda" if available else "cpu"
+    compute_type=None,    # auto: int8 / int8_float16
+    language="en",        # auto-detect; set "en" to lock English
+    beam_size=1,          # greedy = fastest
+    vad_filter=True,
+    enable_word_timestamps=False,  # set True if you need per-word timings
+    # enough decoder slots for concurrent jobs and for the chunks of one long job
+    num_workers=max(
+        getattr(settings, "WHISPER_NUM_WORKERS", 1),
+        getattr(settings, "ASR_CHUNK_WORKERS", 1),
+    ),
+)
+
+
+_router: Optional[AsrRouter] = None
+_router_lock = threading.Lock()
+
+
+def asr_router() -> Optional[AsrRouter]:
     """
-    Run Whisper transcription (model_path may be a model name or local path).
+    Process-wide AsrRouter over settings.ASR_MODEL_TIERS, or None when the
+    pipeline always uses WHISPER_CONFIG's model.
     """
-    from services.asr import WhisperASREngine
+    global _router
+    tiers = parse_tiers(getattr(settings, "ASR_MODEL_TIERS", []))
+    if not tiers:
+        return None
+    with _router_lock:
+        if _router is None or _router.tiers != tiers:
+            _router = AsrRouter(
+                tiers,
+                slo_seconds=getattr(settings, "ASR_LATENCY_SLO_SECONDS", 300.0),
+                workers=getattr(settings, "JOB_WORKERS", 1),
+            )
+        return _router
+
+
+def default_asr() -> AsrChoice:
+    return AsrChoice(WHISPER_CONFIG["model_name_or_path"], WHISPER_CONFIG["beam_size"])
+
+
+def choose_asr(duration_sec: float, queued: int = 0) -> AsrChoice:
+    """Whisper model and beam size for a job of this length with `queued` jobs waiting."""
+    router = asr_router()
+    return router.choose(duration_sec, queued) if router else default_asr()
 
-    # You can pass a model name ("tiny", "small", "medium", "base.en") or a local path
-    engine = WhisperASREngine(
-        # model_name_or_path=str(model_path) if model_path else "tiny.en",
-        model_name_or_path="tiny.en",
-        device=None,          # auto: "cuda" if available else "cpu"
-        compute_type=None,    # auto: int8 / int8_float16
-        language="en",        # auto-detect; set "en" to lock English
-        beam_size=1,          # greedy = fastest
-        vad_filter=True,
-        enable_word_timestamps=False,  # set True if you need per-word timings
+
+# Which pass produced a result's labels (UploadJob.labels_pass)
+PREVIEW = "preview"
+FINAL = "final"
+VOSK = "vosk"  # ASR_PREVIEW_MODEL value selecting the Vosk engine
+
+
+def preview_asr(duration_sec: float, final: AsrChoice) -> Optional[AsrChoice]:
+    """
+    Quick first-pass model for a recording of this length, or None when it
+    should go straight to `final` (short audio, previews off, or the preview
+    model is the final one anyway).
+    """
+    min_sec = getattr(settings, "ASR_PREVIEW_MIN_SECONDS", 0)
+    if min_sec <= 0 or duration_sec < min_sec:
+        return None
+    preview = AsrChoice.parse(getattr(settings, "ASR_PREVIEW_MODEL", "tiny.en"))
+    return None if preview == final else preview
+
+
+def whisper_config(asr: Optional[AsrChoice] = None) -> Dict[str, Any]:
+    if asr is None:
+        return WHISPER_CONFIG
+    return dict(WHISPER_CONFIG, model_name_or_path=asr.model, beam_size=asr.beam_size)
+
+
+def current_label_version() -> str:
+    """Active label model version of whoever labels for this process (local or inference server)."""
+    client = inference_client()
+    if client is not None:
+        return client.label_version()
+    return label_model_version(ARTIFACTS)
+
+
+def result_cache_key(content_hash: str, label_version: Optional[str] = None) -> str:
+    """
+    Key for reusing a finished result: same content, same ASR settings and
+    same label model and thresholds give the same transcript and labels.
+    With model routing the ASR part is the tier list, not the tier a job got.
+    Pass the `label_version` a result was actually labeled with when storing
+    it; lookups default to the currently active version.
+    """
+    asr = {k: WHISPER_CONFIG[k] for k in (
+        "model_name_or_path", "language", "beam_size", "vad_filter", "enable_word_timestamps",
+    )}
+    router = asr_router()
+    if router:
+        asr["tiers"] = [str(t) for t in router.tiers]
+    if getattr(settings, "ASR_CHUNK_WORKERS", 1) > 1:
+        asr["chunk"] = [settings.ASR_CHUNK_SECONDS, settings.ASR_CHUNK_OVERLAP_SECONDS]
+    blob = json.dumps(
+        [content_hash, asr, label_version or current_label_version(), label_thresholds()],
+        sort_keys=True,
     )
-    transcript = engine.transcribe(str(input_file))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def get_whisper_engine(asr: Optional[AsrChoice] = None):
+    """Return the process-wide cached Whisper engine (loaded on first call)."""
+    from services.asr import whisper_engines
+
+    router = asr_router()
+    whisper_engines.resize(max(
+        getattr(settings, "WHISPER_ENGINE_CACHE_SIZE", 2),
+        len(router.tiers) if router else 0,  # keep every tier loaded
+    ))
+    return whisper_engines.get(**whisper_config(asr))
+
+
+_batchers: Dict[AsrChoice, Any] = {}
+_batcher_lock = threading.Lock()
+
+
+def get_asr_transcriber(asr: Optional[AsrChoice] = None) -> Callable[[Any], dict]:
+    """
+    Return the transcribe() callable jobs should use: the cached engine's own
+    method, or (with settings.ASR_BATCH_SIZE > 1) a shared WhisperBatcher per
+    model that coalesces concurrent requests into batched inference.
+    """
+    engine = get_whisper_engine(asr)
+    batch_size = getattr(settings, "ASR_BATCH_SIZE", 1)
+    if batch_size <= 1:
+        return engine.transcribe
+
+    key = asr or default_asr()
+    with _batcher_lock:
+        batcher = _batchers.get(key)
+        if batcher is None or batcher.engine is not engine:
+            from services.asr.batching import WhisperBatcher
+
+            batcher = _batchers[key] = WhisperBatcher(
+                engine,
+                batch_size=batch_size,
+                max_wait_ms=getattr(settings, "ASR_BATCH_MAX_WAIT_MS", 50),
+                max_audio_sec=getattr(settings, "ASR_BATCH_MAX_SECONDS", 180),
+            )
+        return batcher.transcribe
+
+
+def warm_whisper() -> None:
+    """Load the pipeline's Whisper model(s) ahead of the first job."""
+    router = asr_router()
+    for asr in router.tiers if router else [None]:
+        get_whisper_engine(asr)
+
+
+def preload_models(whisper: bool = False) -> None:
+    """
+    Load and exercise the label models (SVM + TF-IDF, ensemble or
+    profanity_check) so the first job doesn't pay for it. Called before
+    gunicorn forks when settings.PRELOAD_MODELS is on, so workers share these
+    pages copy-on-write.
+
+    Whisper is only loaded with `whisper=True`: CTranslate2 starts its own
+    threads, which do not survive a fork, so it is warmed per worker instead.
+    Nothing is loaded when an inference server owns the models.
+    """
+    if inference_client() is not None:
+        return
+    label_texts(["warm up"], ARTIFACTS, label_thresholds())
+    label_model_version(ARTIFACTS)
+    if whisper:
+        warm_whisper()
+
+
+def unload_whisper() -> bool:
+    """Drop the cached pipeline Whisper model(s) (next job reloads them)."""
+    from services.asr import whisper_engines
+
+    router = asr_router()
+    unloaded = [whisper_engines.unload(**whisper_config(asr)) for asr in (router.tiers if router else [None])]
+    with _batcher_lock:
+        _batchers.clear()
+    return any(unloaded)
+
+
+_vosk_engines: Dict[Optional[str], Any] = {}
+_vosk_lock = threading.Lock()
+
+
+def get_vosk_engine(model_path: Optional[str] = None):
+    """Process-wide VoskASREngine for settings.VOSK_MODEL_DIR (or Vosk's bundled model)."""
+    model_path = model_path or getattr(settings, "VOSK_MODEL_DIR", None)
+    with _vosk_lock:
+        engine = _vosk_engines.get(model_path)
+        if engine is None:
+            from services.asr import VoskASREngine
+
+            engine = _vosk_engines[model_path] = VoskASREngine(model_path)
+        return engine
+
+
+def inference_client():
+    """InferenceClient for settings.INFERENCE_ADDRESS, or None to run models in-process."""
+    address = getattr(settings, "INFERENCE_ADDRESS", "")
+    if not address:
+        return None
+    from services.inference import InferenceClient
+
+    return InferenceClient(address, settings.INFERENCE_AUTHKEY.encode("utf-8"))
+
+
+def run_asr(
+    audio: np.ndarray | Path,
+    on_segment: Optional[Callable[[Dict[str, Any]], None]] = None,
+    asr: Optional[AsrChoice] = None,
+) -> dict:
+    """
+    Transcribe in this process, with the model and beam size of `asr` (default:
+    WHISPER_CONFIG). The engine comes from the process-wide registry, so only
+    the first job pays for loading each model. `asr.model == VOSK` runs the
+    Vosk engine instead (used for preview passes). Long buffers
+    are split at pauses and decoded in parallel chunks (see
+    services.asr.chunking), and with ASR batching on the chunks share batched
+    decoder calls with other running jobs.
+    """
+    if asr is not None and asr.model == VOSK:
+        return get_vosk_engine().transcribe(
+            audio if isinstance(audio, np.ndarray) else str(audio), on_segment=on_segment
+        )
+
+    transcribe = get_asr_transcriber(asr)
+    chunk_workers = getattr(settings, "ASR_CHUNK_WORKERS", 1)
+    if isinstance(audio, np.ndarray) and chunk_workers > 1:
+        from services.asr.chunking import transcribe_chunked
+
+        transcript = transcribe_chunked(
+            transcribe,
+            audio,
+            max_workers=chunk_workers,
+            chunk_sec=getattr(settings, "ASR_CHUNK_SECONDS", 120.0),
+            overlap_sec=getattr(settings, "ASR_CHUNK_OVERLAP_SECONDS", 2.0),
+            sample_rate=SAMPLE_RATE,
+            on_segment=on_segment,
+        )
+    else:
+        transcript = transcribe(
+            audio if isinstance(audio, np.ndarray) else str(audio), on_segment=on_segment
+        )
+    return transcript
+
+
+def transcribe_audio(
+    audio: np.ndarray | Path,
+    model_path: Path,
+    transcript_out: Path,
+    on_segment: Optional[Callable[[Dict[str, Any]], None]] = None,
+    asr: Optional[AsrChoice] = None,
+) -> dict:
+    """
+    Run Whisper transcription and persist the transcript JSON.
+    `audio` is either a decode_pcm() buffer or a path to a normalized WAV;
+    `on_segment` receives segments in timeline order as they are decoded;
+    `asr` picks the Whisper model and beam size (see choose_asr()).
+    `model_path` is the Vosk model directory and is not used by Whisper.
+    With settings.INFERENCE_ADDRESS set, in-memory audio is transcribed by the
+    inference server; otherwise run_asr() does it here.
+    """
+    client = inference_client()
+    if client is not None and isinstance(audio, np.ndarray):
+        transcript = client.transcribe(audio, on_segment=on_segment, asr=asr)
+    else:
+        transcript = run_asr(audio, on_segment=on_segment, asr=asr)
 
     transcript_out.parent.mkdir(parents=True, exist_ok=True)
     transcript_out.write_text(json.dumps(transcript, indent=2))
     return transcript
 
 # ---------------------------------------------------------------------
-# Orchestration
+# Labeling
 # ---------------------------------------------------------------------
-def analyze_upload(
-    upload_path: Path, model_path: Path | None = None, use_mock: bool = False
-) -> Dict[str, Any]:
+def segment_text_and_times(seg: Dict[str, Any]) -> tuple:
+    """(text, start, end) for a Whisper or Vosk segment."""
+    txt = (seg.get("text") or "").strip()
+    # Prefer Whisper segment times
+    start = seg.get("start")
+    end   = seg.get("end")
+
+    # Fallback to Vosk word times if present (keeps code engine-agnostic)
+    if (start is None or end is None):
+        res = seg.get("result") or []
+        if res:
+            start = res[0].get("start", start)
+            end   = res[-1].get("end", end)
+    return txt, start, end
+
+
+def classify_texts(texts: List[str]) -> Tuple[List[str], str]:
     """
-    Orchestrate: normalize → (mock or real ASR) → return transcript dict.
+    (labels, label model version) for texts, from the inference server when
+    one is configured.
     """
-    # Step 1: Normalize
-    norm_path = NORMALIZED_DIR / (upload_path.stem + ".wav")
-    convert_file(upload_path, norm_path)
+    client = inference_client()
+    if client is not None:
+        return client.classify(texts)
+    return classify_local(texts)
 
-    # Step 2: Transcribe
-    transcript_path = TRANSCRIPTS_DIR / (upload_path.stem + ".json")
-    if use_mock:
-        transcript = mock_vosk(norm_path)
-        transcript_path.parent.mkdir(parents=True, exist_ok=True)
-        transcript_path.write_text(json.dumps(transcript, indent=2))
-    else:
-        transcript = transcribe_audio(norm_path, model_path, transcript_path)
 
+_label_batcher = None
+_label_batcher_lock = threading.Lock()
 
-    # Step 3: formats json data into sentences: [sentence, start time, end time]
-    n = len(transcript.get("segments", []))
-    timestamps, texts = [], []
 
-    for seg in transcript.get("segments", []):
-        txt = (seg.get("text") or "").strip()
-        # Prefer Whisper segment times
-        start = seg.get("start")
-        end   = seg.get("end")
+def label_thresholds() -> Thresholds:
+    """Label decision thresholds from settings (see services.label.model.ensemble)."""
+    return Thresholds(
+        profanity=getattr(settings, "LABEL_PROFANITY_THRESHOLD", 0.5),
+        classes=tuple(sorted(getattr(settings, "LABEL_CLASS_THRESHOLDS", {}).items())),
+    )
+
+
+def _label_uncoalesced(texts: List[str]) -> Tuple[List[str], str]:
+    from services.label.cache import label_cache
+
+    label_cache.resize(getattr(settings, "LABEL_CACHE_SIZE", 10000))
+    return label_texts(texts, ARTIFACTS, label_thresholds())
+
+
+def classify_local(texts: List[str]) -> Tuple[List[str], str]:
+    """
+    (labels, label model version) for texts, labeled in this process through
+    the size-limited label cache. With
+    settings.LABEL_BATCH_WAIT_MS > 0, calls from concurrent jobs are first
+    coalesced by a shared LabelBatcher into one classifier call.
+    """
+    global _label_batcher
+    wait_ms = getattr(settings, "LABEL_BATCH_WAIT_MS", 0)
+    if wait_ms <= 0:
+        return _label_uncoalesced(texts)
 
-        # Fallback to Vosk word times if present (keeps code engine-agnostic)
-        if (start is None or end is None):
-            res = seg.get("result") or []
-            if res:
-                start = res[0].get("start", start)
-                end   = res[-1].get("end", end)
+    with _label_batcher_lock:
+        if _label_batcher is None:
+            from services.label.batching import LabelBatcher
 
+            _label_batcher = LabelBatcher(_label_uncoalesced, max_wait_ms=wait_ms)
+    return _label_batcher.classify(texts)
+
+
+def label_segments(segments: List[Dict[str, Any]]) -> Tuple[List[list], str]:
+    """
+    Classify transcript segments into [label, text, start, end] rows; also
+    returns the label model version used.
+    """
+    timestamps, texts = [], []
+    for seg in segments:
+        txt, start, end = segment_text_and_times(seg)
         texts.append(txt)
         timestamps.append([start, end])
+    labels, version = classify_texts(texts)
+    rows = [
+        [label, text, start, end]
+        for label, text, (start, end) in zip(labels, texts, timestamps)
+    ]
+    return rows, version
+
+
+ProgressCB = Optional[Callable[[Dict[str, Any]], None]]
+
+
+class LiveLabels:
+    """
+    Labels segments as the ASR yields them and hands the running result to
+    `callback` every `every_segments` segments or `every_seconds` seconds,
+    whichever comes first, so long jobs show flags while still decoding.
+
+    The callback receives UploadJob field values:
+    {labels, full_text, progress, duration_sec}.
+
+    If a new label model version is published while the job runs, finish()
+    relabels all rows with it, so the result comes from a single `version`.
+    """
+
+    def __init__(
+        self,
+        duration_sec: float,
+        callback: Callable[[Dict[str, Any]], None],
+        every_segments: int = 20,
+        every_seconds: float = 2.0,
+    ):
+        self.duration_sec = duration_sec
+        self.callback = callback
+        self.every_segments = every_segments
+        self.every_seconds = every_seconds
+        self.rows: List[list] = []
+        self.version: Optional[str] = None
+        self._mixed = False
+        self.segments = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+        self._last_end = 0.0
+
+    def add(self, seg: Dict[str, Any]) -> None:
+        self._pending.append(seg)
+        self.segments += 1
+        end = segment_text_and_times(seg)[2]
+        if end is not None:
+            self._last_end = max(self._last_end, float(end))
+        if (
+            len(self._pending) >= self.every_segments
+            or time.monotonic() - self._last_flush >= self.every_seconds
+        ):
+            self.flush()
+
+    @property
+    def progress(self) -> float:
+        if self.duration_sec <= 0:
+            return 0.0
+        # 1.0 is reserved for the finished job.
+        return round(min(0.99, self._last_end / self.duration_sec), 3)
+
+    def _label_pending(self) -> None:
+        if not self._pending:
+            return
+        rows, version = label_segments(self._pending)
+        self._mixed = self._mixed or (self.version is not None and version != self.version)
+        self.version = version
+        self.rows.extend(rows)
+        self._pending = []
+
+    def finish(self) -> List[list]:
+        """Label whatever is still buffered and return all rows (no callback)."""
+        self._label_pending()
+        if self._mixed or self.version is None:
+            labels, self.version = classify_texts([r[1] for r in self.rows])
+            self.rows = [[label, *r[1:]] for label, r in zip(labels, self.rows)]
+            self._mixed = False
+        return self.rows
+
+    def flush(self) -> None:
+        self._label_pending()
+        self._last_flush = time.monotonic()
+        self.callback({
+            "labels": self.rows,
+            "full_text": " ".join(r[1] for r in self.rows),
+            "progress": self.progress,
+            "duration_sec": round(self.duration_sec, 3),
+        })
+
 
-    from services.label.model.predictor import TextPredictor
-    TextPredictor.load(ARTIFACTS)
+# ---------------------------------------------------------------------
+# Orchestration
+# ---------------------------------------------------------------------
+def analyze_upload(
+    upload_path: Path,
+    model_path: Path | None = None,
+    use_mock: bool = False,
+    on_progress: ProgressCB = None,
+    queued: int = 0,
+    preview: bool = False,
+) -> Dict[str, Any]:
+    """
+    Orchestrate: normalize → (mock or real ASR) → return transcript dict.
+
+    Audio is decoded straight from ffmpeg into memory; the normalized WAV is
+    only written to media/normalized/ when settings.KEEP_NORMALIZED_AUDIO is on.
+    With `on_progress`, segments are labeled while the ASR is still running and
+    the partial result is reported in batches (see LiveLabels).
+    `queued` is the number of jobs waiting behind this one; with model routing
+    it pushes long recordings towards smaller Whisper models (see choose_asr()).
+    With `preview`, long recordings are transcribed with the quick preview
+    model instead (see preview_asr()) and the result's `labels_pass` is
+    PREVIEW; the caller then runs a refinement pass with `preview=False`.
+    """
+    # Step 1: Normalize (in memory)
+    audio = decode_pcm(upload_path)
+    norm_path = None
+    if getattr(settings, "KEEP_NORMALIZED_AUDIO", False):
+        norm_path = write_wav(audio, NORMALIZED_DIR / (upload_path.stem + ".wav"))
 
-    labels = TextPredictor.predict(texts)
-    result = []
-    for i in range(n):
-        if labels[i] == "Skip" and predict([texts[i]])[0] >= 0.9:
-            result.append(["Bad Language", texts[i], timestamps[i][0], timestamps[i][1]])
-        else: 
-            result.append([labels[i], texts[i], timestamps[i][0], timestamps[i][1]])
+    live = None
+    if on_progress:
+        live = LiveLabels(audio_duration_seconds(audio), on_progress)
+        live.flush()  # publish duration before the first segment
 
+    # Step 2: Transcribe
+    transcript_path = TRANSCRIPTS_DIR / (upload_path.stem + ".json")
+    labels_pass = FINAL
+    if use_mock:
+        asr_model = "mock-vosk"
+        transcript = mock_vosk(audio)
+        transcript_path.parent.mkdir(parents=True, exist_ok=True)
+        transcript_path.write_text(json.dumps(transcript, indent=2))
+    else:
+        duration = audio_duration_seconds(audio)
+        asr = choose_asr(duration, queued)
+        quick = preview_asr(duration, asr) if preview else None
+        if quick is not None:
+            asr, labels_pass = quick, PREVIEW
+        asr_model = str(asr)
+        started = time.monotonic()
+        transcript = transcribe_audio(
+            audio, model_path, transcript_path, on_segment=live.add if live else None, asr=asr
+        )
+        router = asr_router()
+        if router and asr in router.tiers:
+            router.observe(asr, duration, time.monotonic() - started)
+    del audio
+
+    # Step 3: label sentences as [label, text, start time, end time]
+    segments = transcript.get("segments", [])
+    if live and live.segments == len(segments):
+        result, label_version = live.finish(), live.version
+    else:
+        result, label_version = label_segments(segments)
 
-    full_text = " ".join(texts)
+    full_text = " ".join(row[1] for row in result)
 
     return {
         "upload_path": str(upload_path),
-        "normalized_path": str(norm_path),
+        "normalized_path": str(norm_path) if norm_path else None,
         "transcript_path": str(transcript_path),
         "transcript": transcript,
         # NEW:
         "full_text": full_text,
         "labels": result,  # list of [label, text, start, end]
+        "asr_model": asr_model,
+        "labels_pass": labels_pass,
+        "label_model_version": label_version,
     }
@@ -1,10 +1,17 @@
 // frontend/src/components/JobsTable.tsx
-import { useEffect, useMemo, useRef } from 'react'
-import type { JobListItem } from '../lib/types'
+import { useEffect, useMemo, useRef, useState } from 'react'
+import type { JobListItem, JobStatusItem } from '../lib/types'
 import { fmtBytes, pretty, copyToClipboard } from '../lib/utils'
-import { getJob, getJobData, deleteJob } from '../lib/api'
+import { getJobStatuses, getJobData, deleteJob, openJobEvents } from '../lib/api'
 import { cache } from '../lib/cache'
 
+// Finished with preview labels, and a refinement pass is still to come.
+const refining = (j: Pick<JobListItem, 'labels_pass' | 'refine_status'>) =>
+  j.labels_pass === 'preview' && (j.refine_status === 'PENDING' || j.refine_status === 'RUNNING')
+
+// Least time between two status requests (also the retry delay after an error).
+const POLL_MS = 2000
+
 export default function JobsTable({
   jobs,
   onView,
@@ -18,40 +25,89 @@ export default function JobsTable({
   refreshRow: (id: string, patch: Partial<JobListItem>) => void
   onRemove: (id: string) => void
 }) {
-  const polling = useRef<Map<string, number>>(new Map())
+  // Jobs whose row can still change: queued, running, or awaiting refinement.
+  const activeIds = useMemo(
+    () => jobs.filter(j => (j.status !== 'SUCCESS' && j.status !== 'FAILED') || refining(j)).map(j => j.id).sort().join(','),
+    [jobs],
+  )
+
+  // The parent passes new callback instances on every render; read them through
+  // a ref so only a change in the active set restarts the updates.
+  const handlers = useRef({ onError, refreshRow, onRemove })
+  handlers.current = { onError, refreshRow, onRemove }
+  const current = useRef(jobs)
+  current.current = jobs
+
+  // Server-sent events while the server supports them, else long-polling.
+  const [streaming, setStreaming] = useState(typeof EventSource !== 'undefined')
+
+  const apply = (s: JobStatusItem) => {
+    const prev = current.current.find(j => j.id === s.id)
+    if (!prev) return
+    const { onError, refreshRow } = handlers.current
+    if (s.src_size) cache.setSize(s.id, s.src_size)
+    refreshRow(s.id, {
+      status: s.status, progress: s.progress, error: s.error,
+      labels_pass: s.labels_pass, refine_status: s.refine_status,
+      ...(s.src_size ? { src_size: s.src_size } : {}),
+    })
+    if (s.status === 'FAILED' && prev.status !== 'FAILED' && s.error) onError(s.error)
+  }
+
+  // One stream for all of the session's jobs, open while any of them can change.
+  const anyActive = activeIds !== ''
+  useEffect(() => {
+    if (!streaming || !anyActive) return
+    return openJobEvents(apply, () => setStreaming(false))
+  }, [streaming, anyActive])
 
   useEffect(() => {
-    const start = (id: string) => {
-      if (polling.current.has(id)) return
-      const iv = window.setInterval(async () => {
+    if (streaming || !activeIds) return
+    const ids = activeIds.split(',')
+    const ctrl = new AbortController()
+    let etag: string | null = null
+
+    // One long-polling request for all active jobs; the server answers as soon
+    // as any of them changes (or 304 after `wait` seconds). Outside ASGI it
+    // answers at once, so requests are spaced at least POLL_MS apart.
+    const loop = async () => {
+      while (!ctrl.signal.aborted) {
+        const started = Date.now()
         try {
-          const data = await getJob(id)
-          const size = data.src_size ?? data.wav_size ?? null
-          if (size) cache.setSize(id, size)
-          if (data.status === 'SUCCESS' || data.status === 'FAILED') {
-            refreshRow(id, { status: data.status as any, error: data.error ?? null, src_size: data.src_size ?? null })
-            clearInterval(iv); polling.current.delete(id)
-            if (data.error) onError(data.error)
-          } else {
-            refreshRow(id, { status: data.status as any })
+          const res = await getJobStatuses(ids, { etag, wait: 20, signal: ctrl.signal })
+          if (res) {
+            etag = res.etag
+            const seen = new Set(res.jobs.map(s => s.id))
+            ids.filter(id => !seen.has(id)).forEach(handlers.current.onRemove) // deleted elsewhere
+            res.jobs.forEach(apply)
           }
-        } catch {/* ignore */}
-      }, 1200)
-      polling.current.set(id, iv)
+        } catch {
+          if (ctrl.signal.aborted) return
+        }
+        const left = POLL_MS - (Date.now() - started)
+        if (left > 0) await new Promise(r => setTimeout(r, left))
+      }
     }
-    jobs.forEach(j => {
-      if (j.status !== 'SUCCESS' && j.status !== 'FAILED') start(j.id)
-    })
-    return () => { polling.current.forEach(clearInterval); polling.current.clear() }
-  }, [jobs, onError, refreshRow])
+    loop()
+    return () => ctrl.abort()
+  }, [streaming, activeIds])
 
   const rows = useMemo(() => {
     return jobs.map(j => {
       const size = j.src_size ?? cache.getSize(j.id)
       const statusBadge =
+        j.status === 'SUCCESS' && refining(j) ? (
+          <span className="badge rounded-pill bg-info" title="Quick first pass; refining in the background">
+            PREVIEW
+          </span>
+        ) :
         j.status === 'SUCCESS' ? <span className="badge rounded-pill bg-success">SUCCESS</span> :
         j.status === 'FAILED'  ? <span className="badge rounded-pill bg-danger">FAILED</span> :
-        j.status === 'RUNNING' ? <span className="badge rounded-pill bg-secondary">RUNNING</span> :
+        j.status === 'RUNNING' ? (
+          <span className="badge rounded-pill bg-secondary">
+            RUNNING{j.progress ? ` ${Math.round(j.progress * 100)}%` : ''}
+          </span>
+        ) :
         <span className="badge rounded-pill text-bg-secondary">{j.status ?? 'PENDING'}</span>
 
       const actions =
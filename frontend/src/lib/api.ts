@@ -1,11 +1,11 @@
 import { getCSRF } from './csrf'
-import type { JobListItem, BulkCreateResponse, JobDetail, JobDataPayload } from './types'
+import type { JobListItem, BulkCreateResponse, JobDetail, JobDataPayload, JobStatusItem } from './types'
 
 export async function listJobs(limit = 50): Promise<JobListItem[]> {
   const r = await fetch(`/api/jobs/?limit=${limit}`, { credentials: 'same-origin' })
   if (!r.ok) throw new Error(`HTTP ${r.status}`)
   const data = await r.json()
-  // DRF pagination format
+  // DRF cursor pagination: newest `limit` jobs, no total count
   if (Array.isArray(data.results)) return data.results
   // Legacy fallback (if any)
   if (Array.isArray(data.jobs)) return data.jobs
@@ -33,6 +33,46 @@ export async function getJob(id: string): Promise<JobDetail> {
   return r.json()
 }
 
+/**
+ * Status of several jobs in one request. Pass the previous `etag` to long-poll:
+ * the server (ASGI only) holds the request up to `wait` seconds, and it
+ * resolves to null if nothing changed (304).
+ */
+export async function getJobStatuses(
+  ids: string[],
+  opts: { etag?: string | null; wait?: number; signal?: AbortSignal } = {},
+): Promise<{ jobs: JobStatusItem[]; etag: string | null } | null> {
+  const qs = new URLSearchParams({ ids: ids.join(',') })
+  if (opts.wait) qs.set('wait', String(opts.wait))
+  const r = await fetch(`/api/jobs/status/?${qs}`, {
+    credentials: 'same-origin',
+    headers: opts.etag ? { 'If-None-Match': opts.etag } : {},
+    cache: 'no-store',
+    signal: opts.signal,
+  })
+  if (r.status === 304) return null
+  if (!r.ok) throw new Error(`HTTP ${r.status}`)
+  const data = await r.json()
+  return { jobs: Array.isArray(data.jobs) ? data.jobs : [], etag: r.headers.get('ETag') }
+}
+
+/**
+ * Stream status changes of all the session's jobs (server-sent events). Starts
+ * with a snapshot of the latest jobs. `onUnavailable` fires when the server
+ * can't stream (501 outside ASGI); fall back to getJobStatuses then.
+ * Returns a function that closes the stream.
+ */
+export function openJobEvents(
+  onJob: (s: JobStatusItem) => void,
+  onUnavailable: () => void,
+): () => void {
+  const es = new EventSource('/api/jobs/events/', { withCredentials: true })
+  es.addEventListener('job', e => onJob(JSON.parse((e as MessageEvent).data)))
+  // EventSource retries dropped connections itself; CLOSED means it gave up.
+  es.onerror = () => { if (es.readyState === EventSource.CLOSED) onUnavailable() }
+  return () => es.close()
+}
+
 export async function getJobData(id: string): Promise<JobDataPayload> {
   const r = await fetch(`/api/jobs/${id}/data/`, { credentials: 'same-origin' })
   if (!r.ok) throw new Error(`HTTP ${r.status}`)
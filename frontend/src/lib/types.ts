@@ -1,18 +1,33 @@
 export type JobStatus = 'PENDING' | 'RUNNING' | 'SUCCESS' | 'FAILED'
+export type LabelsPass = 'preview' | 'final'
 
 export interface JobListItem {
   id: string
   filename: string | null
   status: JobStatus
+  progress?: number
+  labels_pass?: LabelsPass | null
+  refine_status?: JobStatus | null
   error: string | null
   src_size?: number | null
   wav_size?: number | null
   duration_sec?: number | null
 }
 
+export interface JobStatusItem {
+  id: string
+  status: JobStatus
+  progress: number
+  error: string | null
+  labels_pass: LabelsPass | null
+  refine_status: JobStatus | null
+  src_size: number | null
+}
+
 export interface JobDetail {
   id: string
   status: JobStatus
+  progress: number
   error: string | null
   created_at: string
   started_at: string | null
@@ -24,6 +39,10 @@ export interface JobDetail {
   duration_sec: number | null
   full_text: string | null
   labels: any[] | null
+  label_model_version?: string | null
+  asr_model?: string | null
+  labels_pass?: LabelsPass | null
+  refine_status?: JobStatus | null
   original_name: string | null
   stored_name: string | null
 }
@@ -40,4 +59,8 @@ export interface JobDataPayload {
   filename: string
   transcript_text: string
   flags: Array<{ label: string; text: string; start_sec: number; end_sec: number }>
+  partial?: boolean
+  progress?: number
+  preview?: boolean
+  refine_status?: JobStatus | null
 }